@@ -0,0 +1,206 @@
+# batch.py
+import argparse
+import contextlib
+import glob
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Tuple, Optional
+
+from main import (
+    TEMPLATE_PATH,
+    build_presentation,
+    default_slides,
+    resolve_theme,
+)
+from config_loader import load_configuration
+from render_cache import RenderCache, DEFAULT_MAX_BYTES
+from image_store import ImageStore, LINK_MODES
+from template_engine import load_template
+from metrics import BuildMetrics
+from theme_bundle import DEFAULT_THEME, discover_themes, compile_theme_bundle
+
+CONFIG_EXTENSIONS = ('.json', '.yaml', '.yml')
+
+
+def find_configs(inputs: List[str]) -> List[str]:
+    """
+    Expands directories and glob patterns into a sorted list of configuration files.
+
+    Args:
+        inputs (List[str]): Directories, glob patterns or file paths.
+
+    Returns:
+        List[str]: Paths of the JSON/YAML configuration files found.
+    """
+    configs = set()
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            for name in os.listdir(pattern):
+                if name.endswith(CONFIG_EXTENSIONS):
+                    configs.add(os.path.join(pattern, name))
+        else:
+            configs.update(path for path in glob.glob(pattern) if path.endswith(CONFIG_EXTENSIONS))
+    return sorted(configs)
+
+
+def output_names(configs: List[str]) -> Dict[str, str]:
+    """
+    Names the output folder of each configuration after its path below the
+    deepest folder shared by all of them, without the extension, so that
+    "a/deck.json" and "b/deck.yaml" get "a/deck" and "b/deck".
+
+    Args:
+        configs (List[str]): Paths of the configuration files.
+
+    Returns:
+        Dict[str, str]: Output folder name (relative to the output root) by config path.
+
+    Raises:
+        ValueError: If two configurations would still share a folder, e.g. "deck.json" and "deck.yml".
+    """
+    paths = {config: os.path.abspath(config) for config in configs}
+    root = os.path.commonpath([os.path.dirname(path) for path in paths.values()])
+    names = {config: os.path.splitext(os.path.relpath(path, root))[0] for config, path in paths.items()}
+    owners: Dict[str, List[str]] = {}
+    for config, name in names.items():
+        owners.setdefault(os.path.normcase(name), []).append(config)
+    clashes = [f"{' and '.join(group)} would share the output folder '{names[group[0]]}'"
+               for group in owners.values() if len(group) > 1]
+    if clashes:
+        raise ValueError("; ".join(clashes))
+    return names
+
+
+def init_worker(template_path: str) -> None:
+    """Loads the shared template once per worker process (a no-op when it was inherited via fork)."""
+    load_template(template_path)
+    with contextlib.suppress(ImportError):
+        import yaml  # noqa: F401  (pay the import once per worker, not once per deck)
+
+
+def build_one(
+    config_path: str,
+    output_folder: str,
+    images_dir: Optional[str],
+    theme: str,
+    use_cache: bool,
+    verbose: bool,
+    image_store_dir: Optional[str] = None,
+    link_mode: str = 'hardlink',
+    theme_bundle: Optional[str] = None
+) -> Tuple[str, float, int, Optional[str]]:
+    """
+    Builds a single presentation inside a worker process.
+
+    The output folder is named after the configuration file (see
+    ``output_names``) so that decks sharing a title do not overwrite each
+    other. ``theme_bundle`` is the theme stylesheet compiled once for the
+    whole batch.
+
+    Returns:
+        Tuple[str, float, int, Optional[str]]: Config path, build time in seconds,
+        number of slides and the error message (None on success).
+    """
+    start = time.perf_counter()
+    output = None if verbose else io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output) if output else contextlib.nullcontext():
+            config = load_configuration(config_path)
+            title = config.get("title", "Untitled Presentation")
+            slides = config["slides"] if "slides" in config else default_slides()
+            cache = RenderCache(os.path.join(output_folder, ".render_cache"), DEFAULT_MAX_BYTES) if use_cache else None
+            image_store = ImageStore(image_store_dir, link_mode)
+            # Per-file lines are only produced for --verbose, which then also shows the summary
+            metrics = BuildMetrics(verbose)
+            build_presentation(title, slides, output_folder, images_dir, theme, cache=cache,
+                               image_store=image_store, data_dir=os.path.dirname(os.path.abspath(config_path)),
+                               metrics=metrics, theme_bundle=theme_bundle)
+            if verbose:
+                print(metrics.summary(f"Build summary of {config_path}:"))
+            if cache is not None:
+                cache.save()
+    except Exception as e:
+        return config_path, time.perf_counter() - start, 0, f"{type(e).__name__}: {e}"
+    except SystemExit:
+        # build steps exit(1) on missing static files; report instead of killing the worker
+        return config_path, time.perf_counter() - start, 0, (output.getvalue().strip() if output else "") or "build aborted"
+    return config_path, time.perf_counter() - start, len(slides), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build many HTML presentations in parallel.")
+    parser.add_argument('inputs', nargs='+',
+                        help='Directories, glob patterns or files of presentation configurations (JSON or YAML).')
+    parser.add_argument('--output_root', type=str, default='output',
+                        help='Folder that receives one sub-folder per deck, named after its config file '
+                             '(and the folders below the inputs\' common folder).')
+    parser.add_argument('--images_dir', type=str, default=None,
+                        help='Path to the images directory shared by all decks.')
+    parser.add_argument('--theme', type=str, default=DEFAULT_THEME,
+                        choices=list(discover_themes()),
+                        help='Theme of the presentations.')
+    parser.add_argument('--image_store', type=str, default=None,
+                        help='Content-addressed image store shared by all decks; images are linked from it.')
+    parser.add_argument('--link_mode', type=str, default='hardlink', choices=LINK_MODES,
+                        help='How images are placed from the store: "hardlink" (default), "reflink" or "copy".')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: number of CPUs).')
+    parser.add_argument('--no_cache', action='store_true',
+                        help='Disable the per-slide render cache.')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Show the output of every individual build.')
+    args = parser.parse_args()
+
+    configs = find_configs(args.inputs)
+    if not configs:
+        print("No configuration files found.")
+        exit(1)
+    try:
+        names = output_names(configs)
+    except ValueError as e:
+        print(f"Rename the configuration files: {e}.")
+        exit(1)
+
+    # Load the template before forking so that workers share it
+    load_template(TEMPLATE_PATH)
+    # Every deck gets the same theme bundle, so it is compiled once here
+    theme = resolve_theme(args.theme)
+    theme_bundle = compile_theme_bundle(discover_themes(), theme)
+
+    print(f"Building {len(configs)} presentation(s) with {args.jobs} worker(s)...")
+    start = time.perf_counter()
+    failures = []
+    build_times = []
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=init_worker, initargs=(TEMPLATE_PATH,)) as executor:
+        futures = [
+            executor.submit(build_one, config_path, os.path.join(args.output_root, names[config_path]),
+                            args.images_dir, theme, not args.no_cache, args.verbose,
+                            args.image_store, args.link_mode, theme_bundle)
+            for config_path in configs
+        ]
+        for done, future in enumerate(as_completed(futures), start=1):
+            config_path, seconds, slide_count, error = future.result()
+            if error:
+                failures.append((config_path, error))
+                print(f"[{done}/{len(configs)}] FAILED {config_path} ({seconds:.2f}s): {error}")
+            else:
+                build_times.append(seconds)
+                print(f"[{done}/{len(configs)}] {config_path}: {slide_count} slides in {seconds:.2f}s")
+
+    elapsed = time.perf_counter() - start
+    print(f"\nBuilt {len(build_times)}/{len(configs)} presentation(s) in {elapsed:.2f}s "
+          f"({len(configs) / elapsed:.1f} decks/s).")
+    if build_times:
+        print(f"Per deck: min {min(build_times):.2f}s, mean {sum(build_times) / len(build_times):.2f}s, "
+              f"max {max(build_times):.2f}s.")
+    if failures:
+        print(f"{len(failures)} failure(s):")
+        for config_path, error in failures:
+            print(f"  {config_path}: {error}")
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+# benchmarks/bench_build.py
+# Build benchmark on synthetic decks: times every phase of a build, records
+# peak memory, writes the results as JSON and compares them with a baseline.
+#
+#   python benchmarks/bench_build.py --preset quick --output before.json
+#   python benchmarks/bench_build.py --preset quick --baseline before.json --threshold 0.15
+#
+# Runs offline: decks and images are generated in a temporary folder.
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zlib
+from typing import List, Dict, Any, Callable, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Static files, templates and the placeholder image are resolved relative to the repository
+os.chdir(REPO_ROOT)
+sys.path.insert(0, REPO_ROOT)
+
+from main import (  # noqa: E402
+    TEMPLATE_PATH,
+    generate_html_presentation,
+    copy_static_files,
+    copy_theme_files,
+)
+from helper import render_slides, copy_project_images  # noqa: E402
+from config_loader import load_configuration  # noqa: E402
+from validation import validate_slides  # noqa: E402
+from image_store import ImageStore  # noqa: E402
+
+RESULTS_VERSION = 1
+
+PHASES = ("load", "validate", "render", "assets", "write")
+
+# Deck dimensions per preset: every combination is one benchmark case
+PRESETS = {
+    "quick": {"slides": [10, 1000], "depth": [1, 5], "charts": [10], "images": [10]},
+    "standard": {"slides": [10, 1000, 10000], "depth": [1, 5, 10], "charts": [0, 100], "images": [0, 100]},
+    "full": {"slides": [10, 1000, 10000, 100000], "depth": [1, 5, 10], "charts": [0, 1000], "images": [0, 1000]},
+}
+
+PARAGRAPH = "Revenue grew in every region, driven by renewals and the new enterprise tier. " * 3
+
+CHART = {
+    "type": "bar",
+    "data": {
+        "labels": ["Q1", "Q2", "Q3", "Q4"],
+        "datasets": [{"label": "Sales", "data": [50, 60, 70, 80]}],
+    },
+}
+
+
+def write_png(path: str, width: int, height: int, seed: int) -> None:
+    """Writes a grayscale PNG of random (incompressible) pixels, so file sizes are realistic."""
+    rng = random.Random(seed)
+    raw = b"".join(b"\x00" + rng.randbytes(width) for _ in range(height))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw, 1)) + chunk(b"IEND", b""))
+
+
+def synthetic_fold(depth: int, chart: bool) -> Dict[str, Any]:
+    """A chain of ``depth`` nested folds; the outermost one holds the chart, if any."""
+    fold: Dict[str, Any] = {"title": f"Level {depth}", "content": [PARAGRAPH, "<ul><li>Detail</li></ul>"]}
+    for level in range(depth - 1, 0, -1):
+        fold = {"title": f"Level {level}", "content": [PARAGRAPH], "folds": [fold]}
+    if chart:
+        fold["chart"] = json.loads(json.dumps(CHART))
+    return fold
+
+
+def synthetic_deck(slides: int, depth: int, charts: int, images: int) -> Dict[str, Any]:
+    """
+    Generates a configuration with the given number of slides, fold nesting depth,
+    charts (spread evenly over the deck) and distinct images (reused round-robin).
+    """
+    chart_every = max(1, slides // charts) if charts else 0
+    deck = []
+    for i in range(slides):
+        slide: Dict[str, Any] = {
+            "title": f"Slide {i}",
+            "content": [f"<h2>Slide {i}</h2>", PARAGRAPH],
+            "folds": [
+                synthetic_fold(depth, chart=bool(chart_every) and i % chart_every == 0 and i // chart_every < charts),
+                {"title": "Notes", "content": [PARAGRAPH]},
+            ],
+        }
+        if i % 5 == 4:
+            slide["content"].append({"columns": {
+                "number": 2,
+                "size": ["60%", "40%"],
+                "content": [PARAGRAPH, {"folds": [{"title": "Aside", "content": [PARAGRAPH]}]}],
+            }})
+        if images:
+            slide["image"] = f"image-{i % images}.png"
+        deck.append(slide)
+    return {"title": "Benchmark Deck", "slides": deck}
+
+
+def run_phases(config_path: str, images_dir: str, work_dir: str) -> Dict[str, Callable[[], None]]:
+    """Returns the build phases of one run, in order; they share the loaded configuration."""
+    state: Dict[str, Any] = {}
+    output_folder = os.path.join(work_dir, "output")
+
+    def load():
+        state["config"] = load_configuration(config_path, use_cache=False, verbose=False)
+
+    def validate():
+        issues = validate_slides(state["config"]["slides"])
+        if any(issue.severity == "error" for issue in issues):
+            raise RuntimeError(f"synthetic deck is invalid: {issues[0]}")
+
+    def render():
+        render_slides(state["config"]["slides"], io.StringIO())
+
+    def assets():
+        shutil.rmtree(output_folder, ignore_errors=True)
+        copy_project_images(state["config"]["slides"], images_dir, os.path.join(output_folder, "images"), store=ImageStore())
+        copy_static_files(output_folder)
+        state["theme"] = copy_theme_files(output_folder, "dark")
+
+    def write():
+        generate_html_presentation(state["config"]["title"], state["config"]["slides"], TEMPLATE_PATH,
+                                   output_folder, state["theme"])
+
+    return {"load": load, "validate": validate, "render": render, "assets": assets, "write": write}
+
+
+def measure_case(slides: int, depth: int, charts: int, images: int, repeat: int, memory: bool, image_kb: int) -> Dict[str, Any]:
+    """
+    Benchmarks one deck: the best time of ``repeat`` runs per phase and,
+    in a separate traced run, the peak memory allocated during each phase.
+    """
+    with tempfile.TemporaryDirectory(prefix="slides-bench-") as work_dir:
+        images_dir = os.path.join(work_dir, "images")
+        os.makedirs(images_dir)
+        side = max(1, int((image_kb * 1024) ** 0.5))
+        for k in range(images):
+            write_png(os.path.join(images_dir, f"image-{k}.png"), side, side, seed=k)
+
+        config_path = os.path.join(work_dir, "deck.json")
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump(synthetic_deck(slides, depth, charts, images), f)
+        deck_bytes = os.path.getsize(config_path)
+
+        times = {phase: float("inf") for phase in PHASES}
+        peaks: Dict[str, float] = {}
+        # Per-file progress lines are part of what a build costs, but not of the report
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            for _ in range(repeat):
+                for phase, run in run_phases(config_path, images_dir, work_dir).items():
+                    start = time.perf_counter()
+                    run()
+                    times[phase] = min(times[phase], (time.perf_counter() - start) * 1000)
+
+            if memory:
+                tracemalloc.start()
+                try:
+                    for phase, run in run_phases(config_path, images_dir, work_dir).items():
+                        tracemalloc.reset_peak()
+                        base = tracemalloc.get_traced_memory()[0]
+                        run()
+                        peaks[phase] = (tracemalloc.get_traced_memory()[1] - base) / 1e6
+                finally:
+                    tracemalloc.stop()
+
+    return {
+        "name": f"slides={slides} depth={depth} charts={charts} images={images}",
+        "params": {"slides": slides, "depth": depth, "charts": charts, "images": images, "image_kb": image_kb},
+        "deck_bytes": deck_bytes,
+        "ms": {phase: round(ms, 3) for phase, ms in times.items()},
+        "peak_mb": {phase: round(mb, 3) for phase, mb in peaks.items()},
+    }
+
+
+def environment() -> Dict[str, Any]:
+    commit = None
+    with contextlib.suppress(OSError, subprocess.SubprocessError):
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                                text=True, timeout=10).stdout.strip() or None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float, min_ms: float) -> List[str]:
+    """
+    Lists the regressions of ``results`` against ``baseline``.
+
+    A phase regresses when it is more than ``threshold`` (a fraction) slower
+    and at least ``min_ms`` slower, which keeps timer noise of tiny phases
+    out; peak memory regresses when it grows by more than ``threshold``
+    and at least 1 MB.
+    """
+    previous = {case["name"]: case for case in baseline.get("cases", [])}
+    regressions = []
+    for case in results["cases"]:
+        old = previous.get(case["name"])
+        if old is None:
+            continue
+        for phase, ms in case["ms"].items():
+            old_ms = old["ms"].get(phase)
+            if old_ms is not None and ms > old_ms * (1 + threshold) and ms - old_ms >= min_ms:
+                regressions.append(f"{case['name']}: {phase} {old_ms:.1f} -> {ms:.1f} ms (+{(ms / old_ms - 1) * 100:.0f}%)")
+        for phase, mb in case["peak_mb"].items():
+            old_mb = old.get("peak_mb", {}).get(phase)
+            if old_mb is not None and mb > old_mb * (1 + threshold) and mb - old_mb >= 1:
+                regressions.append(f"{case['name']}: {phase} peak {old_mb:.1f} -> {mb:.1f} MB")
+    return regressions
+
+
+def print_case(case: Dict[str, Any], baseline_case: Optional[Dict[str, Any]]) -> None:
+    print(f"{case['name']} ({case['deck_bytes'] / 1e6:.1f} MB config)")
+    for phase in PHASES:
+        line = f"  {phase:<10}{case['ms'][phase]:10.1f} ms"
+        if phase in case["peak_mb"]:
+            line += f"{case['peak_mb'][phase]:10.1f} MB peak"
+        if baseline_case and phase in baseline_case["ms"]:
+            old = baseline_case["ms"][phase]
+            line += f"   (baseline {old:.1f} ms, {(case['ms'][phase] / old - 1) * 100 if old else 0:+.0f}%)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark presentation builds on synthetic decks.")
+    parser.add_argument('--preset', type=str, default='quick', choices=sorted(PRESETS),
+                        help='Deck dimensions to benchmark (default "quick"); the options below override it.')
+    parser.add_argument('--slides', type=int, nargs='+', default=None, help='Slide counts, e.g. 10 1000 100000.')
+    parser.add_argument('--depth', type=int, nargs='+', default=None, help='Fold nesting depths (1 to 10).')
+    parser.add_argument('--charts', type=int, nargs='+', default=None, help='Number of charts per deck.')
+    parser.add_argument('--images', type=int, nargs='+', default=None, help='Number of distinct images per deck.')
+    parser.add_argument('--image_kb', type=int, default=64, help='Approximate size of each generated image (kB).')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case; the fastest run of each phase is kept.')
+    parser.add_argument('--no_memory', action='store_true', help='Skip the traced run that records peak memory.')
+    parser.add_argument('--output', type=str, default=None, help='Write the results to this JSON file.')
+    parser.add_argument('--baseline', type=str, default=None, help='Results of an earlier run to compare against.')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='Relative slowdown counted as a regression (default 0.15 = 15%%).')
+    parser.add_argument('--min_ms', type=float, default=5.0,
+                        help='Ignore slowdowns smaller than this many milliseconds (default 5).')
+    args = parser.parse_args()
+
+    dims = PRESETS[args.preset]
+    matrix = itertools.product(args.slides or dims["slides"], args.depth or dims["depth"],
+                               args.charts if args.charts is not None else dims["charts"],
+                               args.images if args.images is not None else dims["images"])
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    baseline_cases = {case["name"]: case for case in (baseline or {}).get("cases", [])}
+
+    results = {"version": RESULTS_VERSION, "environment": environment(), "cases": []}
+    for slides, depth, charts, images in matrix:
+        case = measure_case(slides, depth, charts, images, args.repeat, not args.no_memory, args.image_kb)
+        results["cases"].append(case)
+        print_case(case, baseline_cases.get(case["name"]))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold, args.min_ms)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline} "
+                  f"(commit {baseline.get('environment', {}).get('commit')}):")
+            for regression in regressions:
+                print(f"  {regression}")
+            exit(1)
+        print(f"No regressions against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# benchmarks/bench_is_html.py
+# Microbenchmark of content classification: the former per-call regex search,
+# the precompiled pattern behind a '<' prefilter, and explicit text/html markers.
+#
+#   python benchmarks/bench_is_html.py [--slides 5000] [--repeat 5]
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slide_model import is_html, parse_slides  # noqa: E402
+
+SENTENCE = "Quarterly revenue grew in every region, driven by renewals and the new enterprise tier. "
+
+
+def legacy_is_html(content: str) -> bool:
+    """The classification used before: a module-level re.search on every call."""
+    if type(content) is dict :
+        return False
+    return bool(re.search(r'<[^>]+>', content))
+
+
+def sample_strings() -> dict:
+    return {
+        "long text (2 kB)": SENTENCE * 24,
+        "short text": SENTENCE,
+        "text with '<'": "p < 0.05 for " + SENTENCE * 4,
+        "short html": "<p>" + SENTENCE + "</p>",
+        "long html, tag at end": SENTENCE * 24 + "<br>",
+    }
+
+
+def synthetic_deck(slides: int, marked: bool) -> list:
+    """Slides with long paragraphs, as plain strings or as explicit text/html items; two need the regex."""
+    paragraphs = [SENTENCE * 12, "p < 0.05 in " + SENTENCE * 8, SENTENCE * 12 + "<br>"]
+    if marked:
+        paragraphs = [{"text": paragraphs[0]}, {"text": paragraphs[1]}, {"html": paragraphs[2]}]
+    return [
+        {
+            "title": f"Slide {i}",
+            "content": list(paragraphs),
+            "folds": [{"title": "Details", "content": list(paragraphs)}],
+        }
+        for i in range(slides)
+    ]
+
+
+def best_of(statement, repeat: int, number: int) -> float:
+    """Best time per call in microseconds."""
+    return min(timeit.repeat(statement, repeat=repeat, number=number)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark markup detection of content strings.")
+    parser.add_argument('--slides', type=int, default=5000,
+                        help='Slides in the synthetic deck parsed by the end-to-end comparison.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Repetitions; the best run is reported.')
+    args = parser.parse_args()
+
+    print(f"{'string':<24}{'legacy us':>12}{'is_html us':>12}{'speed-up':>10}")
+    for name, value in sample_strings().items():
+        assert legacy_is_html(value) == is_html(value), name
+        legacy = best_of(lambda: legacy_is_html(value), args.repeat, 20000)
+        current = best_of(lambda: is_html(value), args.repeat, 20000)
+        print(f"{name:<24}{legacy:>12.3f}{current:>12.3f}{legacy / current:>9.1f}x")
+
+    detected = synthetic_deck(args.slides, marked=False)
+    marked = synthetic_deck(args.slides, marked=True)
+    detect_ms = best_of(lambda: parse_slides(detected), args.repeat, 1) / 1000
+    marked_ms = best_of(lambda: parse_slides(marked), args.repeat, 1) / 1000
+    strings = args.slides * 6
+    print(f"\nParsing {args.slides} slides ({strings} content strings, classified once each):")
+    print(f"  detected          {detect_ms:8.1f} ms")
+    print(f"  text/html markers {marked_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
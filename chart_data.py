@@ -0,0 +1,289 @@
+# chart_data.py
+import hashlib
+import json
+import os
+import sys
+from array import array
+from typing import List, Dict, Any, Iterator, Tuple
+
+# Default number of points kept per series: about two per horizontal pixel of a wide chart
+DEFAULT_MAX_POINTS = 2000
+
+DOWNSAMPLERS = ('lttb', 'minmax', 'none')
+
+# Keys of a chart spec that only drive the build and are not passed to the browser
+BUILD_KEYS = ('data-file', 'x', 'y', 'max-points', 'downsample')
+
+SIDECAR_FOLDER = "data"
+
+
+def iter_charts(node: Any) -> Iterator[Dict[str, Any]]:
+    """Yields every dictionary holding a "chart" entry anywhere inside a slide structure."""
+    if isinstance(node, dict):
+        if isinstance(node.get("chart"), dict):
+            yield node
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from iter_charts(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from iter_charts(item)
+
+
+def data_files(slides: List[Dict[str, Any]], data_source_dir: str) -> List[str]:
+    """Lists the chart data files referenced by the slides (before ``prepare_chart_data`` rewrites them)."""
+    return sorted({os.path.join(data_source_dir, holder["chart"]["data-file"])
+                   for holder in iter_charts(slides) if "data-file" in holder["chart"]})
+
+
+def _to_number(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        from datetime import datetime
+        # ISO dates and timestamps become milliseconds since the epoch
+        return datetime.fromisoformat(value).timestamp() * 1000
+
+
+def load_columns(path: str, names: List[str]) -> Dict[str, List[float]]:
+    """
+    Loads numeric columns from a CSV, NumPy (.npy/.npz) or Parquet file.
+
+    Args:
+        path (str): Path to the data file.
+        names (List[str]): Columns to load. For unstructured 2-D NumPy arrays,
+            columns are addressed by their index ("0", "1", ...).
+
+    Returns:
+        Dict[str, List[float]]: Column name to values.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.csv', '.tsv'):
+        import csv
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f, delimiter="\t" if ext == '.tsv' else ",")
+            missing = [name for name in names if name not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"Column(s) {', '.join(missing)} not found in '{path}'.")
+            columns: Dict[str, List[float]] = {name: [] for name in names}
+            for row in reader:
+                for name in names:
+                    columns[name].append(_to_number(row[name]))
+            return columns
+    if ext in ('.npy', '.npz'):
+        try:
+            import numpy as np
+        except ImportError:
+            raise ValueError(f"NumPy is required to read '{path}' (pip install numpy).")
+        data = np.load(path)
+        if ext == '.npz':
+            return {name: data[name].astype(float).tolist() for name in names}
+        if data.dtype.names:
+            return {name: data[name].astype(float).tolist() for name in names}
+        return {name: data[:, int(name)].astype(float).tolist() for name in names}
+    if ext == '.parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError(f"pyarrow is required to read '{path}' (pip install pyarrow).")
+        table = pq.read_table(path, columns=names)
+        return {name: [float(v) for v in table.column(name).to_pylist()] for name in names}
+    raise ValueError(f"Unsupported chart data file '{path}'. Use CSV, NPY/NPZ or Parquet.")
+
+
+def lttb_indices(xs: List[float], ys: List[float], threshold: int) -> List[int]:
+    """
+    Selects the indices kept by Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves the visual shape.
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    indices = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        # Average of the next bucket
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / count
+        avg_y = sum(ys[next_start:next_end]) / count
+
+        ax, ay = xs[a], ys[a]
+        best_area = -1.0
+        best = start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+        indices.append(best)
+        a = best
+    indices.append(n - 1)
+    return indices
+
+
+def minmax_indices(ys: List[float], threshold: int) -> List[int]:
+    """Selects the minimum and maximum of each of ``threshold // 2`` buckets, in order."""
+    n = len(ys)
+    buckets = max(1, threshold // 2)
+    if threshold >= n:
+        return list(range(n))
+    indices = []
+    bucket_size = n / buckets
+    for i in range(buckets):
+        start = int(i * bucket_size)
+        end = max(start + 1, int((i + 1) * bucket_size))
+        lo = min(range(start, end), key=ys.__getitem__)
+        hi = max(range(start, end), key=ys.__getitem__)
+        indices.extend(sorted({lo, hi}))
+    return indices
+
+
+def downsample(xs: List[float], series: Dict[str, List[float]], max_points: int, method: str) -> List[int]:
+    """Returns the sorted indices kept for all series (which share the x column)."""
+    if method == 'none' or len(xs) <= max_points:
+        return list(range(len(xs)))
+    keep = set()
+    for ys in series.values():
+        if method == 'lttb':
+            keep.update(lttb_indices(xs, ys, max_points))
+        else:
+            keep.update(minmax_indices(ys, max_points))
+    return sorted(keep)
+
+
+def _file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def write_sidecar(chart: Dict[str, Any], data_source_dir: str, output_folder: str) -> Dict[str, Any]:
+    """
+    Downsamples a chart's data file and writes it as a binary columnar sidecar.
+
+    The sidecar holds the x column as little-endian float64 followed by every
+    y column as float32; the browser maps them with typed arrays. The file name
+    is derived from the source content and the build parameters, so unchanged
+    data is not processed again.
+
+    Returns:
+        Dict[str, Any]: The sidecar description stored in the chart spec.
+    """
+    source = os.path.join(data_source_dir, chart["data-file"])
+    if not os.path.isfile(source):
+        raise ValueError(f"Chart data file '{chart['data-file']}' not found in '{data_source_dir}'.")
+    x_name = chart.get("x", "x")
+    y_names = chart.get("y", ["y"])
+    if isinstance(y_names, str):
+        y_names = [y_names]
+    max_points = int(chart.get("max-points", DEFAULT_MAX_POINTS))
+    method = chart.get("downsample", "lttb")
+    if method not in DOWNSAMPLERS:
+        raise ValueError(f"Unsupported downsampling '{method}'. Use one of: {', '.join(DOWNSAMPLERS)}.")
+
+    params = json.dumps([x_name, y_names, max_points, method])
+    digest = hashlib.sha256((_file_digest(source) + params).encode("utf-8")).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(source))[0]
+    name = f"{stem}-{digest}.bin"
+    folder = os.path.join(output_folder, SIDECAR_FOLDER)
+    path = os.path.join(folder, name)
+    meta_path = path + ".json"
+
+    if os.path.isfile(path) and os.path.isfile(meta_path):
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    columns = load_columns(source, [x_name, *y_names])
+    xs = columns[x_name]
+    series = {y: columns[y] for y in y_names}
+    keep = downsample(xs, series, max_points, method)
+
+    length = len(keep)
+    layout = [{"name": x_name, "dtype": "float64", "offset": 0}]
+    offset = length * 8
+    for y in y_names:
+        layout.append({"name": y, "dtype": "float32", "offset": offset})
+        offset += length * 4
+
+    os.makedirs(folder, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        for values, typecode in [(xs, 'd')] + [(series[y], 'f') for y in y_names]:
+            packed = array(typecode, (values[i] for i in keep))
+            if sys.byteorder == 'big':
+                packed.byteswap()
+            packed.tofile(f)
+    os.replace(tmp, path)
+
+    sidecar = {
+        "url": f"{SIDECAR_FOLDER}/{name}",
+        "length": length,
+        "source-length": len(xs),
+        "x": x_name,
+        "y": y_names,
+        "columns": layout,
+    }
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(sidecar, f)
+    return sidecar
+
+
+def prepare_chart_data(
+    slides: List[Dict[str, Any]],
+    data_source_dir: str,
+    output_folder: str
+) -> Tuple[int, int]:
+    """
+    Replaces file-backed chart data by downsampled binary sidecars.
+
+    Every chart spec with a ``data-file`` entry is processed with
+    ``write_sidecar`` and rewritten in place: the build-only keys are removed
+    and a ``data-sidecar`` description is added, which the browser runtime
+    fetches and decodes.
+
+    Args:
+        slides (List[Dict[str, Any]]): List of slide dictionaries.
+        data_source_dir (str): Folder chart data files are relative to.
+        output_folder (str): Path to the output directory.
+
+    Returns:
+        Tuple[int, int]: Number of charts processed and total points kept.
+    """
+    processed = 0
+    points = 0
+    for holder in iter_charts(slides):
+        chart = holder["chart"]
+        if "data-file" not in chart:
+            continue
+        sidecar = write_sidecar(chart, data_source_dir, output_folder)
+        spec = {key: value for key, value in chart.items() if key not in BUILD_KEYS}
+        spec["data-sidecar"] = sidecar
+        holder["chart"] = spec
+        processed += 1
+        points += sidecar["length"]
+    return processed, points
+
+
+def embed_chart_data(slides: List[Dict[str, Any]], output_folder: str) -> int:
+    """Replaces sidecar URLs by data URIs so that a single-file export needs no fetch from disk."""
+    from inline_export import data_uri
+
+    embedded = 0
+    for holder in iter_charts(slides):
+        sidecar = holder["chart"].get("data-sidecar")
+        if sidecar and not sidecar["url"].startswith("data:"):
+            sidecar["url"] = data_uri(os.path.join(output_folder, sidecar["url"]))
+            embedded += 1
+    return embedded
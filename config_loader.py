@@ -0,0 +1,332 @@
+# config_loader.py
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Any, Optional, Tuple, Callable, List, Iterator
+
+# Bump whenever parsing changes, so that cached results of an older loader are never reused.
+CONFIG_CACHE_VERSION = "1"
+
+# Smaller files parse faster than a cache file can be read back, so they are not cached.
+CACHE_MIN_BYTES = 64 * 1024
+
+# Bounds of the parse cache folder; the least recently used entries are removed beyond them
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Importing orjson takes longer than the standard library needs to parse a smaller file
+ORJSON_MIN_BYTES = 8 * 1024 * 1024
+
+# Key of the mapping that is replaced by the content of another configuration file
+INCLUDE_KEY = "$include"
+
+# Includes are parsed in worker processes when at least this many bytes must be parsed
+PARALLEL_MIN_BYTES = 1024 * 1024
+
+# Parsed files kept between loads when requested (watch mode): path -> (mtime_ns, size, backend, pickled data)
+_memory_cache: Dict[str, Tuple[int, int, str, bytes]] = {}
+
+
+class IncludeError(ValueError):
+    """Raised for missing, malformed or cyclic ``$include`` references."""
+
+
+def default_cache_dir() -> str:
+    """Returns the per-user folder holding parsed configurations (``$XDG_CACHE_HOME`` or ``~/.cache``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "html_powered_slides", "configs")
+
+
+def json_backend(size: int = ORJSON_MIN_BYTES) -> Tuple[str, Callable[[bytes], Any]]:
+    """Returns the fastest JSON parser for ``size`` bytes: orjson when installed and worth importing, else the standard library."""
+    if size < ORJSON_MIN_BYTES:
+        return "json", json.loads
+    try:
+        import orjson
+    except ImportError:
+        return "json", json.loads
+    return "orjson", orjson.loads
+
+
+def yaml_backend() -> Tuple[str, Callable[[bytes], Any]]:
+    """Returns a safe YAML parser, using the libyaml-based C loader when PyYAML was built with it."""
+    import yaml  # only YAML configurations pay for this import
+
+    loader = getattr(yaml, "CSafeLoader", None)
+    if loader is None:
+        return "yaml SafeLoader", lambda data: yaml.load(data, Loader=yaml.SafeLoader)
+    return "yaml CSafeLoader", lambda data: yaml.load(data, Loader=loader)
+
+
+def parse_configuration(config_path: str, data: bytes) -> Tuple[Any, str]:
+    """
+    Parses the raw bytes of a JSON or YAML configuration file.
+
+    Args:
+        config_path (str): Path of the file (its extension selects the format).
+        data (bytes): Content of the file.
+
+    Returns:
+        Tuple[Any, str]: The parsed data and the name of the parser used.
+    """
+    if config_path.endswith('.json'):
+        backend, loads = json_backend(len(data))
+    elif config_path.endswith(('.yaml', '.yml')):
+        backend, loads = yaml_backend()
+    else:
+        raise ValueError(f"Unsupported configuration file format for '{config_path}'. Use JSON or YAML.")
+    return loads(data), backend
+
+
+def load_file(
+    config_path: str,
+    use_cache: bool = True,
+    cache_dir: Optional[str] = None
+) -> Tuple[Any, str, str]:
+    """
+    Loads a single configuration file, without resolving its includes.
+
+    Large files are parsed once and stored as a pickle named after a hash of
+    the file content, so loading an unchanged file again skips the parser.
+
+    Args:
+        config_path (str): Path to the configuration file.
+        use_cache (bool): Read and write the parsed-configuration cache.
+        cache_dir (Optional[str]): Cache folder (default: ``default_cache_dir()``).
+
+    Returns:
+        Tuple[Any, str, str]: The parsed data, the parser used and where the
+        data came from ("parsed" or "cache").
+    """
+    with open(config_path, 'rb') as f:
+        data = f.read()
+
+    cache_path = None
+    if use_cache and len(data) >= CACHE_MIN_BYTES:
+        import pickle  # small files, the common case, never pay for this import
+        digest = hashlib.sha256(f"{CONFIG_CACHE_VERSION}:{os.path.splitext(config_path)[1]}:".encode() + data).hexdigest()
+        cache_path = os.path.join(cache_dir or default_cache_dir(), f"{digest}.pickle")
+        try:
+            with open(cache_path, "rb") as f:
+                backend, config = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            pass
+        else:
+            # The modification time records the last use, which the eviction sweep orders by
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return config, backend, "cache"
+
+    config, backend = parse_configuration(config_path, data)
+
+    if cache_path:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump((backend, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_path)
+            sweep_cache(os.path.dirname(cache_path))
+        except OSError as e:
+            print(f"Could not cache configuration '{config_path}': {e}")
+    return config, backend, "parsed"
+
+
+def sweep_cache(cache_dir: str, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES) -> int:
+    """
+    Removes the least recently used parsed configurations until the cache fits its bounds.
+
+    Entries are ordered by modification time, which ``load_file`` refreshes on
+    every cache hit. Files removed concurrently by another build are ignored.
+
+    Args:
+        cache_dir (str): Folder holding the ``.pickle`` entries.
+        max_entries (int): Number of entries kept at most.
+        max_bytes (int): Total size of the kept entries at most.
+
+    Returns:
+        int: Number of removed entries.
+    """
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".pickle"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort(reverse=True)
+    removed = 0
+    total = 0
+    for kept, (_, size, path) in enumerate(entries):
+        total += size
+        if kept >= max_entries or total > max_bytes:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def iter_includes(node: Any) -> Iterator[Any]:
+    """Yields the value of every ``$include`` reference inside a parsed configuration."""
+    if isinstance(node, dict):
+        if INCLUDE_KEY in node:
+            yield node[INCLUDE_KEY]
+            return
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from iter_includes(value)
+    elif isinstance(node, list):
+        for item in node:
+            if isinstance(item, (dict, list)):
+                yield from iter_includes(item)
+
+
+def _resolve_include(including_path: str, reference: Any) -> str:
+    if not isinstance(reference, str) or not reference:
+        raise IncludeError(f"'{including_path}': {INCLUDE_KEY} must be a file path, not {reference!r}.")
+    target = os.path.normpath(os.path.join(os.path.dirname(including_path), reference))
+    if not os.path.isfile(target):
+        raise IncludeError(f"'{including_path}' includes '{reference}', which does not exist ({target}).")
+    return target
+
+
+def _load_files(
+    paths: List[str],
+    use_cache: bool,
+    cache_dir: Optional[str],
+    keep_in_memory: bool
+) -> Dict[str, Tuple[Any, str, str]]:
+    """Loads a batch of files, from memory when unchanged, in worker processes when the batch is large."""
+    if keep_in_memory or _memory_cache:
+        import pickle
+    results: Dict[str, Tuple[Any, str, str]] = {}
+    to_load = []
+    for path in paths:
+        stat = os.stat(path)
+        cached = _memory_cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            results[path] = (pickle.loads(cached[3]), cached[2], "memory")
+        else:
+            to_load.append((path, stat))
+
+    if len(to_load) > 1 and sum(stat.st_size for _, stat in to_load) >= PARALLEL_MIN_BYTES:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as executor:
+            loaded = list(executor.map(load_file, [path for path, _ in to_load],
+                                       [use_cache] * len(to_load), [cache_dir] * len(to_load)))
+    else:
+        loaded = [load_file(path, use_cache, cache_dir) for path, _ in to_load]
+
+    for (path, stat), result in zip(to_load, loaded):
+        results[path] = result
+        if keep_in_memory:
+            _memory_cache[path] = (stat.st_mtime_ns, stat.st_size, result[1],
+                                   pickle.dumps(result[0], protocol=pickle.HIGHEST_PROTOCOL))
+    return results
+
+
+def _expand(node: Any, path: str, files: Dict[str, Any], chain: List[str]) -> Any:
+    """Returns ``node`` with every ``$include`` replaced by the (expanded) content of the included file."""
+    if isinstance(node, dict):
+        if INCLUDE_KEY in node:
+            target = _resolve_include(path, node[INCLUDE_KEY])
+            if target in chain:
+                cycle = " -> ".join(chain[chain.index(target):] + [target])
+                raise IncludeError(f"Include cycle: {cycle}")
+            return _expand(files[target], target, files, chain + [target])
+        return {key: _expand(value, path, files, chain) for key, value in node.items()}
+    if isinstance(node, list):
+        items = []
+        for item in node:
+            if isinstance(item, dict) and INCLUDE_KEY in item:
+                value = _expand(item, path, files, chain)
+                # An included list (e.g. the slides of a chapter) is spliced into the enclosing list
+                if isinstance(value, list):
+                    items.extend(value)
+                else:
+                    items.append(value)
+            else:
+                items.append(_expand(item, path, files, chain))
+        return items
+    return node
+
+
+def load_configuration(
+    config_path: str,
+    use_cache: bool = True,
+    cache_dir: Optional[str] = None,
+    keep_in_memory: bool = False,
+    files_read: Optional[List[str]] = None,
+    verbose: bool = True
+) -> Dict[str, Any]:
+    """
+    Loads presentation configuration from a JSON or YAML file.
+
+    Any mapping of the form ``{"$include": "chapters/03.yaml"}`` (a slide,
+    a fold, a column's content, or a whole ``slides``/``folds`` list) is
+    replaced by the content of that file, relative to the including file;
+    an included list inside a list is spliced into it. Includes are read
+    level by level, in worker processes when there is a lot to parse, and
+    each file is cached on its own (see ``load_file``), so only changed
+    includes are parsed again. The backends used and the cache hits are printed.
+
+    Includes are resolved eagerly rather than on first access: a build
+    renders every slide into one page, and the TOC, breadcrumbs and
+    ``check_slides`` walk the whole deck first, so every include is needed
+    before anything is written.
+
+    Args:
+        config_path (str): Path to the configuration file.
+        use_cache (bool): Read and write the parsed-configuration cache.
+        cache_dir (Optional[str]): Cache folder (default: ``default_cache_dir()``).
+        keep_in_memory (bool): Keep parsed files in memory for later loads (watch mode).
+        files_read (Optional[List[str]]): Receives the paths of the configuration
+            file and of every file it includes.
+        verbose (bool): Print the backends, cache hits and load time.
+
+    Returns:
+        Dict[str, Any]: Parsed configuration data.
+
+    Raises:
+        IncludeError: If an include is missing, not a path, or part of a cycle.
+    """
+    start = time.perf_counter()
+    root = os.path.normpath(config_path)
+    files: Dict[str, Any] = {}
+    backends = set()
+    sources = {"parsed": 0, "cache": 0, "memory": 0}
+    has_includes = False
+
+    pending = [root]
+    while pending:
+        batch = _load_files(pending, use_cache, cache_dir, keep_in_memory)
+        pending = []
+        for path, (data, backend, source) in batch.items():
+            files[path] = data
+            backends.add(backend)
+            sources[source] += 1
+            for reference in iter_includes(data):
+                has_includes = True
+                target = _resolve_include(path, reference)
+                if target not in files and target not in batch and target not in pending:
+                    pending.append(target)
+
+    config = _expand(files[root], root, files, [root]) if has_includes else files[root]
+    if files_read is not None:
+        files_read.extend(files)
+
+    if not verbose:
+        return config
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    origin = ", ".join(f"{count} {source}" for source, count in sources.items() if count)
+    print(f"Loaded configuration '{config_path}' with {', '.join(sorted(backends))} "
+          f"({len(files)} file(s): {origin}) in {elapsed_ms:.1f} ms.")
+    return config
@@ -0,0 +1,190 @@
+# css_prune.py
+import os
+import re
+from typing import Iterable, Set
+
+from inline_export import minify_css
+from template_engine import CompiledTemplate
+from theme_bundle import block_end, split_selectors
+
+CORE_CSS = os.path.join("static", "css", "core.css")
+# Pruned stylesheets get a folder of their own so a deck title never clashes with core.css or the themes
+PRUNED_CSS_FOLDER = "static/css/pruned"
+SCRIPT_JS = os.path.join("static", "js", "script.js")
+
+# Classes the runtime sets before the first paint (slideManager.initialize activates the
+# title slide and darkens the body); everything else it sets follows user input, by which
+# time the full stylesheet has loaded
+FIRST_PAINT_TOKENS = {".active", ".dark-background"}
+
+# The stylesheet link of the core template that --prune_css replaces
+CORE_LINK_PATTERN = re.compile(r'<link[^>]*\srel="stylesheet"[^>]*\shref="static/css/core\.css"[^>]*>')
+
+# Literal prefixes keep the scan of large pages fast; the odd false match (data-class="...")
+# only keeps a few more rules
+CLASS_PATTERN = re.compile(r'class=(?:"([^"]*)"|\'([^\']*)\')')
+ID_PATTERN = re.compile(r'id=(?:"([^"]*)"|\'([^\']*)\')')
+# Classes the runtime sets are the string arguments of classList.add/toggle/replace
+CLASS_LIST_CALL_PATTERN = re.compile(r"\.classList\.(?:add|toggle|replace)\(([^)]*)\)")
+STRING_LITERAL_PATTERN = re.compile(r'"([^"\\\n]*)"|\'([^\'\\\n]*)\'')
+# Runtime classes set only on elements created next to another class: the
+# resizer handles are only added between columns
+RUNTIME_CLASS_HOSTS = {".column-resizer": ".column"}
+# Functional pseudo-classes and attribute selectors never require a class or ID
+# to be present (":not(.active)"), so their contents are ignored
+SELECTOR_ARGUMENT_PATTERN = re.compile(r"\([^()]*\)|\[[^\]]*\]")
+SELECTOR_TOKEN_PATTERN = re.compile(r"[.#][\w-]+")
+
+
+def html_tokens(html: str) -> Set[str]:
+    """Returns the classes (".name") and IDs ("#name") used in an HTML document or fragment."""
+    tokens = set()
+    # Attribute values repeat a lot (every fold has class="collapsible level-1"), so each is split once
+    for double_quoted, single_quoted in set(CLASS_PATTERN.findall(html)):
+        for name in (double_quoted or single_quoted).split():
+            tokens.add("." + name)
+    for double_quoted, single_quoted in ID_PATTERN.findall(html):
+        tokens.add("#" + (double_quoted or single_quoted))
+    return tokens
+
+
+def script_tokens(source: str) -> Set[str]:
+    """
+    Returns the classes a script sets at runtime, for rules matched only after user input.
+
+    Only string literals passed to ``classList.add``, ``toggle`` and ``replace``
+    count (``classList.toggle('active', isActive)``); selector strings such as
+    ``closest('.column')`` name classes the page already has. Computed names
+    (template literals, variables) are not seen.
+    """
+    tokens = set()
+    for arguments in CLASS_LIST_CALL_PATTERN.findall(source):
+        for double_quoted, single_quoted in STRING_LITERAL_PATTERN.findall(arguments):
+            for name in (double_quoted or single_quoted).split():
+                tokens.add("." + name)
+    return tokens
+
+
+def runtime_tokens(script_path: str = SCRIPT_JS) -> Set[str]:
+    """Returns ``script_tokens`` of the browser runtime, or an empty set if it is missing."""
+    if not os.path.isfile(script_path):
+        return set()
+    with open(script_path, "r", encoding="utf-8") as f:
+        return script_tokens(f.read())
+
+
+def links_core_css(template: CompiledTemplate) -> bool:
+    """True if the template links the core stylesheet, i.e. ``--prune_css`` can replace it."""
+    return any(CORE_LINK_PATTERN.search(chunk) for chunk in template.chunks)
+
+
+def selector_used(selector: str, used: Set[str]) -> bool:
+    """True if every class and ID the selector requires is in ``used``."""
+    previous = None
+    while previous != selector:
+        previous, selector = selector, SELECTOR_ARGUMENT_PATTERN.sub("", selector)
+    return all(token in used for token in SELECTOR_TOKEN_PATTERN.findall(selector))
+
+
+def prune_css(css: str, used: Set[str]) -> str:
+    """
+    Removes the rules whose selectors need a class or ID that is not in ``used``.
+
+    Selector lists keep only their matching selectors, ``@media``/``@supports``
+    blocks are pruned recursively (and dropped when empty), and other at-rules
+    are kept. Rules keep their order, so the cascade is unchanged.
+
+    Args:
+        css (str): The stylesheet.
+        used (Set[str]): Classes (".name") and IDs ("#name") present in the page.
+
+    Returns:
+        str: The pruned stylesheet, without comments.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    out = []
+    i = 0
+    while True:
+        start = css.find("{", i)
+        if start < 0:
+            break
+        end = block_end(css, start)
+        prelude = " ".join(css[i:start].split())
+        body = css[start + 1:end]
+        if prelude.startswith(("@media", "@supports")):
+            inner = prune_css(body, used)
+            if inner.strip():
+                out.append(f"{prelude} {{\n{inner}}}\n")
+        elif prelude.startswith("@"):
+            out.append(f"{prelude} {{{body}}}\n")
+        else:
+            selectors = [selector for selector in split_selectors(prelude) if selector_used(selector, used)]
+            if selectors:
+                out.append(f"{', '.join(selectors)} {{{body}}}\n")
+        i = end + 1
+    return "".join(out)
+
+
+def defer_stylesheet(html: str, href: str, critical: str) -> str:
+    """
+    Replaces the core stylesheet link by inline critical CSS and a non-blocking link to ``href``.
+
+    The deferred link keeps the position of the original one, so once it has
+    loaded the cascade is the same as with the blocking stylesheet; the
+    critical rules are repeated in it and are simply overridden by their copies.
+
+    Args:
+        html (str): Template fragment (e.g. the document head).
+        href (str): The pruned stylesheet loaded after the first paint.
+        critical (str): Rules needed to paint the title slide and the page chrome.
+
+    Returns:
+        str: The fragment with the core stylesheet deferred.
+    """
+    critical = critical.replace("</style", "<\\/style")
+    markup = (f'<style id="critical-css">{critical}</style>\n'
+              f'    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+              f'    <noscript><link rel="stylesheet" href="{href}"></noscript>')
+    return CORE_LINK_PATTERN.sub(lambda match: markup, html, count=1)
+
+
+def critical_css(css: str, fragments: Iterable[str]) -> str:
+    """
+    Returns the minified rules needed for first paint.
+
+    Args:
+        css (str): The core stylesheet.
+        fragments (Iterable[str]): HTML visible before any navigation: the template
+            chrome, table of contents, breadcrumbs and the title slide.
+
+    Returns:
+        str: The critical CSS.
+    """
+    used = set(FIRST_PAINT_TOKENS)
+    for fragment in fragments:
+        used |= html_tokens(fragment)
+    return minify_css(prune_css(css, used))
+
+
+def write_pruned_css(css: str, page_path: str, output_path: str, runtime: Set[str]) -> str:
+    """
+    Writes the rules of ``css`` that a generated page can use, minified.
+
+    Args:
+        css (str): The core stylesheet.
+        page_path (str): The written presentation HTML, scanned for classes and IDs.
+        output_path (str): Where the pruned stylesheet is written.
+        runtime (Set[str]): Classes the browser runtime may set (see ``runtime_tokens``); those
+            in ``RUNTIME_CLASS_HOSTS`` are only kept when the page has their host class.
+
+    Returns:
+        str: The pruned stylesheet.
+    """
+    with open(page_path, "r", encoding="utf-8") as f:
+        page = html_tokens(f.read())
+    used = page | {token for token in runtime if token not in RUNTIME_CLASS_HOSTS or RUNTIME_CLASS_HOSTS[token] in page}
+    pruned = minify_css(prune_css(css, used))
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(pruned)
+    return pruned
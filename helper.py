@@ -2,97 +2,110 @@
 import os
 import re
 import shutil
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Iterator, TextIO, Tuple, TYPE_CHECKING
 import json
 
+from image_store import ImageStore
+from slide_model import (
+    parse_slide,
+    parse_slides,
+    parse_fold,
+    parse_rows,
+    parse_columns,
+    slide_id,
+    element_id,
+    Slide,
+    Fold,
+    Rows,
+    Columns,
+    Html,
+    Text,
+)
+
+if TYPE_CHECKING:
+    from render_cache import RenderCache
+    from metrics import BuildMetrics
+
 def sanitize_title(title: str) -> str:
     """Sanitize the presentation title to create a valid filename."""
     return re.sub(r'[^a-zA-Z0-9_\-]', '', title.replace(' ', '_'))
 
-def is_html(content: str) -> bool:
+def iter_rows_html(
+    rows: Rows,
+    level: int,
+    indent: str,
+    charts: Optional[Dict[str, Any]] = None
+) -> Iterator[str]:
     """
-    Determine if the content string contains any HTML tags.
-
-    Args:
-        content (str): The content string to check.
-
-    Returns:
-        bool: True if content contains HTML tags, False otherwise.
+    Yields HTML chunks for a rows structure, handling nested columns and other content.
+    Chart data is collected into ``charts`` when given (see ``generate_chart_html``).
     """
-    if type(content) is dict :
-        return False
-    return bool(re.search(r'<[^>]+>', content))
+    # Use "rows" class to align with CSS
+    yield f'{indent}<div class="rows">\n'
+
+    for row in rows.items:
+        for node in row:
+            kind = type(node)
+            if kind is Columns:
+                yield from iter_columns_html(node, level + 1, indent + "    ", charts)
+            elif kind is Rows:
+                yield from iter_rows_html(node, level + 1, indent + "    ", charts)
+            elif kind is Html:
+                yield f'{indent}    {node.html}\n'
+            elif kind is Text:
+                yield f'{indent}    <p>{node.text}</p>\n'
+            else:
+                yield from iter_fold_html(node, 1, indent + "    ", charts)
+
+    yield f'{indent}</div>\n'
 
 def generate_rows_html(rows: Dict[str, Any], unique_prefix: str, level: int, indent: str) -> str:
     """
     Generates HTML for a rows structure, handling nested columns and other content.
     """
-    number = rows.get("number", 1)
-    row_content = rows.get("content", [])
-
-    # Use "rows" class to align with CSS
-    rows_html = f'{indent}<div class="rows">\n'
-
-    for idx, row in enumerate(row_content):
-        if "columns" in row:
-            # If the row contains columns, generate them
-            rows_html += generate_columns_html(row["columns"], f"{unique_prefix}-row-{idx}", level + 1, indent + "    ")
-        elif "rows" in row:
-            # If the row contains nested rows, recursively generate them
-            rows_html += generate_rows_html(row["rows"], f"{unique_prefix}-row-{idx}", level + 1, indent + "    ")
-        else:
-            # Handle other content types like 'html-content' or 'folds'
-            if "html-content" in row:
-                rows_html += f'{indent}    {row["html-content"]}\n'
-            if "folds" in row:
-                for j, fold in enumerate(row["folds"]):
-                    unique_id = f"fold-{unique_prefix}-row-{idx}-fold-{j}"
-                    rows_html += generate_fold_html(fold, unique_id, level + 1, indent + "    ")
-
-    rows_html += f'{indent}</div>\n'
-    return rows_html
+    return "".join(iter_rows_html(parse_rows(rows, unique_prefix), level, indent))
 
 
 
-def generate_columns_html(columns: Dict[str, Any], unique_prefix: str, level: int, indent: str) -> str:
+def iter_columns_html(
+    columns: Columns,
+    level: int,
+    indent: str,
+    charts: Optional[Dict[str, Any]] = None
+) -> Iterator[str]:
     """
-    Generates HTML for a column structure, handling nested rows, columns, and folds.
+    Yields HTML chunks for a column structure, handling nested rows, columns, and folds.
+    Chart data is collected into ``charts`` when given (see ``generate_chart_html``).
     """
-    number = columns.get("number", 1)
-    sizes = columns.get("size", ["100%"] * number)
-    column_content = columns.get("content", [])
-
-    columns_html = f'{indent}<div class="columns">\n'
-
-    for idx in range(number):
-        size = sizes[idx] if idx < len(sizes) else "100%"
-        content = column_content[idx] if idx < len(column_content) else ""
-
-        columns_html += f'{indent}    <div class="column resizable" style="flex: 0 0 {size};">\n'
-
-        if isinstance(content, str):
-            if is_html(content):
-                columns_html += f'{indent}        {content}\n'
+    yield f'{indent}<div class="columns">\n'
+
+    # data-column-id keys the widths the browser runtime remembers after a resize
+    for idx, (size, nodes) in enumerate(columns.cells):
+        yield f'{indent}    <div class="column resizable" data-column-id="{element_id(columns.id, "k", idx)}" style="flex: 0 0 {size};">\n'
+
+        for node in nodes:
+            kind = type(node)
+            if kind is Text:
+                yield f'{indent}        <p>{node.text}</p>\n'
+            elif kind is Html:
+                yield f'{indent}        {node.html}\n'
+            elif kind is Fold:
+                yield from iter_fold_html(node, 1, indent + "        ", charts)
+            elif kind is Rows:
+                yield from iter_rows_html(node, level + 1, indent + "        ", charts)
             else:
-                columns_html += f'{indent}        <p>{content}</p>\n'
-        elif isinstance(content, dict):
-            # Handle multiple keys within a single content dictionary
-            if "html-content" in content:
-                columns_html += f'{indent}        {content["html-content"]}\n'
-            if "folds" in content:
-                for j, fold in enumerate(content["folds"]):
-                    unique_id = f"fold-{unique_prefix}-col-{idx}-fold-{j}"
-                    columns_html += generate_fold_html(fold, unique_id, level + 1, indent + "        ")
-            if "rows" in content:
-                columns_html += generate_rows_html(content["rows"], f"{unique_prefix}-col-{idx}-row", level + 1, indent + "        ")
-            if "columns" in content:
-                columns_html += generate_columns_html(content["columns"], f"{unique_prefix}-col-{idx}-col", level + 1, indent + "        ")
+                yield from iter_columns_html(node, level + 1, indent + "        ", charts)
 
-        columns_html += f'{indent}    </div>\n'
+        yield f'{indent}    </div>\n'
 
-    columns_html += f'{indent}</div>\n'
-    return columns_html
+    yield f'{indent}</div>\n'
 
+def generate_columns_html(columns: Dict[str, Any], unique_prefix: str, level: int, indent: str) -> str:
+    """
+    Generates HTML for a column structure, handling nested rows, columns, and folds.
+    """
+    return "".join(iter_columns_html(parse_columns(columns, unique_prefix), level, indent))
 
 
 
@@ -115,7 +128,27 @@ def generate_breadcrumbs(slides: List[Dict[str, Any]]) -> str:
     return breadcrumbs_html
 
 # Helper function to generate chart HTML
-def generate_chart_html(chart_data: Dict[str, Any], indent: str) -> str:
+def generate_chart_html(
+    chart_data: Dict[str, Any],
+    indent: str,
+    chart_id: Optional[str] = None,
+    charts: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Generates the container of a chart.
+
+    When a ``charts`` registry is given, the chart data is stored there under
+    ``chart_id`` and the container only references it; the registry is written
+    once per document as a JSON block. Otherwise the data is inlined into the
+    container's ``data-chart-data`` attribute.
+    """
+    if charts is not None and chart_id:
+        charts[chart_id] = chart_data
+        return (
+            f'{indent}<div class="chart-container" id="{chart_id}" data-chart-id="{chart_id}">\n'
+            f'{indent}    <canvas></canvas>\n'
+            f'{indent}</div>\n'
+        )
     chart_json = json.dumps(chart_data).replace("'", "&apos;")
     return (
         f'{indent}<div class="chart-container" data-chart-data=\'{chart_json}\'>\n'
@@ -123,19 +156,32 @@ def generate_chart_html(chart_data: Dict[str, Any], indent: str) -> str:
         f'{indent}</div>\n'
     )
 
+def generate_chart_data_block(charts: Dict[str, Any]) -> str:
+    """Generates the JSON block holding the data of every chart in the document."""
+    chart_json = json.dumps(charts, separators=(",", ":")).replace("</", "<\\/")
+    return f'<script type="application/json" id="chart-data">{chart_json}</script>'
+
 # Helper function to generate fold HTML
-def generate_fold_html(fold: Dict[str, Any], unique_id: str, level: int, indent: str) -> str:
+def iter_fold_html(
+    fold: Fold,
+    level: int,
+    indent: str,
+    charts: Optional[Dict[str, Any]] = None
+) -> Iterator[str]:
     """
-    Generates HTML for a collapsible fold with varying background darkness based on depth.
+    Yields HTML chunks for a collapsible fold with varying background darkness based on depth.
 
     Args:
-        fold (Dict[str, Any]): The fold data containing title, content, and possibly nested folds.
-        unique_id (str): A unique identifier for the content panel associated with the collapsible.
-        level (int): The current nesting depth level (1-based).
+        fold (Fold): The fold containing title, content, and possibly nested folds; its
+            ``id`` identifies the content panel associated with the collapsible.
+        level (int): The fold nesting depth (1-based): 1 for a fold placed in a slide,
+            column or row, one more for each enclosing fold panel. The browser
+            runtime styles folds by the resulting ``level-N`` class.
         indent (str): The indentation string for formatting.
+        charts (Optional[Dict[str, Any]]): Registry collecting chart data by chart ID.
 
-    Returns:
-        str: The generated HTML string for the fold.
+    Yields:
+        str: Consecutive pieces of the fold HTML.
     """
     # Define the maximum depth level supported
     MAX_LEVEL = 5
@@ -143,108 +189,257 @@ def generate_fold_html(fold: Dict[str, Any], unique_id: str, level: int, indent:
     # Ensure the current level does not exceed MAX_LEVEL
     current_level = min(level, MAX_LEVEL)
 
-    # Attempt to retrieve the fold title; default if not present
-    fold_title = fold.get("title", "Click to Expand")
+    unique_id = fold.id
 
     # Assign the appropriate 'level-x' class based on current_level
-    fold_html = f'{indent}<button class="collapsible level-{current_level}" aria-expanded="false" aria-controls="{unique_id}">{fold_title}</button>\n'
+    yield f'{indent}<button class="collapsible level-{current_level}" aria-expanded="false" aria-controls="{unique_id}">{fold.title}</button>\n'
 
     # Start the content panel with the unique ID
-    fold_html += f'{indent}<div id="{unique_id}" class="content-panel">\n'
+    yield f'{indent}<div id="{unique_id}" class="content-panel">\n'
 
     # If the fold contains a chart, generate its HTML
-    if "chart" in fold:
-        fold_html += generate_chart_html(fold["chart"], indent + "    ")
+    if fold.chart is not None:
+        yield generate_chart_html(fold.chart.spec, indent + "    ", f"chart-{unique_id}", charts)
 
     # If the fold contains "html-content", insert it directly
-    if "html-content" in fold:
-        fold_html += f'{indent}    {fold["html-content"]}\n'
-
-    # If the fold contains "content", process each content item
-    if "content" in fold:
-        for content in fold["content"]:
-            if is_html(content):
-                fold_html += f'{indent}    {content}\n'
-            else:
-                fold_html += f'{indent}    <p>{content}</p>\n'
-
-    # If the fold contains nested folds, recurse and increment the level
-    if "folds" in fold:
-        # Ensure 'folds' is a list
-        nested_folds = fold["folds"]
-        if isinstance(nested_folds, dict):
-            # If 'folds' is a single dict, wrap it in a list
-            nested_folds = [nested_folds]
-        elif not isinstance(nested_folds, list):
-            # If 'folds' is neither a dict nor a list, skip processing
-            nested_folds = []
-
-        for sub_fold in nested_folds:
-            # Generate a unique ID for the nested fold
-            sub_unique_id = f"{unique_id}-sub-{nested_folds.index(sub_fold)+1}"
-            # Recursively generate HTML for the nested fold, incrementing the level
-            fold_html += generate_fold_html(sub_fold, sub_unique_id, level + 1, indent + "    ")
+    if fold.html is not None:
+        yield f'{indent}    {fold.html}\n'
+
+    # Text was classified as markup or paragraph text when the deck was parsed
+    for node in fold.content:
+        if type(node) is Html:
+            yield f'{indent}    {node.html}\n'
+        else:
+            yield f'{indent}    <p>{node.text}</p>\n'
+
+    # Recurse into nested folds, incrementing the level
+    for sub_fold in fold.folds:
+        yield from iter_fold_html(sub_fold, level + 1, indent + "    ", charts)
 
     # Close the content panel div
-    fold_html += f'{indent}</div>\n'
-    return fold_html
+    yield f'{indent}</div>\n'
 
+def generate_fold_html(fold: Dict[str, Any], unique_id: str, level: int, indent: str) -> str:
+    """
+    Generates HTML for a collapsible fold with varying background darkness based on depth.
 
+    Args:
+        fold (Dict[str, Any]): The fold data containing title, content, and possibly nested folds.
+        unique_id (str): A unique identifier for the content panel associated with the collapsible.
+        level (int): The current nesting depth level (1-based).
+        indent (str): The indentation string for formatting.
 
-# Main function to generate slide content
-def generate_slide_content(slides: List[Dict[str, Any]], level: int = 0) -> str:
-    slides_html = ""
+    Returns:
+        str: The generated HTML string for the fold.
+    """
+    return "".join(iter_fold_html(parse_fold(fold, unique_id), level, indent))
+
+
+
+def iter_slide_html(
+    slide: Slide,
+    index: int,
+    level: int = 0,
+    lazy: bool = False,
+    charts: Optional[Dict[str, Any]] = None
+) -> Iterator[str]:
+    """
+    Yields HTML chunks for a single slide.
+
+    Args:
+        slide (Slide): The parsed slide (see ``slide_model.parse_slides``), which carries its element IDs.
+        index (int): Position of the slide among its siblings.
+        level (int): Nesting level of the slide (0 for main slides).
+        lazy (bool): Wrap the slide body in an inert <template> that the browser
+            runtime materializes on demand (never applied to the title slide).
+        charts (Optional[Dict[str, Any]]): Registry collecting chart data by chart ID.
+
+    Yields:
+        str: Consecutive pieces of the slide HTML.
+    """
     indent = "    " * level  # Indentation for readability
+    lazy = lazy and level == 0 and index > 0
+
+    # Determine CSS classes
+    classes = "slide" if level == 0 else "nested-slide"
+    if slide.dark:
+        classes += " dark"
+
+    if lazy:
+        yield f'{indent}<div class="{classes}" data-lazy="true"><template>\n'
+    else:
+        yield f'{indent}<div class="{classes}">\n'
+    yield f'{indent}    <div class="content-wrapper">\n'
+    yield f'{indent}        <div class="text-content">\n'
+
+    # Handle "html-content" separately
+    for content in slide.html:
+        yield f'{indent}            {content}\n'
+
+    # Handle "content" which can include rows, columns, plain text, or nested structures
+    for node in slide.content:
+        kind = type(node)
+        if kind is Html:
+            yield f'{indent}            {node.html}\n'
+        elif kind is Text:
+            yield f'{indent}            <p>{node.text}</p>\n'
+        elif kind is Rows:
+            yield from iter_rows_html(node, level, indent + "            ", charts)
+        elif kind is Columns:
+            yield from iter_columns_html(node, level, indent + "            ", charts)
+        else:
+            # Handle other structured content like folds
+            yield from iter_fold_html(node, 1, indent + "            ", charts)
+
+    # Handle collapsible slides (folds)
+    for fold in slide.folds:
+        yield from iter_fold_html(fold, 1, indent + "        ", charts)
+
+    yield f'{indent}        </div>\n'
+
+    # Handle images
+    title = slide.title if slide.title is not None else "Image"
+    image_info = slide.image_info
+    if image_info:
+        # Responsive variants or embedded data written by the image build stages
+        alt = f'{title} Image'
+        loading = "eager" if index == 0 and level == 0 else "lazy"
+        sizes = f' sizes="{image_info["sizes"]}"' if "sizes" in image_info else ""
+        if "image-id" in image_info:
+            # Embedded image shared by several slides; the runtime sets its src from #image-data
+            attrs = f'data-image-id="{image_info["image-id"]}"'
+        else:
+            attrs = f'src="{image_info["src"]}"'
+        if "srcset" in image_info:
+            attrs += f' srcset="{image_info["srcset"]}"{sizes}'
+        if "width" in image_info and "height" in image_info:
+            attrs += f' width="{image_info["width"]}" height="{image_info["height"]}"'
+        yield f'{indent}        <div class="image-content">\n'
+        yield f'{indent}            <picture>\n'
+        for source in image_info.get("sources", []):
+            yield f'{indent}                <source type="{source["type"]}" srcset="{source["srcset"]}"{sizes}>\n'
+        yield f'{indent}                <img {attrs} loading="{loading}" decoding="async" alt="{alt}">\n'
+        yield f'{indent}            </picture>\n'
+        yield f'{indent}        </div>\n'
+    elif slide.image:
+        image_filename = os.path.basename(slide.image)
+        yield f'{indent}        <div class="image-content">\n'
+        yield f'{indent}            <img src="images/{image_filename}" alt="{title} Image">\n'
+        yield f'{indent}        </div>\n'
+
+    yield f'{indent}    </div>\n'
+    if lazy:
+        yield f'{indent}</template></div>\n\n'
+    else:
+        yield f'{indent}</div>\n\n'
+
+def iter_slide_content(
+    slides: List[Dict[str, Any]],
+    level: int = 0,
+    lazy: bool = False,
+    charts: Optional[Dict[str, Any]] = None
+) -> Iterator[str]:
+    """Yields the HTML of all slides chunk by chunk, in order."""
+    for i, slide in enumerate(parse_slides(slides, level=level)):
+        yield from iter_slide_html(slide, i, level, lazy, charts)
+
+def render_slides(
+    slides: List[Dict[str, Any]],
+    out: TextIO,
+    level: int = 0,
+    cache: Optional["RenderCache"] = None,
+    lazy: bool = False,
+    charts: Optional[Dict[str, Any]] = None,
+    metrics: Optional["BuildMetrics"] = None
+) -> None:
+    """
+    Streams the HTML of all slides into a writable text stream.
+
+    Each slide dictionary is parsed into the typed slide model right before
+    it is rendered (the deck must have passed ``validation.check_slides``), and only one chunk is held in memory at a
+    time, so peak memory does not grow with the size of the deck. When a
+    render cache is given, each slide's fragment is looked up by content hash
+    and only changed slides are parsed and rendered.
+
+    Args:
+        slides (List[Dict[str, Any]]): List of slide dictionaries.
+        out (TextIO): Any object with a ``write(str)`` method, e.g. an open file.
+        level (int): Nesting level of the slides (0 for main slides).
+        cache (Optional[RenderCache]): Cache of previously rendered slide fragments.
+        lazy (bool): Write all but the title slide as inert templates.
+        charts (Optional[Dict[str, Any]]): Registry collecting chart data by chart ID;
+            without it chart data is written inline into each chart container.
+        metrics (Optional[BuildMetrics]): Receives the render time of every slide.
 
+    Returns:
+        None
+    """
+    write = out.write
+    clock = time.perf_counter_ns
+    spans = metrics.slides if metrics is not None else None
+    if cache is None:
+        for i, slide in enumerate(slides):
+            start = clock()
+            for chunk in iter_slide_html(parse_slide(slide, slide_id(i, level)), i, level, lazy, charts):
+                write(chunk)
+            if spans is not None:
+                spans.append((i, start, clock()))
+        if metrics is not None:
+            metrics.add("slides", len(slides))
+        return
+
+    variant = ("lazy" if lazy else "") + ("+charts" if charts is not None else "")
+    hits = cache.hits
     for i, slide in enumerate(slides):
-        # Determine CSS classes
-        classes = "slide" if level == 0 else "nested-slide"
-        if slide.get("dark"):
-            classes += " dark"
-
-        slides_html += f'{indent}<div class="{classes}">\n'
-        slides_html += f'{indent}    <div class="content-wrapper">\n'
-        slides_html += f'{indent}        <div class="text-content">\n'
-
-        # Handle "html-content" separately
-        for content in slide.get("html-content", []):
-            slides_html += f'{indent}            {content}\n'
-
-        # Handle "content" which can include rows, columns, plain text, or nested structures
-        for content in slide.get("content", []):
-            if isinstance(content, str):
-                if is_html(content):
-                    slides_html += f'{indent}            {content}\n'
-                else:
-                    slides_html += f'{indent}            <p>{content}</p>\n'
-            elif isinstance(content, dict):
-                if "rows" in content:
-                    slides_html += generate_rows_html(content["rows"], f"slide-{level}-{i}", level, indent + "            ")
-                elif "columns" in content:
-                    slides_html += generate_columns_html(content["columns"], f"slide-{level}-{i}", level, indent + "            ")
-                else:
-                    # Handle other structured content like folds
-                    slides_html += generate_fold_html(content, f"fold-{level}-{i}", level, indent + "            ")
-
-        # Handle collapsible slides (folds)
-        for j, fold in enumerate(slide.get("folds", [])):
-            unique_id = f"collapsible-{level}-{i}-{j}"  # Unique ID for each fold
-            slides_html += generate_fold_html(fold, unique_id, level, indent + "        ")
-
-        slides_html += f'{indent}        </div>\n'
-
-        # Handle images
-        image_url = slide.get("image", "static/images/placeholder.png")
-        if image_url:
-            image_filename = os.path.basename(image_url)
-            slides_html += f'{indent}        <div class="image-content">\n'
-            slides_html += f'{indent}            <img src="images/{image_filename}" alt="{slide.get("title", "Image")} Image">\n'
-            slides_html += f'{indent}        </div>\n'
-
-        slides_html += f'{indent}    </div>\n'
-        slides_html += f'{indent}</div>\n\n'
-
-    return slides_html
+        start = clock()
+        key = cache.key(slide, i, level, variant)
+        cached = cache.get(key)
+        if cached is None:
+            slide_charts = {} if charts is not None else None
+            fragment = "".join(iter_slide_html(parse_slide(slide, slide_id(i, level)), i, level, lazy, slide_charts))
+            cache.put(key, fragment, slide_charts)
+        else:
+            fragment, slide_charts = cached
+        if charts is not None and slide_charts:
+            charts.update(slide_charts)
+        write(fragment)
+        if spans is not None:
+            spans.append((i, start, clock()))
+    if metrics is not None:
+        metrics.add("slides", len(slides))
+        metrics.add("cached", cache.hits - hits)
+
+# Main function to generate slide content
+def generate_slide_content(slides: List[Dict[str, Any]], level: int = 0) -> str:
+    return "".join(iter_slide_content(slides, level))
+
+
+
+def copy_if_changed(src: str, dest: str) -> bool:
+    """
+    Copies a file unless the destination already holds an identical copy.
+
+    The destination is considered up to date when its size and modification
+    time match the source (``shutil.copy2`` preserves the mtime).
+
+    Args:
+        src (str): Path to the source file.
+        dest (str): Path to the destination file or directory.
+
+    Returns:
+        bool: True if the file was copied, False if it was already up to date.
+    """
+    if os.path.isdir(dest):
+        dest = os.path.join(dest, os.path.basename(src))
+    try:
+        src_stat = os.stat(src)
+        dest_stat = os.stat(dest)
+        if src_stat.st_size == dest_stat.st_size and int(src_stat.st_mtime) == int(dest_stat.st_mtime):
+            return False
+    except FileNotFoundError:
+        pass
+    shutil.copy2(src, dest)
+    return True
 
 
 
@@ -252,66 +447,90 @@ def copy_images(
     slides: List[Dict[str, Any]],
     images_source_dir: Optional[str],
     destination_images_folder: str,
-    placeholder_image: str = os.path.join(os.getcwd(), "static/images/placeholder.png")
+    placeholder_image: str = os.path.join(os.getcwd(), "static/images/placeholder.png"),
+    store: Optional[ImageStore] = None,
+    metrics: Optional["BuildMetrics"] = None,
+    synced: Optional[Dict[Tuple[str, str], str]] = None
 ) -> None:
     """
     Recursively copies images from the source directory to the destination images folder.
-    Updates the 'image' field in the slide dictionary to use the placeholder image if needed.
+    The configured 'image' is left as is; the name of the file placed for it (the placeholder
+    if the image is missing) is recorded in 'image-file', so every rebuild resolves it afresh.
+    Each file is synced once per build however many slides and folds show it.
 
     Args:
         slides (List[Dict[str, Any]]): List of slide dictionaries.
         images_source_dir (Optional[str]): Path to the source images directory.
         destination_images_folder (str): Path to the destination images folder.
         placeholder_image (str): Path to the placeholder image.
+        store (Optional[ImageStore]): Image store that skips, links or copies each file.
+        metrics (Optional[BuildMetrics]): Build metrics; per-image lines are then only printed in verbose mode.
+        synced (Optional[Dict[Tuple[str, str], str]]): Action of each (source, destination) pair
+            already synced in this build, shared with the recursive calls.
 
     Returns:
         None
     """
+    detail = metrics.detail if metrics is not None else print
+
     # Ensure the destination directory exists
     os.makedirs(destination_images_folder, exist_ok=True)
 
+    if store is None:
+        store = ImageStore()
+    if synced is None:
+        synced = {}
+
+    def sync(src: str, dest: str) -> str:
+        # The placeholder stands in on many slides; the store (and its stats) only sees it once
+        if (src, dest) not in synced:
+            synced[(src, dest)] = store.sync(src, dest)
+        return synced[(src, dest)]
+
     # Verify the placeholder image exists
-    if not os.path.isfile(placeholder_image):
+    if placeholder_image and not os.path.isfile(placeholder_image):
         print(f"Placeholder image '{placeholder_image}' does not exist. Skipping.")
         placeholder_image = None
 
     for slide in slides:
+        # Derived by this and the later image stages of the build, never carried over from the last one
+        slide.pop("image-file", None)
+        slide.pop("image-info", None)
         image_path = slide.get("image")
         if image_path:
             src_image = os.path.join(images_source_dir, image_path) if images_source_dir else None
             dest_image = os.path.join(destination_images_folder, os.path.basename(image_path))
 
             if src_image and os.path.isfile(src_image):
-                shutil.copy(src_image, dest_image)
-                print(f"Copied image '{src_image}' to '{destination_images_folder}'")
+                action = sync(src_image, dest_image)
+                slide["image-file"] = os.path.basename(image_path)
+                detail(f"Image '{src_image}' {action} to '{destination_images_folder}'")
             else:
-                print(f"Image '{image_path}' not found. Using placeholder.")
+                detail(f"Image '{image_path}' not found. Using placeholder.")
                 if placeholder_image:
                     dest_placeholder = os.path.join(destination_images_folder, os.path.basename(placeholder_image))
-                    if not os.path.isfile(dest_placeholder):
-                        shutil.copy(placeholder_image, dest_placeholder)
-                    slide["image"] = os.path.basename(placeholder_image)  # Update image to placeholder
-                    print(f"Copied placeholder image to '{dest_placeholder}'")
+                    sync(placeholder_image, dest_placeholder)
+                    slide["image-file"] = os.path.basename(placeholder_image)
         else:
             # No image specified, use the placeholder
-            print("No image specified. Using placeholder.")
+            detail("No image specified. Using placeholder.")
             if placeholder_image:
                 dest_placeholder = os.path.join(destination_images_folder, os.path.basename(placeholder_image))
-                if not os.path.isfile(dest_placeholder):
-                    shutil.copy(placeholder_image, dest_placeholder)
-                slide["image"] = os.path.basename(placeholder_image)  # Update image to placeholder
-                print(f"Copied placeholder image to '{dest_placeholder}'")
+                sync(placeholder_image, dest_placeholder)
+                slide["image-file"] = os.path.basename(placeholder_image)
 
         # Recursively handle nested folds
         for fold in slide.get("folds", []):
-            copy_images([fold], images_source_dir, destination_images_folder, placeholder_image)
+            copy_images([fold], images_source_dir, destination_images_folder, placeholder_image, store, metrics, synced)
 
 
 
 def copy_project_images(
     slides: List[Dict[str, Any]],
     images_source_dir: Optional[str],
-    destination_images_folder: str
+    destination_images_folder: str,
+    store: Optional[ImageStore] = None,
+    metrics: Optional["BuildMetrics"] = None
 ) -> None:
     """
     Prepares the destination images folder and copies images.
@@ -320,10 +539,23 @@ def copy_project_images(
         slides (List[Dict[str, Any]]): List of slide dictionaries.
         images_source_dir (Optional[str]): Path to the source images directory.
         destination_images_folder (str): Path to the destination images folder.
+        store (Optional[ImageStore]): Image store shared between builds, if any.
+        metrics (Optional[BuildMetrics]): Receives the image counts instead of a printed summary.
     
     Returns:
         None
     """
     os.makedirs(destination_images_folder, exist_ok=True)
-    copy_images(slides, images_source_dir, destination_images_folder)
-
+    if store is None:
+        store = ImageStore()
+    stats = store.stats
+    before = (stats.copied, stats.linked, stats.skipped, stats.bytes_copied, stats.bytes_saved)
+    copy_images(slides, images_source_dir, destination_images_folder, store=store, metrics=metrics)
+    if metrics is None:
+        print(f"Images: {stats.summary()}.")
+        return
+    # The store may be shared between builds, so only this build's share is recorded
+    after = (stats.copied, stats.linked, stats.skipped, stats.bytes_copied, stats.bytes_saved)
+    for name, old, new in zip(("images copied", "images linked", "images up to date", "bytes written", "bytes saved"), before, after):
+        if new != old:
+            metrics.add(name, new - old)
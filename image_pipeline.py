@@ -0,0 +1,264 @@
+# image_pipeline.py
+import contextlib
+import os
+import re
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+from image_store import ImageStore
+
+# Widths (in pixels) of the responsive variants; widths above the source are skipped
+DEFAULT_WIDTHS = (480, 960, 1440, 1920)
+
+# Modern formats offered through <source> elements, best first
+DEFAULT_FORMATS = ("webp",)
+
+# The image column takes half of the content area, or all of it on narrow screens (see core.css)
+DEFAULT_SIZES = "(max-width: 800px) 100vw, 50vw"
+
+# Encoder options per output format
+ENCODER_OPTIONS = {
+    "webp": {"quality": 80, "method": 4},
+    "avif": {"quality": 60},
+    "jpeg": {"quality": 85, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+
+EXIF_ORIENTATION = 0x0112
+
+MIME_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+
+# Source formats the pipeline rewrites; anything else (e.g. SVG, GIF) is left untouched
+OPTIMIZABLE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.tif', '.tiff', '.bmp')
+
+# Source digests of the previous build, so unchanged images are not hashed again; kept in the
+# output folder next to the render cache, not among the published images
+DIGEST_INDEX = ".image_digests.json"
+
+# Where older versions kept the index, inside the published images folder
+LEGACY_DIGEST_INDEX = ".digests.json"
+
+# Names written by _variant_name; files matching it that the current build did not produce are stale
+VARIANT_PATTERN = re.compile(r"^.+-[0-9a-f]{12}-\d+w\.(?:jpg|png|webp|avif)$")
+
+
+def pillow_available() -> bool:
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _variant_name(stem: str, digest: str, width: int, fmt: str) -> str:
+    ext = "jpg" if fmt == "jpeg" else fmt
+    return f"{stem}-{digest}-{width}w.{ext}"
+
+
+def variant_names(info: Dict[str, Any]) -> List[str]:
+    """Returns the file names of the variants listed in the image info returned by ``process_image``."""
+    srcsets = [info["srcset"]] + [source["srcset"] for source in info["sources"]]
+    return [os.path.basename(entry.split()[0]) for srcset in srcsets for entry in srcset.split(", ")]
+
+
+def prune_variants(destination_images_folder: str, keep: Sequence[str]) -> int:
+    """
+    Removes the variants of earlier builds that no current image uses: those of
+    changed or removed sources, and widths or formats no longer emitted.
+
+    Args:
+        destination_images_folder (str): Output images folder.
+        keep (Sequence[str]): File names to keep: the current variants and copied images.
+
+    Returns:
+        int: Number of files removed.
+    """
+    keep = set(keep)
+    removed = 0
+    try:
+        entries = list(os.scandir(destination_images_folder))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        if entry.name not in keep and VARIANT_PATTERN.match(entry.name) and entry.is_file():
+            try:
+                os.remove(entry.path)
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def process_image(
+    source_path: str,
+    destination_folder: str,
+    widths: Sequence[int],
+    formats: Sequence[str],
+    digest: str,
+    existing_only: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Writes resized and recompressed variants of one image.
+
+    Variant file names contain a hash of the source, so variants that already
+    exist are reused and the work is only redone when the source changes.
+
+    Args:
+        source_path (str): Path to the original image.
+        destination_folder (str): Folder receiving the variants.
+        widths (Sequence[int]): Target widths in pixels.
+        formats (Sequence[str]): Modern formats to emit in addition to the fallback.
+        digest (str): Short hash of the source, part of the variant file names.
+        existing_only (bool): Only read the image header, and return None if a
+            variant is missing instead of writing it.
+
+    Returns:
+        Optional[Dict[str, Any]]: Image info with "src", "srcset", "sizes", "width",
+        "height" and one "sources" entry per modern format.
+    """
+    from PIL import Image, ImageOps
+
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+
+    with Image.open(source_path) as original:
+        # Only the header is read here; pixels are decoded when a variant is missing
+        source_width, source_height = original.size
+        if original.getexif().get(EXIF_ORIENTATION, 1) in (5, 6, 7, 8):
+            source_width, source_height = source_height, source_width
+        has_alpha = original.mode in ("RGBA", "LA") or (original.mode == "P" and "transparency" in original.info)
+        fallback = "png" if has_alpha else "jpeg"
+
+        target_widths = sorted({min(w, source_width) for w in widths})
+        variants: Dict[str, List[Tuple[int, str]]] = {fmt: [] for fmt in (*formats, fallback)}
+        image = None
+        for width in target_widths:
+            height = max(1, round(source_height * width / source_width))
+            resized = None
+            for fmt in variants:
+                name = _variant_name(stem, digest, width, fmt)
+                variants[fmt].append((width, name))
+                target = os.path.join(destination_folder, name)
+                if os.path.isfile(target):
+                    continue
+                if existing_only:
+                    return None
+                if image is None:
+                    image = ImageOps.exif_transpose(original)
+                if resized is None:
+                    resized = image if width == source_width else image.resize((width, height), Image.LANCZOS)
+                out = resized
+                if fmt == "jpeg" and out.mode != "RGB":
+                    out = out.convert("RGB")
+                tmp = f"{target}.{os.getpid()}.tmp"
+                out.save(tmp, format=fmt.upper(), **ENCODER_OPTIONS.get(fmt, {}))
+                os.replace(tmp, target)
+
+    largest_width = target_widths[-1]
+    largest_height = max(1, round(source_height * largest_width / source_width))
+
+    def srcset(entries: List[Tuple[int, str]]) -> str:
+        return ", ".join(f"images/{name} {width}w" for width, name in entries)
+
+    return {
+        "src": f"images/{variants[fallback][-1][1]}",
+        "srcset": srcset(variants[fallback]),
+        "sizes": DEFAULT_SIZES,
+        "width": largest_width,
+        "height": largest_height,
+        "sources": [{"type": MIME_TYPES[fmt], "srcset": srcset(variants[fmt])} for fmt in formats],
+    }
+
+
+def optimize_images(
+    slides: List[Dict[str, Any]],
+    destination_images_folder: str,
+    widths: Sequence[int] = DEFAULT_WIDTHS,
+    formats: Sequence[str] = DEFAULT_FORMATS,
+    jobs: Optional[int] = None,
+    store: Optional[ImageStore] = None
+) -> int:
+    """
+    Emits responsive variants for every slide image and records them on the slides.
+
+    Runs after ``copy_project_images``: each slide's ``image`` file is read from
+    the destination images folder and the resulting info is stored in the
+    slide's ``image-info`` field, which ``iter_slide_html`` turns into a
+    ``<picture>`` element with ``srcset``/``sizes``, explicit dimensions and
+    lazy loading. Requires Pillow; without it the stage is skipped.
+
+    Sources are hashed through the image store, whose size/mtime memo is
+    seeded from the previous build's ``DIGEST_INDEX``, so unchanged images
+    are not read again; when every variant exists only image headers are
+    read and no worker process is started. Variants no current image uses
+    are removed (see ``prune_variants``).
+
+    Args:
+        slides (List[Dict[str, Any]]): List of slide dictionaries.
+        destination_images_folder (str): Output images folder.
+        widths (Sequence[int]): Target widths in pixels; the largest is the
+            largest size the image is ever displayed at.
+        formats (Sequence[str]): Modern formats to emit ("webp", "avif").
+        jobs (Optional[int]): Number of worker processes (default: number of CPUs).
+        store (Optional[ImageStore]): Image store whose digest memo is reused (e.g. across watch rebuilds).
+
+    Returns:
+        int: Number of distinct images processed.
+    """
+    if not pillow_available():
+        print("Pillow is not installed; skipping image optimization (pip install Pillow).")
+        return 0
+
+    from PIL import features
+    supported = [fmt for fmt in formats if features.check(fmt)]
+    for fmt in formats:
+        if fmt not in supported:
+            print(f"Pillow has no '{fmt}' support; skipping {fmt} variants.")
+
+    sources: Dict[str, List[Dict[str, Any]]] = {}
+    # Copied images are never pruned, even if their names look like variants
+    keep = set()
+    for slide in slides:
+        image = slide.get("image-file") or slide.get("image")
+        if not image:
+            continue
+        keep.add(os.path.basename(image))
+        if not image.lower().endswith(OPTIMIZABLE_EXTENSIONS):
+            continue
+        source_path = os.path.join(destination_images_folder, os.path.basename(image))
+        if os.path.isfile(source_path):
+            sources.setdefault(source_path, []).append(slide)
+
+    with contextlib.suppress(OSError):
+        os.remove(os.path.join(destination_images_folder, LEGACY_DIGEST_INDEX))
+    if not sources:
+        prune_variants(destination_images_folder, keep)
+        return 0
+
+    if store is None:
+        store = ImageStore()
+    index_path = os.path.join(os.path.dirname(os.path.abspath(destination_images_folder)), DIGEST_INDEX)
+    store.load_digests(index_path)
+    paths = list(sources)
+    digests = {path: store.digest(path)[:12] for path in paths}
+    store.save_digests(index_path, paths)
+
+    infos = {path: process_image(path, destination_images_folder, tuple(widths), tuple(supported),
+                                 digests[path], existing_only=True) for path in paths}
+    missing = [path for path, info in infos.items() if info is None]
+    if missing:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = executor.map(process_image, missing, [destination_images_folder] * len(missing),
+                                   [tuple(widths)] * len(missing), [tuple(supported)] * len(missing),
+                                   [digests[path] for path in missing])
+            infos.update(zip(missing, results))
+
+    for source_path, info in infos.items():
+        keep.update(variant_names(info))
+        for slide in sources[source_path]:
+            slide["image-info"] = info
+    pruned = prune_variants(destination_images_folder, keep)
+
+    print(f"Optimized {len(paths)} image(s) into responsive variants ({len(missing)} encoded"
+          + (f", {pruned} stale variant(s) removed)." if pruned else ")."))
+    return len(paths)
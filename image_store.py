@@ -0,0 +1,203 @@
+# image_store.py
+import errno
+import hashlib
+import json
+import os
+import shutil
+from typing import Dict, Iterable, Optional, Tuple
+
+LINK_MODES = ('hardlink', 'reflink', 'copy')
+
+# FICLONE ioctl request number (Linux, btrfs/xfs/...): clone a whole file
+FICLONE = 0x40049409
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def reflink(src: str, dest: str) -> None:
+    """
+    Creates ``dest`` as a copy-on-write clone of ``src``.
+
+    Raises:
+        OSError: If the platform or file system does not support reflinks.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.EOPNOTSUPP, "reflinks are not supported on this platform")
+    with open(src, "rb") as s, open(dest, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            os.remove(dest)
+            raise
+    shutil.copystat(src, dest)
+
+
+class ImageCopyStats:
+    """Counters describing what an image sync did."""
+
+    def __init__(self):
+        self.copied = 0
+        self.linked = 0
+        self.skipped = 0
+        self.bytes_copied = 0
+        self.bytes_saved = 0
+
+    def summary(self) -> str:
+        return (f"{self.copied} copied, {self.linked} linked, {self.skipped} up to date; "
+                f"{self.bytes_copied / 1e6:.1f} MB written, {self.bytes_saved / 1e6:.1f} MB saved")
+
+
+class ImageStore:
+    """
+    Places image files into output folders without copying identical bytes twice.
+
+    A file is skipped when the destination already matches it by size and
+    mtime, or by content hash. Otherwise, with a shared ``store_dir``, the file
+    is added once to a content-addressed store (``<store>/ab/abcdef....png``)
+    and linked from there into each output folder. Without a store, identical
+    images within a build are linked to the first copy.
+
+    Args:
+        store_dir (Optional[str]): Shared content-addressed store, or None.
+        link_mode (str): "hardlink", "reflink" or "copy". Linking falls back
+            to copying when the file system does not support it.
+    """
+
+    def __init__(self, store_dir: Optional[str] = None, link_mode: str = 'hardlink'):
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unsupported link mode '{link_mode}'. Use one of: {', '.join(LINK_MODES)}.")
+        self.store_dir = store_dir
+        self.link_mode = link_mode
+        self.stats = ImageCopyStats()
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self._placed: Dict[str, str] = {}  # digest -> destination already written in this build
+        if store_dir:
+            os.makedirs(store_dir, exist_ok=True)
+
+    def digest(self, path: str) -> str:
+        """Returns the SHA-256 of a file, memoized by path, size and mtime."""
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        digest = self._digests.get(key)
+        if digest is None:
+            h = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    h.update(chunk)
+            digest = h.hexdigest()
+            self._digests[key] = digest
+        return digest
+
+    def load_digests(self, index_path: str) -> None:
+        """
+        Seeds the digest memo from an index written by ``save_digests``.
+
+        Entries only match files whose size and mtime are unchanged, so a
+        stale or foreign index costs nothing but a miss.
+        """
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        for path, (size, mtime_ns, digest) in entries.items():
+            self._digests.setdefault((path, size, mtime_ns), digest)
+
+    def save_digests(self, index_path: str, paths: Iterable[str]) -> None:
+        """Writes the memoized digests of ``paths`` so that the next build can skip hashing them."""
+        entries = {}
+        for path in paths:
+            st = os.stat(path)
+            key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+            if key in self._digests:
+                entries[key[0]] = [key[1], key[2], self._digests[key]]
+        tmp = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp, index_path)
+
+    def _stored_path(self, digest: str, src: str) -> str:
+        ext = os.path.splitext(src)[1].lower()
+        return os.path.join(self.store_dir, digest[:2], digest + ext)
+
+    def _add_to_store(self, src: str, digest: str) -> str:
+        stored = self._stored_path(digest, src)
+        if not os.path.isfile(stored):
+            os.makedirs(os.path.dirname(stored), exist_ok=True)
+            # Write under a temporary name so that concurrent builds never see a partial file
+            tmp = f"{stored}.{os.getpid()}.tmp"
+            shutil.copy2(src, tmp)
+            os.replace(tmp, stored)
+            self.stats.bytes_copied += os.path.getsize(stored)
+        return stored
+
+    def _link(self, src: str, dest: str) -> bool:
+        """Links ``src`` to ``dest``; returns False when a plain copy had to be made."""
+        if self.link_mode == 'hardlink':
+            try:
+                os.link(src, dest)
+                return True
+            except OSError:
+                pass
+        elif self.link_mode == 'reflink':
+            try:
+                reflink(src, dest)
+                return True
+            except OSError:
+                pass
+        shutil.copy2(src, dest)
+        return False
+
+    def sync(self, src: str, dest: str) -> str:
+        """
+        Makes ``dest`` hold the contents of ``src``.
+
+        Args:
+            src (str): Source image path.
+            dest (str): Destination path inside the output folder.
+
+        Returns:
+            str: "skipped", "linked" or "copied".
+        """
+        src_stat = os.stat(src)
+        size = src_stat.st_size
+        try:
+            dest_stat = os.stat(dest)
+        except FileNotFoundError:
+            dest_stat = None
+
+        if dest_stat is not None and dest_stat.st_size == size:
+            if int(dest_stat.st_mtime) == int(src_stat.st_mtime) or self.digest(dest) == self.digest(src):
+                self.stats.skipped += 1
+                self.stats.bytes_saved += size
+                return "skipped"
+
+        digest = self.digest(src)
+        if self.store_dir:
+            origin = self._add_to_store(src, digest)
+        else:
+            origin = self._placed.get(digest)
+
+        # Never write through an existing file: it may be a hardlink into the store
+        if dest_stat is not None:
+            os.remove(dest)
+
+        if origin and os.path.isfile(origin):
+            linked = self._link(origin, dest)
+        else:
+            shutil.copy2(src, dest)
+            linked = False
+
+        if linked:
+            self.stats.linked += 1
+            self.stats.bytes_saved += size
+            action = "linked"
+        else:
+            self.stats.copied += 1
+            self.stats.bytes_copied += size
+            action = "copied"
+        self._placed.setdefault(digest, dest)
+        return action
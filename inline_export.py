@@ -0,0 +1,208 @@
+# inline_export.py
+import base64
+import json
+import mimetypes
+import os
+import re
+from typing import List, Dict, Any, Optional
+
+# Vendored Chart.js build used instead of the CDN when exporting a self-contained file
+VENDORED_CHART_JS = os.path.join("static", "vendor", "chart.umd.min.js")
+
+CDN_SCRIPT_PATTERN = re.compile(r'<script src="https://cdn\.jsdelivr\.net/npm/chart\.js[^"]*"></script>')
+STYLESHEET_PATTERN = re.compile(r'<link(?P<attrs>[^>]*?)\srel="stylesheet"(?P<rest>[^>]*?)\shref="(?P<href>[^":]+)"[^>]*>')
+LOCAL_SCRIPT_PATTERN = re.compile(r'<script src="(?P<src>[^":]+)"></script>')
+ID_PATTERN = re.compile(r'\sid="([^"]+)"')
+
+CSS_STRING_PATTERN = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')')
+
+
+def minify_css(css: str) -> str:
+    """
+    Removes comments and insignificant whitespace from a stylesheet.
+
+    Quoted strings (e.g. ``content: ' > '``) are left untouched.
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    parts = CSS_STRING_PATTERN.split(css)
+    for i in range(0, len(parts), 2):  # even indices are outside strings
+        text = re.sub(r'\s+', ' ', parts[i])
+        text = re.sub(r'\s*([{};,>])\s*', r'\1', text)
+        parts[i] = re.sub(r':\s+', ':', text)
+    return ''.join(parts).replace(';}', '}').strip()
+
+
+def minify_js(source: str) -> str:
+    """
+    Removes comments, indentation and blank lines from a script.
+
+    Newlines are kept so that automatic semicolon insertion behaves exactly as
+    in the original; string and template literals are copied verbatim.
+    """
+    out: List[str] = []
+    i = 0
+    n = len(source)
+    while i < n:
+        c = source[i]
+        if c in '"\'`':
+            j = i + 1
+            while j < n and source[j] != c:
+                if source[j] == '\\':
+                    j += 1
+                j += 1
+            out.append(source[i:j + 1])
+            i = j + 1
+        elif source.startswith('//', i):
+            j = source.find('\n', i)
+            i = n if j < 0 else j
+        elif source.startswith('/*', i):
+            j = source.find('*/', i + 2)
+            i = n if j < 0 else j + 2
+        elif c in ' \t':
+            j = i
+            while j < n and source[j] in ' \t':
+                j += 1
+            # Collapse runs of blanks, dropping them at the start and end of lines
+            if out and out[-1] != '\n' and j < n and source[j] not in '\r\n':
+                out.append(' ')
+            i = j
+        elif c in '\r\n':
+            if out and out[-1] != '\n':
+                out.append('\n')
+            i += 1
+        else:
+            out.append(c)
+            i += 1
+    return ''.join(out).strip()
+
+
+def data_uri(path: str) -> str:
+    """Encodes a file as a base64 ``data:`` URI."""
+    mime = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    with open(path, "rb") as f:
+        encoded = base64.b64encode(f.read()).decode("ascii")
+    return f"data:{mime};base64,{encoded}"
+
+
+def inline_assets(html: str, source_root: str = ".", stylesheets: Optional[Dict[str, str]] = None) -> str:
+    """
+    Replaces local stylesheet links and scripts in a template fragment by inline, minified copies.
+
+    The Chart.js CDN script is replaced by the vendored copy when it exists;
+    otherwise the CDN reference is kept and a warning is printed (builds of
+    decks with charts stop before this, see ``main.build_presentation``).
+
+    Args:
+        html (str): Template fragment (e.g. the document head).
+        source_root (str): Folder the asset paths are relative to.
+        stylesheets (Optional[Dict[str, str]]): CSS generated at build time, by link href,
+            used instead of reading the file (e.g. the theme bundle).
+
+    Returns:
+        str: The fragment with assets inlined.
+    """
+    def replace_stylesheet(match: re.Match) -> str:
+        href = match.group("href")
+        if stylesheets and href in stylesheets:
+            css = stylesheets[href]
+        else:
+            path = os.path.join(source_root, href)
+            if not os.path.isfile(path):
+                return match.group(0)
+            with open(path, "r", encoding="utf-8") as f:
+                css = f.read()
+        css = minify_css(css).replace("</style", "<\\/style")
+        id_match = ID_PATTERN.search(match.group(0))
+        id_attr = f' id="{id_match.group(1)}"' if id_match else ""
+        return f"<style{id_attr}>{css}</style>"
+
+    def replace_script(match: re.Match) -> str:
+        path = os.path.join(source_root, match.group("src"))
+        if not os.path.isfile(path):
+            return match.group(0)
+        with open(path, "r", encoding="utf-8") as f:
+            script = minify_js(f.read())
+        return "<script>" + script.replace("</script", "<\\/script") + "</script>"
+
+    def replace_chart_js(match: re.Match) -> str:
+        path = os.path.join(source_root, VENDORED_CHART_JS)
+        if not os.path.isfile(path):
+            print(f"Vendored Chart.js not found at '{VENDORED_CHART_JS}'; keeping the CDN script "
+                  "(charts will need network access).")
+            return match.group(0)
+        with open(path, "r", encoding="utf-8") as f:
+            script = f.read()
+        return "<script>" + script.replace("</script", "<\\/script") + "</script>"
+
+    html = STYLESHEET_PATTERN.sub(replace_stylesheet, html)
+    html = CDN_SCRIPT_PATTERN.sub(replace_chart_js, html)
+    return LOCAL_SCRIPT_PATTERN.sub(replace_script, html)
+
+
+def embed_images(
+    slides: List[Dict[str, Any]],
+    destination_images_folder: str,
+    max_bytes: Optional[int] = None,
+    image_data: Optional[Dict[str, str]] = None
+) -> int:
+    """
+    Embeds slide images into the slides as data URIs.
+
+    Runs after the images were copied (and optionally optimized). Images whose
+    file is larger than ``max_bytes`` stay external. Responsive variants are
+    reduced to their fallback ``src`` so that only one copy is embedded.
+
+    Each file is encoded once. With ``image_data``, a file shown on several
+    slides is stored there under an image ID that the slides reference
+    (``image-id``), so its data URI appears once in the page instead of once
+    per slide; the browser runtime fills in the ``src`` from the
+    ``#image-data`` block (see ``generate_image_data_block``).
+
+    Args:
+        slides (List[Dict[str, Any]]): List of slide dictionaries.
+        destination_images_folder (str): Output images folder.
+        max_bytes (Optional[int]): Size limit for embedding, or None for no limit.
+        image_data (Optional[Dict[str, str]]): Receives the data URIs of shared images by image ID.
+
+    Returns:
+        int: Number of images embedded.
+    """
+    embeds = []
+    uses: Dict[str, int] = {}
+    for slide in slides:
+        image_info = slide.get("image-info")
+        if image_info:
+            path = os.path.join(destination_images_folder, os.path.basename(image_info["src"]))
+        elif slide.get("image-file") or slide.get("image"):
+            path = os.path.join(destination_images_folder, os.path.basename(slide.get("image-file") or slide["image"]))
+        else:
+            continue
+        if path not in uses:
+            if not os.path.isfile(path) or (max_bytes is not None and os.path.getsize(path) > max_bytes):
+                continue
+            uses[path] = 0
+        uses[path] += 1
+        embeds.append((slide, path))
+
+    uris: Dict[str, str] = {}
+    image_ids: Dict[str, str] = {}
+    for slide, path in embeds:
+        image_info = slide.get("image-info")
+        if image_data is not None and uses[path] > 1:
+            if path not in image_ids:
+                image_ids[path] = f"img{len(image_data)}"
+                image_data[image_ids[path]] = data_uri(path)
+            info = {"image-id": image_ids[path]}
+        else:
+            if path not in uris:
+                uris[path] = data_uri(path)
+            info = {"src": uris[path]}
+        if image_info:
+            info.update({key: image_info[key] for key in ("width", "height") if key in image_info})
+        slide["image-info"] = info
+    return len(embeds)
+
+
+def generate_image_data_block(image_data: Dict[str, str]) -> str:
+    """Generates the JSON block holding the data URIs of the images shared by several slides."""
+    return f'<script type="application/json" id="image-data">{json.dumps(image_data, separators=(",", ":"))}</script>'
@@ -1,93 +1,181 @@
 # main.py
+import time
+_import_start = time.perf_counter()  # measured for --profile_startup
+
 import argparse
 import os
-import json
-import yaml
-import shutil
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Sequence
 from helper import (
     sanitize_title,
     generate_toc,
+    render_slides,
     generate_slide_content,
+    generate_chart_data_block,
     copy_project_images,
+    copy_if_changed,
     generate_breadcrumbs
 )
+from render_cache import RenderCache
+from image_store import ImageStore, LINK_MODES
+from template_engine import load_template
+from metrics import BuildMetrics
+from theme_bundle import BUNDLE_NAME, DEFAULT_THEME, discover_themes
+# Feature modules (configuration loading, validation, chart data, image optimization,
+# theme compilation, inline export) are imported by the code paths that use them
 
-def load_configuration(config_path: str) -> Dict[str, Any]:
-    """
-    Loads presentation configuration from a JSON or YAML file.
-    
-    Args:
-        config_path (str): Path to the configuration file.
-    
-    Returns:
-        Dict[str, Any]: Parsed configuration data.
-    """
-    with open(config_path, 'r') as f:
-        if config_path.endswith('.json'):
-            return json.load(f)
-        elif config_path.endswith(('.yaml', '.yml')):
-            return yaml.safe_load(f)
-        else:
-            raise ValueError("Unsupported configuration file format. Use JSON or YAML.")
+_import_ms = (time.perf_counter() - _import_start) * 1000
+
+TEMPLATE_PATH = os.path.join("templates", "core.html")
+
+# Client injected into the page by watch mode; reloads when the server
+# signals a rebuild and restores the slide that was being viewed.
+LIVE_RELOAD_SNIPPET = """<script>
+(() => {
+    const saved = sessionStorage.getItem('livereload-slide');
+    if (saved !== null) {
+        sessionStorage.removeItem('livereload-slide');
+        document.addEventListener('DOMContentLoaded', () => navigateTo(parseInt(saved, 10)));
+    }
+    const source = new EventSource('/__livereload');
+    source.onmessage = () => {
+        const slides = Array.from(document.querySelectorAll('.slide'));
+        sessionStorage.setItem('livereload-slide', Math.max(0, slides.findIndex(s => s.classList.contains('active'))));
+        location.reload();
+    };
+})();
+</script>
+"""
 
 def generate_html_presentation(
     title: str,
     slides: List[Dict[str, Any]],
     template_path: str,
     output_folder: str,
-    theme_css: str
+    theme: str,
+    cache: Optional[RenderCache] = None,
+    live_reload: bool = False,
+    inline: bool = False,
+    lazy_slides: bool = False,
+    template_slots: Optional[Dict[str, str]] = None,
+    metrics: Optional[BuildMetrics] = None,
+    prune_css: bool = False,
+    image_data: Optional[Dict[str, str]] = None
 ) -> str:
     """
     Generates the main presentation HTML file using the core template.
+
+    The template is compiled once into literal chunks and ``{{slot}}``
+    placeholders and written in a single pass: the slides are streamed
+    straight to disk, and text inside slides is never treated as a slot.
     
     Args:
         title (str): The title of the presentation.
         slides (List[Dict[str, Any]]): A list of slide dictionaries.
         template_path (str): Path to the core HTML template.
         output_folder (str): Path to the output directory.
-        theme_css (str): The CSS file name for the selected theme.
+        theme (str): Name of the selected theme; every theme is in the bundle, this one is shown first.
+        cache (Optional[RenderCache]): Cache of rendered slide fragments to reuse.
+        live_reload (bool): Inject the live-reload client used by watch mode.
+        inline (bool): Inline minified CSS, JS and the vendored Chart.js into the HTML.
+        lazy_slides (bool): Write inactive slides as inert templates materialized on demand.
+        template_slots (Optional[Dict[str, str]]): Values of extra slots used by custom templates.
+        metrics (Optional[BuildMetrics]): Receives per-slide render times and the bytes written.
+        prune_css (bool): Link a copy of core.css without the rules the deck never uses, loaded
+            asynchronously, and inline the rules needed for the title slide (see ``css_prune``).
+        image_data (Optional[Dict[str, str]]): Data URIs of embedded images shared by several
+            slides, written once at the end of the body (see ``inline_export.embed_images``).
     
     Returns:
         str: Filename of the generated main presentation HTML.
     """
-    # Read the core HTML template as string
-    with open(template_path, "r", encoding="utf-8") as f:
-        html_content = f.read()
-
-    # Generate TOC and slides
-    toc_html = generate_toc(slides)
-    # Generate Breadcrumbs HTML
-    breadcrumbs_html = generate_breadcrumbs(slides)
-    # Generate slides
-    slides_html = generate_slide_content(slides)
-
-    # Replace placeholders
-    html_content = html_content.replace("{{title}}", title)
-    html_content = html_content.replace("{{toc}}", toc_html)
-    html_content = html_content.replace("{{slides}}", slides_html)
-    html_content = html_content.replace("{{breadcrumbs}}", breadcrumbs_html)
-    html_content = html_content.replace("{{theme_css}}", theme_css)
+    template = load_template(template_path)
+    if live_reload:
+        template = template.insert_before("</body>", LIVE_RELOAD_SNIPPET)
+    # Templates without a chart data slot get the block at the end of the body
+    template = template.with_slot_before("</body>", "chart_data")
+    themes = discover_themes()
+    if inline:
+        from inline_export import inline_assets
+        from theme_bundle import compile_theme_bundle
+        # The theme slot sits inside the stylesheet link, so it is resolved before inlining;
+        # the bundle is compiled in memory as nothing is written next to the HTML
+        bundle = {f"static/css/themes/{BUNDLE_NAME}": compile_theme_bundle(themes, theme)}
+        template = template.bind({"theme_css": BUNDLE_NAME}).map_literals(
+            lambda chunk: inline_assets(chunk, stylesheets=bundle))
+    if image_data:
+        from inline_export import generate_image_data_block
+        template = template.with_slot_before("</body>", "image_data")
+
+    charts: Dict[str, Any] = {}
+    values = dict(template_slots or {})
+    values.update({
+        "title": title,
+        "toc": generate_toc(slides),
+        "breadcrumbs": generate_breadcrumbs(slides),
+        "theme_css": BUNDLE_NAME,
+        "theme": theme,
+        "themes": " ".join(themes),
+        "slides": lambda out: render_slides(slides, out, cache=cache, lazy=lazy_slides, charts=charts, metrics=metrics),
+        # Chart data is only known once the slides are rendered
+        "chart_data": lambda out: out.write(generate_chart_data_block(charts) if charts else ""),
+    })
+    if image_data:
+        values["image_data"] = generate_image_data_block(image_data)
 
-    # Write the main presentation HTML to the output folder
     sanitized_title = sanitize_title(title)
+    pruned_href = None
+    if prune_css and not inline:
+        from css_prune import CORE_CSS, PRUNED_CSS_FOLDER, links_core_css, runtime_tokens, critical_css, defer_stylesheet
+        if links_core_css(template):
+            with open(CORE_CSS, "r", encoding="utf-8") as f:
+                core_css = f.read()
+            runtime = runtime_tokens()
+            # What is visible before any navigation: the page chrome and the title slide
+            above_fold = list(template.chunks) + [values["toc"], values["breadcrumbs"], generate_slide_content(slides[:1])]
+            critical = critical_css(core_css, above_fold)
+            pruned_href = f"{PRUNED_CSS_FOLDER}/{sanitized_title}.css"
+            template = template.map_literals(lambda chunk: defer_stylesheet(chunk, pruned_href, critical))
+        else:
+            print(f"--prune_css: the template does not link '{CORE_CSS}'; keeping the stylesheet as it is.")
+
+    # Write the main presentation HTML to the output folder
     main_presentation_filename = f"{sanitized_title}.html"
     output_path = os.path.join(output_folder, main_presentation_filename)
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+        template.render(f, values)
+    if metrics is not None:
+        metrics.add("bytes written", os.path.getsize(output_path))
+
+    if pruned_href is not None:
+        # Rules are kept for every class and ID of the written page, lazy slides included
+        from css_prune import write_pruned_css
+        pruned = write_pruned_css(core_css, output_path, os.path.join(output_folder, pruned_href), runtime)
+        if metrics is not None:
+            metrics.add("bytes written", len(pruned.encode("utf-8")))
+        print(f"Pruned core CSS from {len(core_css) / 1e3:.1f} kB to {len(pruned) / 1e3:.1f} kB "
+              f"({len(critical) / 1e3:.1f} kB inlined as critical CSS).")
     print(f"Main presentation saved to {output_path}")
     return main_presentation_filename
 
-def copy_static_files(output_folder: str):
+def count_copy(metrics: Optional[BuildMetrics], source_path: str) -> None:
+    """Records one copied file and its size."""
+    if metrics is not None:
+        metrics.add("files")
+        metrics.add("bytes written", os.path.getsize(source_path))
+
+def copy_static_files(output_folder: str, metrics: Optional[BuildMetrics] = None, core_css: bool = True):
     """
     Copies static files (CSS and JS) to the output directory.
     
     Args:
         output_folder (str): Path to the output directory.
+        metrics (Optional[BuildMetrics]): Counts the files copied; per-file lines are then only printed in verbose mode.
+        core_css (bool): Copy core.css; pruned builds link their own copy of it instead.
     
     Returns:
         None
     """
+    detail = metrics.detail if metrics is not None else print
     # Define source and destination paths
     source_css_folder = "static/css"
     source_js_folder = "static/js"
@@ -103,552 +191,234 @@ def copy_static_files(output_folder: str):
     # Copy core.css
     core_css_source = os.path.join(source_css_folder, "core.css")
     core_css_dest = os.path.join(dest_css_folder, "core.css")
-    if os.path.isfile(core_css_source):
-        shutil.copy(core_css_source, core_css_dest)
-        print(f"Copied core CSS to {core_css_dest}")
-    else:
+    if not os.path.isfile(core_css_source):
         print(f"Core CSS file not found at {core_css_source}.")
         exit(1)
+    if core_css and copy_if_changed(core_css_source, core_css_dest):
+        count_copy(metrics, core_css_source)
+        detail(f"Copied core CSS to {core_css_dest}")
 
     # Copy script.js
     script_js_source = os.path.join(source_js_folder, "script.js")
     script_js_dest = os.path.join(dest_js_folder, "script.js")
     if os.path.isfile(script_js_source):
-        shutil.copy(script_js_source, script_js_dest)
-        print(f"Copied JavaScript file to {script_js_dest}")
+        if copy_if_changed(script_js_source, script_js_dest):
+            count_copy(metrics, script_js_source)
+            detail(f"Copied JavaScript file to {script_js_dest}")
     else:
         print(f"JavaScript file not found at {script_js_source}.")
         exit(1)
 
 
-#######################################################################
+def needs_core_css(template_path: str, prune_css: bool) -> bool:
+    """True unless ``prune_css`` replaces the template's core.css link by a pruned copy."""
+    if not prune_css:
+        return True
+    from css_prune import links_core_css
+    return not links_core_css(load_template(template_path))
+
 
-sample_title = "Presentation System Overview"
-sample_author = "Marc Carnovale"
-sample_date = "November 21, 2024"
-sample_slides = [
-    {
-        "title": "",  # Title slide
-        "html-content": [
-            f"<h1>{sample_title}</h1>",
-            f"<h3>by {sample_author}</h3>",
-            f"<p>{sample_date}</p>"
-        ],
-        "dark": True
-    },
-    {
-        "title": "Introduction",
-        "content": [
-            "<p>Welcome to our advanced Presentation System.</p>",
-            "<p>Designed for maximum flexibility and efficiency, leveraging the power of HTML and modern web technologies.</p>"
-        ],
-        "folds": [
-            {
-                "title": "Core Principles",
-                "content": [
-                    "<p>Emphasis on information density and clarity.</p>",
-                    "<p>Minimalist design inspired by Tufte's philosophy.</p>"
-                ],
-                "folds": [
-                    {
-                        "title": "Information Density",
-                        "content": [
-                            "<p>Maximizing data presentation without clutter.</p>"
-                        ]
-                    },
-                    {
-                        "title": "Clarity",
-                        "content": [
-                            "<p>Ensuring information is easily understandable.</p>"
-                        ]
-                    }
-                ]
-            },
-            {
-                "title": "System Highlights",
-                "content": [
-                    "<p>Robust HTML-based architecture.</p>",
-                    "<p>Seamless integration with LLMs for dynamic slide creation.</p>"
-                ]
-            }
-        ],
-        "image": "introduction_image.png"
-    },
-    {
-        "title": "Features",
-        "content": [
-            "<h2>Key Features</h2>",
-            "<ul>",
-            "<li>Dynamic Resizing and Reflow</li>",
-            "<li>Nested Folds for Hierarchical Information</li>",
-            "<li>Flexible Column and Row Layouts</li>",
-            "<li>Rich Multimedia Support</li>",
-            "<li>Interactive Elements and Charts</li>",
-            "<li>Accessibility Compliance</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Dynamic Resizing",
-                "content": [
-                    "<p>Elegant resizing and reflow capabilities ensure content adapts to various screen sizes.</p>"
-                ]
-            },
-            {
-                "title": "Nested Folds",
-                "content": [
-                    "<p>Organize information hierarchically with collapsible sections.</p>"
-                ]
-            }
-        ],
-        "image": "features_image.png"
-    },
-    {
-        "title": "Flexibility of HTML",
-        "content": [
-            "<h2>Leveraging HTML's Flexibility</h2>",
-            "<p>Our system harnesses the mature and versatile nature of HTML to provide a robust framework for presentations.</p>",
-            "<p>Benefits include:</p>",
-            "<ul>",
-            "<li>Wide compatibility across devices and browsers.</li>",
-            "<li>Extensive multimedia integration.</li>",
-            "<li>Ease of customization and styling.</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Responsive Design",
-                "content": [
-                    "<p>Slides automatically adjust layout for optimal viewing on any device.</p>"
-                ]
-            },
-            {
-                "title": "Multimedia Support",
-                "content": [
-                    "<p>Embed videos, images, charts, and interactive content seamlessly.</p>"
-                ]
-            }
-        ],
-        "image": "html_flexibility.png"
-    },
-    {
-        "title": "Information Density",
-        "content": [
-            "<h2>Maximizing Information Density</h2>",
-            "<p>Inspired by Tufte, our system prioritizes the presentation of rich information without unnecessary distractions.</p>",
-            "<p>Strategies include:</p>",
-            "<ul>",
-            "<li>Minimalist design with ample white space.</li>",
-            "<li>Clear hierarchies through typography and layout.</li>",
-            "<li>Focus on data-driven content.</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Minimalist Design",
-                "content": [
-                    "<p>Clean layouts that emphasize content over decoration.</p>"
-                ]
-            },
-            {
-                "title": "Clear Hierarchies",
-                "content": [
-                    "<p>Use of headings, bullet points, and indentation to organize information.</p>"
-                ]
-            }
-        ],
-        "image": "information_density.png"
-    },
-    {
-        "title": "Current Features",
-        "content": [
-            "<h2>What We've Enabled So Far</h2>",
-            "<ul>",
-            "<li>Nested Folds with Varying Backgrounds</li>",
-            "<li>Flexible Column and Row Configurations</li>",
-            "<li>Interactive Charts and Multimedia Embeds</li>",
-            "<li>Responsive and Accessible Design</li>",
-            "<li>Easy Slide Creation via Dictionary-Based Configuration</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Nested Folds",
-                "content": [
-                    "<p>Create hierarchical content structures with ease.</p>"
-                ]
-            },
-            {
-                "title": "Interactive Charts",
-                "content": [
-                    "<p>Embed dynamic charts to visualize data effectively.</p>"
-                ]
-            }
-        ],
-        "image": "current_features.png"
-    },
-    {
-        "title": "Future Features",
-        "content": [
-            "<h2>Planned Enhancements</h2>",
-            "<ul>",
-            "<li>Real-Time Collaboration Tools</li>",
-            "<li>Advanced Animation and Transition Effects</li>",
-            "<li>Integration with External Data Sources</li>",
-            "<li>Customizable Templates and Themes</li>",
-            "<li>Enhanced Accessibility Features</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Real-Time Collaboration",
-                "content": [
-                    "<p>Enable multiple users to edit and interact with presentations simultaneously.</p>"
-                ]
-            },
-            {
-                "title": "Advanced Animations",
-                "content": [
-                    "<p>Incorporate smooth animations and transitions for engaging presentations.</p>"
-                ]
-            },
-            {
-                "title": "Data Integration",
-                "content": [
-                    "<p>Connect to APIs and databases for dynamic data-driven slides.</p>"
-                ]
-            }
-        ],
-        "image": "future_features.png"
-    },
-    {
-        "title": "Building Slides with LLMs",
-        "content": [
-            "<h2>Seamless Slide Creation via LLMs</h2>",
-            "<p>Our system is designed to work hand-in-hand with powerful Language Models like ChatGPT, enabling effortless slide generation and customization.</p>",
-            "<p>Advantages include:</p>",
-            "<ul>",
-            "<li>Rapid creation from conversational inputs.</li>",
-            "<li>Easy updates and modifications through dialogue.</li>",
-            "<li>Incorporation of complex data and multimedia with simple instructions.</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Conversational Slide Generation",
-                "content": [
-                    "<p>Generate detailed slides through natural language prompts.</p>"
-                ]
-            },
-            {
-                "title": "Dynamic Content Updates",
-                "content": [
-                    "<p>Modify existing slides by requesting changes in an interactive manner.</p>"
-                ]
-            }
-        ],
-        "image": "llm_integration.png"
-    },
-    {
-        "title": "How It Works",
-        "content": [
-            "<h2>System Architecture</h2>",
-            "<p>Our presentation system leverages a dictionary-based configuration approach, allowing for structured and scalable slide creation.</p>",
-            "<p>Key Components:</p>",
-            "<ul>",
-            "<li>Dictionary Definitions for Slides and Content</li>",
-            "<li>Helper Functions for HTML and CSS Generation</li>",
-            "<li>CSS Framework for Styling and Responsiveness</li>",
-            "<li>JavaScript for Interactivity and Dynamic Features</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Dictionary-Based Configuration",
-                "content": [
-                    "<p>Define slides, content, and layouts using simple Python dictionaries.</p>"
-                ]
-            },
-            {
-                "title": "Helper Functions",
-                "content": [
-                    "<p>Automate the generation of HTML and CSS based on configurations.</p>"
-                ]
-            }
-        ],
-        "image": "system_architecture.png"
-    },
-    {
-        "title": "Use Cases",
-        "content": [
-            "<h2>Applications of Our Presentation System</h2>",
-            "<ul>",
-            "<li>Educational Lectures and Tutorials</li>",
-            "<li>Business Presentations and Reports</li>",
-            "<li>Technical Documentation and Demos</li>",
-            "<li>Interactive Workshops and Webinars</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Educational Use",
-                "content": [
-                    "<p>Create detailed, information-dense slides for effective teaching.</p>"
-                ]
-            },
-            {
-                "title": "Business Applications",
-                "content": [
-                    "<p>Develop professional presentations with dynamic data visualizations.</p>"
-                ]
-            }
-        ],
-        "image": "use_cases.png"
-    },
-    {
-        "title": "Technical Overview",
-        "content": [
-            "<h2>Under the Hood</h2>",
-            "<p>The system is built using modern web technologies to ensure performance, scalability, and ease of use.</p>",
-            "<p>Technologies Used:</p>",
-            "<ul>",
-            "<li>HTML5 and CSS3 for structure and styling.</li>",
-            "<li>JavaScript for interactivity.</li>",
-            "<li>Python for configuration and helper scripts.</li>",
-            "<li>Chart.js for data visualization.</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Front-End Technologies",
-                "content": [
-                    "<p>HTML and CSS provide a robust foundation for responsive design.</p>"
-                ]
-            },
-            {
-                "title": "Back-End Integration",
-                "content": [
-                    "<p>Python scripts automate the generation of slide content and structure.</p>"
-                ]
-            }
-        ],
-        "image": "technical_overview.png"
-    },
-    {
-        "title": "Extensibility",
-        "content": [
-            "<h2>Highly Extensible and Customizable</h2>",
-            "<p>Our system is designed to be easily extended to meet diverse presentation needs.</p>",
-            "<p>Customization Options:</p>",
-            "<ul>",
-            "<li>Custom CSS Themes and Styles</li>",
-            "<li>Integration with Third-Party APIs</li>",
-            "<li>Adding New Content Types and Components</li>",
-            "<li>Localization and Internationalization Support</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Custom Themes",
-                "content": [
-                    "<p>Apply different color schemes and layouts to match branding.</p>"
-                ]
-            },
-            {
-                "title": "API Integrations",
-                "content": [
-                    "<p>Connect to external data sources for real-time content updates.</p>"
-                ]
-            }
-        ],
-        "image": "extensibility.png"
-    },
-    {
-        "title": "Accessibility",
-        "content": [
-            "<h2>Commitment to Accessibility</h2>",
-            "<p>Ensuring that our presentation system is usable by everyone, including those with disabilities.</p>",
-            "<p>Accessibility Features:</p>",
-            "<ul>",
-            "<li>Keyboard Navigable Interfaces</li>",
-            "<li>Screen Reader Compatibility</li>",
-            "<li>High Contrast Modes</li>",
-            "<li>ARIA Attributes for Enhanced Semantics</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Keyboard Navigation",
-                "content": [
-                    "<p>All interactive elements are accessible via keyboard controls.</p>"
-                ]
-            },
-            {
-                "title": "Screen Reader Support",
-                "content": [
-                    "<p>Semantic HTML and ARIA attributes improve compatibility with assistive technologies.</p>"
-                ]
-            }
-        ],
-        "image": "accessibility.png"
-    },
-    {
-        "title": "Multimedia Support",
-        "content": [
-            "<h2>Rich Multimedia Integration</h2>",
-            "<p>Enhance your presentations with a variety of multimedia elements, such as:",
-            "<ul>",
-            "<li>Images and Galleries</li>",
-            "<li>Embedded Videos and Audio</li>",
-            "<li>Animations and Transitions</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Interactive Visuals",
-                "content": [
-                    "<p>Use tools like Chart.js to create engaging data visualizations.</p>"
-                ],
-                "folds": [
-                    {
-                        "title": "Data Visualization",
-                        "chart": {
-                            "type": "bar",
-                            "data": {
-                                "labels": ["January", "February", "March", "April", "May", "June"],
-                                "datasets": [{
-                                    "label": "Sales",
-                                    "data": [50, 60, 70, 80, 65, 75],
-                                    "backgroundColor": "rgba(54, 162, 235, 0.2)",
-                                    "borderColor": "rgba(54, 162, 235, 1)",
-                                    "borderWidth": 1
-                                }]
-                            },
-                            "options": {
-                                "scales": {
-                                    "x": {
-                                        "ticks": {
-                                            "maxRotation": 45,
-                                            "minRotation": 45
-                                        }
-                                    },
-                                    "y": {"beginAtZero": True}
-                                }
-                            }
-                        }
-                    }
-                ]
-            },
-            {
-                "title": "Embedded Media",
-                "content": [
-                    "<p>Seamlessly incorporate videos and audio clips for dynamic content delivery.</p>"
-                ]
-            }
-        ],
-        "image": "multimedia_support.png"
-    },    
-    {
-        "title": "Newsprint Tiling Example",
-        "content": [
-            {
-                "rows": {
-                    "number": 2,
-                    "content": [
-                        {
-                            "columns": {
-                                "number": 3,
-                                "size": ["30%", "40%", "30%"],
-                                "content": [
-                                    {
-                                        "html-content": "<h3>Headlines</h3><p>Latest news updates.</p>"
-                                    },
-                                    {
-                                        "html-content": "<h3>Top Stories</h3><p>In-depth analysis of current events.</p>"
-                                    },
-                                    {
-                                        "html-content": "<h3>Weather</h3><p>Today's weather forecast.</p>"
-                                    }
-                                ]
-                            }
-                        },
-                        {
-                            "columns": {
-                                "number": 2,
-                                "size": ["50%", "50%"],
-                                "content": [
-                                    "Advertising Space",
-                                    "Sponsored Content"
-                                ]
-                            }
-                        }
-                    ]
-                }
-            },
-            {
-                "title": "Additional Content",
-                "html-content": "<p>Additional content below the tiling layout, such as editor's note or contact information.</p>"
-            }
-        ],
-        "image": "newsprint_example_image.png"
-    },
-    {
-        "title": "Performance Metrics",
-        "content": [
-            "<h2>System Performance</h2>",
-            "<p>Optimized for fast load times and smooth interactions.</p>",
-            "<p>Key Metrics:</p>",
-            "<ul>",
-            "<li>Average Slide Load Time: <strong>200ms</strong></li>",
-            "<li>Responsive Design Efficiency: <strong>High</strong></li>",
-            "<li>Scalability: Supports presentations with up to <strong>100 slides</strong></li>",
-            "<li>Resource Utilization: Minimal CPU and Memory usage</li>",
-            "</ul>"
-        ],
-        "folds": [
-            {
-                "title": "Load Times",
-                "content": [
-                    "<p>Slides load almost instantaneously, ensuring a seamless viewing experience.</p>"
-                ]
-            },
-            {
-                "title": "Scalability",
-                "content": [
-                    "<p>Efficiently handles large presentations without performance degradation.</p>"
-                ]
-            }
-        ],
-        "image": "performance_metrics.png"
-    },
-    {
-        "title": "Conclusion",
-        "content": [
-            "<h2>Why Choose Our Presentation System?</h2>",
-            "<ul>",
-            "<li>Unparalleled Flexibility and Customization</li>",
-            "<li>High Information Density with Clarity</li>",
-            "<li>Seamless Integration with Modern Technologies</li>",
-            "<li>Accessible and Inclusive Design</li>",
-            "<li>Future-Proof and Extensible Architecture</li>",
-            "</ul>",
-            "<p>Empower your presentations with a system built for clarity, efficiency, and scalability.</p>"
-        ],
-        "image": "conclusion_image.png"
-    },
-    {
-        "title": "Thank You",
-        "html-content": [
-            "<h2>Thank You!</h2>",
-            "<p>Your questions?</p>",
-            "<p>Feel free to reach out for further discussions.</p>"
-        ],
+def template_slots_from(config: Dict[str, Any]) -> Dict[str, str]:
+    """Returns the slots a configuration provides to custom templates in addition to the built-in ones."""
+    return {
+        "author": config.get("author", "Unknown Author"),
+        "date": config.get("date", "Unknown Date"),
+        **config.get("template-slots", {}),
     }
-]
 
 
+def resolve_theme(theme: str) -> str:
+    """
+    Resolves a theme name against the themes in static/css/themes/, exiting if none fits.
+
+    Args:
+        theme (str): Theme name, e.g. "dark" or "blue".
+
+    Returns:
+        str: The name of the selected theme.
+    """
+    selected_theme = theme.lower()
+    themes = discover_themes()
+
+    if selected_theme not in themes:
+        print(f"Theme '{selected_theme}' is not recognized. Falling back to '{DEFAULT_THEME}' theme.")
+        selected_theme = DEFAULT_THEME
+
+    # Verify that the selected theme CSS file exists
+    if selected_theme not in themes:
+        print(f"Theme CSS file 'style-{selected_theme}.css' not found in 'static/css/themes/' directory.")
+        print("Available themes:", ', '.join(themes) or "none")
+        exit(1)
+    return selected_theme
+
+def copy_theme_files(output_folder: str, theme: str, metrics: Optional[BuildMetrics] = None,
+                     bundle: Optional[str] = None) -> str:
+    """
+    Resolves the selected theme and writes the theme bundle to the output directory.
+
+    The bundle holds every theme in static/css/themes/, each scoped by the
+    ``data-theme`` attribute of ``<html>``, so the browser switches themes
+    without loading another stylesheet (see ``theme_bundle``).
+
+    Args:
+        output_folder (str): Path to the output directory.
+        theme (str): Theme name, e.g. "dark" or "blue".
+        metrics (Optional[BuildMetrics]): Counts the files written; per-file lines are then only printed in verbose mode.
+        bundle (Optional[str]): Theme bundle compiled for ``theme`` beforehand; compiled here when None.
+
+    Returns:
+        str: The name of the selected theme.
+    """
+    from theme_bundle import write_theme_bundle
+
+    detail = metrics.detail if metrics is not None else print
+    theme = resolve_theme(theme)
+    bundle_path = write_theme_bundle(output_folder, default=theme, bundle=bundle)
+    if bundle_path:
+        count_copy(metrics, bundle_path)
+        detail(f"Wrote theme bundle to '{bundle_path}'.")
+    return theme
+
+def build_presentation(
+    title: str,
+    slides: List[Dict[str, Any]],
+    output_folder: str,
+    images_dir: Optional[str] = None,
+    theme: str = 'dark',
+    cache: Optional[RenderCache] = None,
+    template_path: str = TEMPLATE_PATH,
+    live_reload: bool = False,
+    image_store: Optional[ImageStore] = None,
+    optimize_images: bool = False,
+    image_formats: Optional[Sequence[str]] = None,
+    inline: bool = False,
+    inline_max_image_bytes: Optional[int] = None,
+    lazy_slides: bool = False,
+    data_dir: Optional[str] = None,
+    template_slots: Optional[Dict[str, str]] = None,
+    metrics: Optional[BuildMetrics] = None,
+    prune_css: bool = False,
+    theme_bundle: Optional[str] = None
+) -> str:
+    """
+    Builds a complete presentation: images, static files, theme and HTML.
+
+    Args:
+        title (str): The title of the presentation.
+        slides (List[Dict[str, Any]]): A list of slide dictionaries.
+        output_folder (str): Path to the output directory.
+        images_dir (Optional[str]): Path to the source images directory.
+        theme (str): Theme name, e.g. "dark" or "blue".
+        cache (Optional[RenderCache]): Cache of rendered slide fragments to reuse.
+        template_path (str): Path to the core HTML template.
+        live_reload (bool): Inject the live-reload client used by watch mode.
+        image_store (Optional[ImageStore]): Image store used to place images in the output folder.
+        optimize_images (bool): Emit resized, recompressed responsive image variants (requires Pillow).
+        image_formats (Optional[Sequence[str]]): Modern image formats to emit when optimizing
+            (default: ``image_pipeline.DEFAULT_FORMATS``).
+        inline (bool): Export a single self-contained HTML file.
+        inline_max_image_bytes (Optional[int]): Images above this size stay external when inlining.
+        lazy_slides (bool): Write inactive slides as inert templates materialized on demand.
+        data_dir (Optional[str]): Folder chart data files are relative to (default: current directory).
+        template_slots (Optional[Dict[str, str]]): Values of extra slots used by custom templates.
+        metrics (Optional[BuildMetrics]): Records the phases of the build (default: a verbose
+            recorder, so per-file lines are printed as before).
+        prune_css (bool): Ship only the core CSS rules the deck uses, with the title slide's
+            rules inlined and the rest loaded asynchronously (ignored with ``inline``).
+        theme_bundle (Optional[str]): Theme bundle compiled once for many builds (see ``batch``).
+
+    Returns:
+        str: Filename of the generated main presentation HTML.
+
+    Raises:
+        DeckValidationError: If the slides are malformed (checked before anything is written).
+    """
+    from chart_data import prepare_chart_data
+    from validation import check_slides
+
+    if metrics is None:
+        metrics = BuildMetrics(verbose=True)
+
+    with metrics.phase("validate"):
+        check_slides(slides)
+    if inline:
+        from chart_data import iter_charts
+        from inline_export import VENDORED_CHART_JS
+        # A self-contained export that loads Chart.js from the network would silently lose its charts offline
+        if not os.path.isfile(VENDORED_CHART_JS) and next(iter_charts(slides), None) is not None:
+            print(f"The deck has charts, but the vendored Chart.js '{VENDORED_CHART_JS}' is missing; "
+                  "--inline cannot export them (see static/vendor/README.md).")
+            exit(1)
+    os.makedirs(output_folder, exist_ok=True)
+
+    # Downsample file-backed chart data into binary sidecars
+    with metrics.phase("chart data"):
+        charts, points = prepare_chart_data(slides, data_dir or ".", output_folder)
+        if charts:
+            metrics.add("charts", charts)
+            metrics.add("points", points)
+            print(f"Prepared {charts} chart data file(s) ({points} points).")
+
+    # Copy images to output folder
+    destination_images_folder = os.path.join(output_folder, "images")
+    with metrics.phase("image copy"):
+        copy_project_images(slides, images_dir, destination_images_folder, store=image_store, metrics=metrics)
+    if optimize_images:
+        from image_pipeline import optimize_images as optimize_project_images, DEFAULT_FORMATS
+        with metrics.phase("image optimize"):
+            optimize_project_images(slides, destination_images_folder, formats=image_formats or DEFAULT_FORMATS,
+                                    store=image_store)
+
+    image_data: Optional[Dict[str, str]] = None
+    if inline:
+        from inline_export import embed_images
+        from chart_data import embed_chart_data
+        # Everything goes into the HTML file; no static files are needed next to it
+        with metrics.phase("inline embed"):
+            image_data = {}
+            embedded = embed_images(slides, destination_images_folder, inline_max_image_bytes, image_data)
+            metrics.add("images", embedded)
+            print(f"Embedded {embedded} image(s) as data URIs.")
+            embed_chart_data(slides, output_folder)
+            theme = resolve_theme(theme)
+            if prune_css:
+                print("--prune_css has no effect with --inline; the stylesheet is inlined whole.")
+    else:
+        with metrics.phase("static copy"):
+            # Copy static files (CSS and JS); a pruned build writes its own core CSS
+            copy_static_files(output_folder, metrics, core_css=needs_core_css(template_path, prune_css))
+
+            # Determine the theme and write the theme bundle
+            theme = copy_theme_files(output_folder, theme, metrics, bundle=theme_bundle)
+
+    # Generate HTML presentation
+    with metrics.phase("html write"):
+        return generate_html_presentation(title, slides, template_path, output_folder, theme,
+                                          cache=cache, live_reload=live_reload, inline=inline,
+                                          lazy_slides=lazy_slides, template_slots=template_slots,
+                                          metrics=metrics, prune_css=prune_css,
+                                          image_data=image_data)
+
+
+def default_slides() -> List[Dict[str, Any]]:
+    """Returns the slides of the sample deck, which is only imported when needed."""
+    from sample_deck import sample_slides
+    return sample_slides
+
+
+#######################################################################
+
 
 def main(): 
+    phases = [("imports", _import_ms)]
+    phase_start = time.perf_counter()
+
+    def end_phase(name: str) -> None:
+        nonlocal phase_start
+        now = time.perf_counter()
+        phases.append((name, (now - phase_start) * 1000))
+        phase_start = now
+
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Generate an HTML presentation with theming support.")
     parser.add_argument('--output_dir', type=str, default=None,
@@ -657,24 +427,71 @@ def main():
                         help='Path to the images directory. If not specified, images are assumed to be in the output directory\'s "images/" folder.')
     parser.add_argument('--config', type=str, default=None,
                         help='Path to the presentation configuration file (JSON or YAML).')
-    parser.add_argument('--theme', type=str, default='dark',
-                        choices=['dark', 'blue', 'forest', 'seafoam'],
-                        help='Theme of the presentation. Options: "dark" (default), "blue", "forest", "seafoam".')
+    themes = list(discover_themes())
+    parser.add_argument('--theme', type=str, default=DEFAULT_THEME, choices=themes,
+                        help=f'Theme of the presentation, one of the themes in static/css/themes/: {", ".join(themes)} '
+                             f'(default: {DEFAULT_THEME}). All of them are bundled for switching with Ctrl+Up/Down.')
+    parser.add_argument('--no_config_cache', action='store_true',
+                        help='Always parse the configuration file instead of reusing the cached parse of an unchanged file.')
+    parser.add_argument('--template', type=str, default=TEMPLATE_PATH,
+                        help='HTML template with {{slot}} placeholders (default: templates/core.html).')
+    parser.add_argument('--no_cache', action='store_true',
+                        help='Disable the per-slide render cache and re-render every slide.')
+    parser.add_argument('--cache_max_mb', type=int, default=64,
+                        help='Maximum size of the render cache in megabytes (least recently used slides are evicted).')
+    parser.add_argument('--image_store', type=str, default=None,
+                        help='Shared content-addressed image store; images are linked from it instead of copied.')
+    parser.add_argument('--link_mode', type=str, default='hardlink', choices=LINK_MODES,
+                        help='How images are placed from the store: "hardlink" (default), "reflink" or "copy".')
+    parser.add_argument('--data_dir', type=str, default=None,
+                        help='Folder chart "data-file" entries are relative to. Defaults to the folder of the configuration file.')
+    parser.add_argument('--optimize_images', action='store_true',
+                        help='Resize and recompress slide images into responsive srcset variants (requires Pillow).')
+    parser.add_argument('--image_formats', type=str, default=None,
+                        help='Comma-separated modern formats emitted by --optimize_images, best first, e.g. "avif,webp" (default: webp).')
+    parser.add_argument('--inline', action='store_true',
+                        help='Export a single self-contained HTML file with inlined, minified assets and embedded images.')
+    parser.add_argument('--inline_max_image_kb', type=int, default=None,
+                        help='With --inline, keep images larger than this many kilobytes as external files.')
+    parser.add_argument('--prune_css', action='store_true',
+                        help='Drop core CSS rules for classes the deck never uses, inline the rules of the title slide and load the rest asynchronously.')
+    parser.add_argument('--lazy_slides', action='store_true',
+                        help='Write inactive slides as inert templates that the browser materializes on demand (for very large decks).')
+    parser.add_argument('--watch', action='store_true',
+                        help='Rebuild on changes and serve the presentation with live reload.')
+    parser.add_argument('--port', type=int, default=8000,
+                        help='Port of the local live-reload server used by --watch (default 8000).')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Print a line for every copied file instead of only the build summary.')
+    parser.add_argument('--metrics_json', type=str, default=None,
+                        help='Write phase timings, byte and file counts and per-slide render times to this JSON file.')
+    parser.add_argument('--trace', type=str, default=None,
+                        help='Write the build phases and slide renders as a Chrome trace (chrome://tracing, Perfetto).')
+    parser.add_argument('--profile_startup', action='store_true',
+                        help='Report import and phase timings (use python -X importtime for per-module detail).')
     args = parser.parse_args()
+    end_phase("arguments")
+    metrics = BuildMetrics(verbose=args.verbose)
 
     # Load presentation configuration
+    config_files: List[str] = []
     if args.config:
-        config = load_configuration(args.config)
+        from config_loader import load_configuration
+        with metrics.phase("config load"):
+            config = load_configuration(args.config, use_cache=not args.no_config_cache,
+                                        keep_in_memory=args.watch, files_read=config_files)
+            metrics.add("files", len(config_files))
+            metrics.add("bytes read", sum(os.path.getsize(path) for path in config_files))
         title = config.get("title", "Untitled Presentation")
-        author = config.get("author", "Unknown Author")
-        date = config.get("date", "Unknown Date")
-        slides = config.get("slides", sample_slides)
+        slides = config["slides"] if "slides" in config else default_slides()
+        template_slots = template_slots_from(config)
     else:
         # Default presentation details
+        from sample_deck import sample_title, sample_author, sample_date, sample_slides
         title = sample_title
-        author = sample_author
-        date = sample_date
         slides = sample_slides
+        template_slots = {"author": sample_author, "date": sample_date}
+    end_phase("configuration")
 
     # Determine output directory
     if args.output_dir:
@@ -683,53 +500,72 @@ def main():
         sanitized_title = sanitize_title(title)
         output_folder = os.path.join("output", sanitized_title)
 
-    os.makedirs(output_folder, exist_ok=True)
+    # Per-slide render cache, kept in the output folder
+    cache = None
+    if not args.no_cache:
+        cache = RenderCache(os.path.join(output_folder, ".render_cache"),
+                            max_bytes=args.cache_max_mb * 1024 * 1024)
 
-    # Copy images to output folder
-    destination_images_folder = os.path.join(output_folder, "images")
-    copy_project_images(slides, args.images_dir, destination_images_folder)
+    image_store = ImageStore(args.image_store, args.link_mode)
 
-    # Copy static files (JS)
-    copy_static_files(output_folder)
+    data_dir = args.data_dir
+    if data_dir is None:
+        data_dir = os.path.dirname(os.path.abspath(args.config)) if args.config else "."
 
-    # Determine the theme CSS file
-    theme_mapping = {
-        'dark': 'style-dark.css',
-        'blue': 'style-blue.css',
-        'seafoam': 'style-seafoam.css',
-        'forest': 'style-forest.css',
-    }
+    image_formats = None
+    if args.image_formats:
+        image_formats = [fmt.strip() for fmt in args.image_formats.split(',') if fmt.strip()]
 
-    selected_theme = args.theme.lower()
-    theme_css = theme_mapping.get(selected_theme)
+    from validation import DeckValidationError
 
-    if not theme_css:
-        print(f"Theme '{selected_theme}' is not recognized. Falling back to 'dark' theme.")
-        theme_css = 'style-dark.css'
+    if args.watch:
+        if args.inline:
+            # The live-reload server serves the output folder; a single-file export has nothing to serve
+            print("--inline cannot be combined with --watch; build the export without --watch.")
+            exit(1)
+        from watch import watch_presentation
+        try:
+            watch_presentation(args.config, slides, title, output_folder, args.images_dir, args.theme,
+                               cache=cache, port=args.port, template_path=args.template, image_store=image_store,
+                               data_dir=data_dir, template_slots=template_slots, config_files=config_files,
+                               optimize_images=args.optimize_images, image_formats=image_formats,
+                               lazy_slides=args.lazy_slides, prune_css=args.prune_css, verbose=args.verbose)
+        except DeckValidationError as e:
+            print(e)
+            exit(1)
+        return
 
-    # Verify that the selected theme CSS file exists
-    theme_source_path = os.path.join("static", "css", "themes", theme_css)
-    if not os.path.isfile(theme_source_path):
-        print(f"Theme CSS file '{theme_css}' not found in 'static/css/themes/' directory.")
-        print("Available themes:", ', '.join(theme_mapping.values()))
+    try:
+        build_presentation(title, slides, output_folder, args.images_dir, args.theme, cache=cache,
+                           template_path=args.template, image_store=image_store, optimize_images=args.optimize_images,
+                           image_formats=image_formats,
+                           inline=args.inline,
+                           inline_max_image_bytes=None if args.inline_max_image_kb is None else args.inline_max_image_kb * 1024,
+                           lazy_slides=args.lazy_slides, data_dir=data_dir, template_slots=template_slots,
+                           metrics=metrics, prune_css=args.prune_css)
+    except DeckValidationError as e:
+        print(e)
         exit(1)
+    end_phase("build")
 
-    # Copy the selected theme CSS to the output directory's 'static/css/themes/' folder
-    destination_themes_folder = os.path.join(output_folder, "static", "css", "themes")
-    os.makedirs(destination_themes_folder, exist_ok=True)
-    shutil.copy(theme_source_path, destination_themes_folder)
-    print(f"Copied theme CSS '{theme_css}' to '{destination_themes_folder}'.")
+    if cache is not None:
+        cache.save()
+        print(f"Render cache: {cache.hits} slide(s) reused, {cache.misses} rendered.")
+        end_phase("cache save")
 
-    # Copy alt themes
-    for theme in ["style-dark.css", "style-blue.css", "style-seafoam.css"]:
-        if theme not in os.listdir(destination_images_folder) :
-            theme_source_path = os.path.join("static", "css", "themes", theme)
-            shutil.copy(theme_source_path, destination_themes_folder)
-            print(f"Copied theme CSS '{theme}' to '{destination_themes_folder}'.")
+    print(metrics.summary())
+    if args.metrics_json:
+        metrics.write_json(args.metrics_json)
+        print(f"Build metrics written to {args.metrics_json}")
+    if args.trace:
+        metrics.write_chrome_trace(args.trace)
+        print(f"Build trace written to {args.trace}")
 
-    # Generate HTML presentation
-    template_path = os.path.join("templates", "core.html")
-    generate_html_presentation(title, slides, template_path, output_folder, theme_css)
+    if args.profile_startup:
+        print("Startup profile:")
+        for name, ms in phases:
+            print(f"  {name:<14}{ms:8.1f} ms")
+        print(f"  {'total':<14}{sum(ms for _, ms in phases):8.1f} ms")
 
 if __name__ == "__main__":
     main()
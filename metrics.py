@@ -0,0 +1,127 @@
+# metrics.py
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Iterator
+
+
+class Phase:
+    """A timed build step with the counters recorded while it ran."""
+    __slots__ = ("name", "start_ns", "end_ns", "counts")
+
+    def __init__(self, name: str, start_ns: int):
+        self.name = name
+        self.start_ns = start_ns
+        self.end_ns = start_ns
+        self.counts: Dict[str, int] = {}
+
+    @property
+    def ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+
+class BuildMetrics:
+    """
+    Records where build time goes: phase timings, byte and item counts, and
+    the render time of every slide.
+
+    Recording costs a clock read and a list append per event, so a build
+    always carries one. Per-file progress lines go through ``detail`` and are
+    only printed in verbose mode; ``summary`` gives the compact report.
+
+    Args:
+        verbose (bool): Print per-file progress lines.
+    """
+
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+        self.start_ns = time.perf_counter_ns()
+        self.phases: List[Phase] = []
+        self.counts: Dict[str, int] = {}
+        # (slide index, start, end) of every rendered or cached slide, in ns
+        self.slides: List[tuple] = []
+        self._current: Optional[Phase] = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[Phase]:
+        """Times the enclosed block; counters added meanwhile are attributed to it."""
+        phase = Phase(name, time.perf_counter_ns())
+        outer, self._current = self._current, phase
+        try:
+            yield phase
+        finally:
+            phase.end_ns = time.perf_counter_ns()
+            self._current = outer
+            self.phases.append(phase)
+
+    def add(self, name: str, value: int = 1) -> None:
+        """Adds to a counter, e.g. ``add("bytes written", n)``, for the build and the current phase."""
+        self.counts[name] = self.counts.get(name, 0) + value
+        if self._current is not None:
+            self._current.counts[name] = self._current.counts.get(name, 0) + value
+
+    def detail(self, message: str) -> None:
+        """Prints a per-file progress line in verbose mode."""
+        if self.verbose:
+            print(message)
+
+    def to_dict(self) -> Dict[str, Any]:
+        slide_ms = sorted((end - start) / 1e6 for _, start, end in self.slides)
+        return {
+            "total_ms": round((time.perf_counter_ns() - self.start_ns) / 1e6, 3),
+            "phases": [
+                {"name": phase.name, "ms": round(phase.ms, 3), "counts": phase.counts}
+                for phase in sorted(self.phases, key=lambda p: p.start_ns)
+            ],
+            "counts": self.counts,
+            "slides": {
+                "count": len(slide_ms),
+                "total_ms": round(sum(slide_ms), 3),
+                "p50_ms": round(slide_ms[len(slide_ms) // 2], 3) if slide_ms else 0,
+                "max_ms": round(slide_ms[-1], 3) if slide_ms else 0,
+            },
+        }
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Writes the phases and slides as a Chrome trace (open in chrome://tracing or Perfetto)."""
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "build"}}]
+        for phase in self.phases:
+            events.append({
+                "name": phase.name, "cat": "phase", "ph": "X", "pid": pid, "tid": 0,
+                "ts": (phase.start_ns - self.start_ns) / 1e3, "dur": (phase.end_ns - phase.start_ns) / 1e3,
+                "args": phase.counts,
+            })
+        for index, start, end in self.slides:
+            events.append({
+                "name": f"slide {index}", "cat": "slide", "ph": "X", "pid": pid, "tid": 1,
+                "ts": (start - self.start_ns) / 1e3, "dur": (end - start) / 1e3,
+            })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def summary(self, heading: str = "Build summary:") -> str:
+        """Returns a short report: one line per phase with its counters, then the slowest slides."""
+        lines = [heading]
+        for phase in sorted(self.phases, key=lambda p: p.start_ns):
+            counts = ", ".join(format_count(name, value) for name, value in phase.counts.items())
+            lines.append(f"  {phase.name:<16}{phase.ms:9.1f} ms" + (f"  ({counts})" if counts else ""))
+        if self.slides:
+            slowest = sorted(self.slides, key=lambda s: s[1] - s[2])[:3]
+            slow = ", ".join(f"#{index} {(end - start) / 1e6:.2f} ms" for index, start, end in slowest)
+            lines.append(f"  {len(self.slides)} slide(s); slowest: {slow}")
+        lines.append(f"  {'total':<16}{(time.perf_counter_ns() - self.start_ns) / 1e6:9.1f} ms")
+        return "\n".join(lines)
+
+
+def format_count(name: str, value: int) -> str:
+    """Formats a counter for the summary: "bytes ..." counters in kB/MB ("1.2 MB written"), others as "3 images"."""
+    if name.startswith("bytes"):
+        size = f"{value / 1e6:.1f} MB" if value >= 1e6 else f"{value / 1e3:.1f} kB"
+        return f"{size} {name[6:]}".rstrip()
+    return f"{value} {name}"
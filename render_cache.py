@@ -0,0 +1,187 @@
+# render_cache.py
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Any, Optional, List, Tuple
+
+# Bump whenever the HTML produced for an unchanged slide changes, so that
+# fragments rendered by an older generator are never reused.
+GENERATOR_VERSION = "5"
+
+# Default upper bound for the on-disk cache size (bytes).
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+INDEX_FILENAME = "index.json"
+
+
+def slide_digest(slide: Dict[str, Any]) -> str:
+    """
+    Computes a stable content hash of a slide dictionary.
+
+    Args:
+        slide (Dict[str, Any]): The slide dictionary.
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical JSON form of the slide.
+    """
+    canonical = json.dumps(slide, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """
+    On-disk cache of rendered top-level slide fragments.
+
+    Fragments are stored as individual files in ``cache_dir`` and tracked in a
+    small JSON index holding their size and last use. When the total size
+    exceeds ``max_bytes`` the least recently used fragments are evicted.
+
+    With ``keep_in_memory`` set, fragments are also held in memory so that
+    long-running sessions (watch mode) avoid re-reading them from disk.
+
+    ``cache_dir`` is only created when the first fragment or index is written,
+    so a build that stops at validation leaves nothing behind.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES, keep_in_memory: bool = False):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.keep_in_memory = keep_in_memory
+        self._memory: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._index: Dict[str, List[float]] = {}  # key -> [size, last_used, has_charts]
+        self._dirty = False
+        self._dir_created = False
+        self._load_index()
+
+    def _make_dir(self) -> None:
+        if not self._dir_created:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._dir_created = True
+
+    def _load_index(self) -> None:
+        index_path = os.path.join(self.cache_dir, INDEX_FILENAME)
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == GENERATOR_VERSION:
+            self._index = data.get("entries", {})
+        else:
+            # Generator changed: every stored fragment is stale
+            self._dirty = True
+            for key in data.get("entries", {}):
+                self._remove_fragment(key)
+
+    def _fragment_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.html")
+
+    def _charts_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.charts.json")
+
+    def _remove_fragment(self, key: str) -> None:
+        for path in (self._fragment_path(key), self._charts_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def key(self, slide: Dict[str, Any], index: int, level: int = 0, variant: str = "") -> str:
+        """
+        Builds the cache key of a slide rendered at a given position.
+
+        The position is part of the key because the unique IDs written into
+        the fragment depend on it.
+        """
+        material = f"{GENERATOR_VERSION}:{variant}:{level}:{index}:{slide_digest(slide)}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+    def get(self, key: str) -> Optional[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Returns the cached fragment for ``key`` and the chart data registered
+        while rendering it, or None on a miss.
+        """
+        entry = self._index.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        cached = self._memory.get(key)
+        if cached is not None:
+            entry[1] = time.time()
+            self._dirty = True
+            self.hits += 1
+            return cached
+        try:
+            with open(self._fragment_path(key), "r", encoding="utf-8") as f:
+                html = f.read()
+            charts = None
+            if len(entry) > 2 and entry[2]:
+                with open(self._charts_path(key), "r", encoding="utf-8") as f:
+                    charts = json.load(f)
+        except (OSError, ValueError):
+            del self._index[key]
+            self._dirty = True
+            self.misses += 1
+            return None
+        if self.keep_in_memory:
+            self._memory[key] = (html, charts)
+        entry[1] = time.time()
+        self._dirty = True
+        self.hits += 1
+        return html, charts
+
+    def put(self, key: str, html: str, charts: Optional[Dict[str, Any]] = None) -> None:
+        """Stores a rendered fragment, and the chart data it references, under ``key``."""
+        size = len(html.encode("utf-8"))
+        self._make_dir()
+        with open(self._fragment_path(key), "w", encoding="utf-8") as f:
+            f.write(html)
+        if charts:
+            with open(self._charts_path(key), "w", encoding="utf-8") as f:
+                json.dump(charts, f)
+            size += os.path.getsize(self._charts_path(key))
+        if self.keep_in_memory:
+            self._memory[key] = (html, charts)
+        self._index[key] = [size, time.time(), 1 if charts else 0]
+        self._dirty = True
+
+    def total_bytes(self) -> int:
+        return int(sum(entry[0] for entry in self._index.values()))
+
+    def evict(self) -> int:
+        """
+        Removes least recently used fragments until the cache fits ``max_bytes``.
+
+        Returns:
+            int: Number of evicted fragments.
+        """
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return 0
+        evicted = 0
+        for key, (size, *_) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            self._remove_fragment(key)
+            self._memory.pop(key, None)
+            del self._index[key]
+            total -= size
+            evicted += 1
+        self._dirty = True
+        return evicted
+
+    def save(self) -> None:
+        """Applies the eviction policy and persists the index."""
+        self.evict()
+        if not self._dirty:
+            return
+        self._make_dir()
+        index_path = os.path.join(self.cache_dir, INDEX_FILENAME)
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": GENERATOR_VERSION, "entries": self._index}, f)
+        os.replace(tmp_path, index_path)
+        self._dirty = False
@@ -0,0 +1,526 @@
+# sample_deck.py
+# Sample presentation built when no configuration file is given.
+# Kept out of main.py so that regular builds do not pay for it at import time.
+
+sample_title = "Presentation System Overview"
+sample_author = "Marc Carnovale"
+sample_date = "November 21, 2024"
+sample_slides = [
+    {
+        "title": "",  # Title slide
+        "html-content": [
+            f"<h1>{sample_title}</h1>",
+            f"<h3>by {sample_author}</h3>",
+            f"<p>{sample_date}</p>"
+        ],
+        "dark": True
+    },
+    {
+        "title": "Introduction",
+        "content": [
+            "<p>Welcome to our advanced Presentation System.</p>",
+            "<p>Designed for maximum flexibility and efficiency, leveraging the power of HTML and modern web technologies.</p>"
+        ],
+        "folds": [
+            {
+                "title": "Core Principles",
+                "content": [
+                    "<p>Emphasis on information density and clarity.</p>",
+                    "<p>Minimalist design inspired by Tufte's philosophy.</p>"
+                ],
+                "folds": [
+                    {
+                        "title": "Information Density",
+                        "content": [
+                            "<p>Maximizing data presentation without clutter.</p>"
+                        ]
+                    },
+                    {
+                        "title": "Clarity",
+                        "content": [
+                            "<p>Ensuring information is easily understandable.</p>"
+                        ]
+                    }
+                ]
+            },
+            {
+                "title": "System Highlights",
+                "content": [
+                    "<p>Robust HTML-based architecture.</p>",
+                    "<p>Seamless integration with LLMs for dynamic slide creation.</p>"
+                ]
+            }
+        ],
+        "image": "introduction_image.png"
+    },
+    {
+        "title": "Features",
+        "content": [
+            "<h2>Key Features</h2>",
+            "<ul>",
+            "<li>Dynamic Resizing and Reflow</li>",
+            "<li>Nested Folds for Hierarchical Information</li>",
+            "<li>Flexible Column and Row Layouts</li>",
+            "<li>Rich Multimedia Support</li>",
+            "<li>Interactive Elements and Charts</li>",
+            "<li>Accessibility Compliance</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Dynamic Resizing",
+                "content": [
+                    "<p>Elegant resizing and reflow capabilities ensure content adapts to various screen sizes.</p>"
+                ]
+            },
+            {
+                "title": "Nested Folds",
+                "content": [
+                    "<p>Organize information hierarchically with collapsible sections.</p>"
+                ]
+            }
+        ],
+        "image": "features_image.png"
+    },
+    {
+        "title": "Flexibility of HTML",
+        "content": [
+            "<h2>Leveraging HTML's Flexibility</h2>",
+            "<p>Our system harnesses the mature and versatile nature of HTML to provide a robust framework for presentations.</p>",
+            "<p>Benefits include:</p>",
+            "<ul>",
+            "<li>Wide compatibility across devices and browsers.</li>",
+            "<li>Extensive multimedia integration.</li>",
+            "<li>Ease of customization and styling.</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Responsive Design",
+                "content": [
+                    "<p>Slides automatically adjust layout for optimal viewing on any device.</p>"
+                ]
+            },
+            {
+                "title": "Multimedia Support",
+                "content": [
+                    "<p>Embed videos, images, charts, and interactive content seamlessly.</p>"
+                ]
+            }
+        ],
+        "image": "html_flexibility.png"
+    },
+    {
+        "title": "Information Density",
+        "content": [
+            "<h2>Maximizing Information Density</h2>",
+            "<p>Inspired by Tufte, our system prioritizes the presentation of rich information without unnecessary distractions.</p>",
+            "<p>Strategies include:</p>",
+            "<ul>",
+            "<li>Minimalist design with ample white space.</li>",
+            "<li>Clear hierarchies through typography and layout.</li>",
+            "<li>Focus on data-driven content.</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Minimalist Design",
+                "content": [
+                    "<p>Clean layouts that emphasize content over decoration.</p>"
+                ]
+            },
+            {
+                "title": "Clear Hierarchies",
+                "content": [
+                    "<p>Use of headings, bullet points, and indentation to organize information.</p>"
+                ]
+            }
+        ],
+        "image": "information_density.png"
+    },
+    {
+        "title": "Current Features",
+        "content": [
+            "<h2>What We've Enabled So Far</h2>",
+            "<ul>",
+            "<li>Nested Folds with Varying Backgrounds</li>",
+            "<li>Flexible Column and Row Configurations</li>",
+            "<li>Interactive Charts and Multimedia Embeds</li>",
+            "<li>Responsive and Accessible Design</li>",
+            "<li>Easy Slide Creation via Dictionary-Based Configuration</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Nested Folds",
+                "content": [
+                    "<p>Create hierarchical content structures with ease.</p>"
+                ]
+            },
+            {
+                "title": "Interactive Charts",
+                "content": [
+                    "<p>Embed dynamic charts to visualize data effectively.</p>"
+                ]
+            }
+        ],
+        "image": "current_features.png"
+    },
+    {
+        "title": "Future Features",
+        "content": [
+            "<h2>Planned Enhancements</h2>",
+            "<ul>",
+            "<li>Real-Time Collaboration Tools</li>",
+            "<li>Advanced Animation and Transition Effects</li>",
+            "<li>Integration with External Data Sources</li>",
+            "<li>Customizable Templates and Themes</li>",
+            "<li>Enhanced Accessibility Features</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Real-Time Collaboration",
+                "content": [
+                    "<p>Enable multiple users to edit and interact with presentations simultaneously.</p>"
+                ]
+            },
+            {
+                "title": "Advanced Animations",
+                "content": [
+                    "<p>Incorporate smooth animations and transitions for engaging presentations.</p>"
+                ]
+            },
+            {
+                "title": "Data Integration",
+                "content": [
+                    "<p>Connect to APIs and databases for dynamic data-driven slides.</p>"
+                ]
+            }
+        ],
+        "image": "future_features.png"
+    },
+    {
+        "title": "Building Slides with LLMs",
+        "content": [
+            "<h2>Seamless Slide Creation via LLMs</h2>",
+            "<p>Our system is designed to work hand-in-hand with powerful Language Models like ChatGPT, enabling effortless slide generation and customization.</p>",
+            "<p>Advantages include:</p>",
+            "<ul>",
+            "<li>Rapid creation from conversational inputs.</li>",
+            "<li>Easy updates and modifications through dialogue.</li>",
+            "<li>Incorporation of complex data and multimedia with simple instructions.</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Conversational Slide Generation",
+                "content": [
+                    "<p>Generate detailed slides through natural language prompts.</p>"
+                ]
+            },
+            {
+                "title": "Dynamic Content Updates",
+                "content": [
+                    "<p>Modify existing slides by requesting changes in an interactive manner.</p>"
+                ]
+            }
+        ],
+        "image": "llm_integration.png"
+    },
+    {
+        "title": "How It Works",
+        "content": [
+            "<h2>System Architecture</h2>",
+            "<p>Our presentation system leverages a dictionary-based configuration approach, allowing for structured and scalable slide creation.</p>",
+            "<p>Key Components:</p>",
+            "<ul>",
+            "<li>Dictionary Definitions for Slides and Content</li>",
+            "<li>Helper Functions for HTML and CSS Generation</li>",
+            "<li>CSS Framework for Styling and Responsiveness</li>",
+            "<li>JavaScript for Interactivity and Dynamic Features</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Dictionary-Based Configuration",
+                "content": [
+                    "<p>Define slides, content, and layouts using simple Python dictionaries.</p>"
+                ]
+            },
+            {
+                "title": "Helper Functions",
+                "content": [
+                    "<p>Automate the generation of HTML and CSS based on configurations.</p>"
+                ]
+            }
+        ],
+        "image": "system_architecture.png"
+    },
+    {
+        "title": "Use Cases",
+        "content": [
+            "<h2>Applications of Our Presentation System</h2>",
+            "<ul>",
+            "<li>Educational Lectures and Tutorials</li>",
+            "<li>Business Presentations and Reports</li>",
+            "<li>Technical Documentation and Demos</li>",
+            "<li>Interactive Workshops and Webinars</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Educational Use",
+                "content": [
+                    "<p>Create detailed, information-dense slides for effective teaching.</p>"
+                ]
+            },
+            {
+                "title": "Business Applications",
+                "content": [
+                    "<p>Develop professional presentations with dynamic data visualizations.</p>"
+                ]
+            }
+        ],
+        "image": "use_cases.png"
+    },
+    {
+        "title": "Technical Overview",
+        "content": [
+            "<h2>Under the Hood</h2>",
+            "<p>The system is built using modern web technologies to ensure performance, scalability, and ease of use.</p>",
+            "<p>Technologies Used:</p>",
+            "<ul>",
+            "<li>HTML5 and CSS3 for structure and styling.</li>",
+            "<li>JavaScript for interactivity.</li>",
+            "<li>Python for configuration and helper scripts.</li>",
+            "<li>Chart.js for data visualization.</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Front-End Technologies",
+                "content": [
+                    "<p>HTML and CSS provide a robust foundation for responsive design.</p>"
+                ]
+            },
+            {
+                "title": "Back-End Integration",
+                "content": [
+                    "<p>Python scripts automate the generation of slide content and structure.</p>"
+                ]
+            }
+        ],
+        "image": "technical_overview.png"
+    },
+    {
+        "title": "Extensibility",
+        "content": [
+            "<h2>Highly Extensible and Customizable</h2>",
+            "<p>Our system is designed to be easily extended to meet diverse presentation needs.</p>",
+            "<p>Customization Options:</p>",
+            "<ul>",
+            "<li>Custom CSS Themes and Styles</li>",
+            "<li>Integration with Third-Party APIs</li>",
+            "<li>Adding New Content Types and Components</li>",
+            "<li>Localization and Internationalization Support</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Custom Themes",
+                "content": [
+                    "<p>Apply different color schemes and layouts to match branding.</p>"
+                ]
+            },
+            {
+                "title": "API Integrations",
+                "content": [
+                    "<p>Connect to external data sources for real-time content updates.</p>"
+                ]
+            }
+        ],
+        "image": "extensibility.png"
+    },
+    {
+        "title": "Accessibility",
+        "content": [
+            "<h2>Commitment to Accessibility</h2>",
+            "<p>Ensuring that our presentation system is usable by everyone, including those with disabilities.</p>",
+            "<p>Accessibility Features:</p>",
+            "<ul>",
+            "<li>Keyboard Navigable Interfaces</li>",
+            "<li>Screen Reader Compatibility</li>",
+            "<li>High Contrast Modes</li>",
+            "<li>ARIA Attributes for Enhanced Semantics</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Keyboard Navigation",
+                "content": [
+                    "<p>All interactive elements are accessible via keyboard controls.</p>"
+                ]
+            },
+            {
+                "title": "Screen Reader Support",
+                "content": [
+                    "<p>Semantic HTML and ARIA attributes improve compatibility with assistive technologies.</p>"
+                ]
+            }
+        ],
+        "image": "accessibility.png"
+    },
+    {
+        "title": "Multimedia Support",
+        "content": [
+            "<h2>Rich Multimedia Integration</h2>",
+            "<p>Enhance your presentations with a variety of multimedia elements, such as:",
+            "<ul>",
+            "<li>Images and Galleries</li>",
+            "<li>Embedded Videos and Audio</li>",
+            "<li>Animations and Transitions</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Interactive Visuals",
+                "content": [
+                    "<p>Use tools like Chart.js to create engaging data visualizations.</p>"
+                ],
+                "folds": [
+                    {
+                        "title": "Data Visualization",
+                        "chart": {
+                            "type": "bar",
+                            "data": {
+                                "labels": ["January", "February", "March", "April", "May", "June"],
+                                "datasets": [{
+                                    "label": "Sales",
+                                    "data": [50, 60, 70, 80, 65, 75],
+                                    "backgroundColor": "rgba(54, 162, 235, 0.2)",
+                                    "borderColor": "rgba(54, 162, 235, 1)",
+                                    "borderWidth": 1
+                                }]
+                            },
+                            "options": {
+                                "scales": {
+                                    "x": {
+                                        "ticks": {
+                                            "maxRotation": 45,
+                                            "minRotation": 45
+                                        }
+                                    },
+                                    "y": {"beginAtZero": True}
+                                }
+                            }
+                        }
+                    }
+                ]
+            },
+            {
+                "title": "Embedded Media",
+                "content": [
+                    "<p>Seamlessly incorporate videos and audio clips for dynamic content delivery.</p>"
+                ]
+            }
+        ],
+        "image": "multimedia_support.png"
+    },    
+    {
+        "title": "Newsprint Tiling Example",
+        "content": [
+            {
+                "rows": {
+                    "number": 2,
+                    "content": [
+                        {
+                            "columns": {
+                                "number": 3,
+                                "size": ["30%", "40%", "30%"],
+                                "content": [
+                                    {
+                                        "html-content": "<h3>Headlines</h3><p>Latest news updates.</p>"
+                                    },
+                                    {
+                                        "html-content": "<h3>Top Stories</h3><p>In-depth analysis of current events.</p>"
+                                    },
+                                    {
+                                        "html-content": "<h3>Weather</h3><p>Today's weather forecast.</p>"
+                                    }
+                                ]
+                            }
+                        },
+                        {
+                            "columns": {
+                                "number": 2,
+                                "size": ["50%", "50%"],
+                                "content": [
+                                    "Advertising Space",
+                                    "Sponsored Content"
+                                ]
+                            }
+                        }
+                    ]
+                }
+            },
+            {
+                "title": "Additional Content",
+                "html-content": "<p>Additional content below the tiling layout, such as editor's note or contact information.</p>"
+            }
+        ],
+        "image": "newsprint_example_image.png"
+    },
+    {
+        "title": "Performance Metrics",
+        "content": [
+            "<h2>System Performance</h2>",
+            "<p>Optimized for fast load times and smooth interactions.</p>",
+            "<p>Key Metrics:</p>",
+            "<ul>",
+            "<li>Average Slide Load Time: <strong>200ms</strong></li>",
+            "<li>Responsive Design Efficiency: <strong>High</strong></li>",
+            "<li>Scalability: Supports presentations with up to <strong>100 slides</strong></li>",
+            "<li>Resource Utilization: Minimal CPU and Memory usage</li>",
+            "</ul>"
+        ],
+        "folds": [
+            {
+                "title": "Load Times",
+                "content": [
+                    "<p>Slides load almost instantaneously, ensuring a seamless viewing experience.</p>"
+                ]
+            },
+            {
+                "title": "Scalability",
+                "content": [
+                    "<p>Efficiently handles large presentations without performance degradation.</p>"
+                ]
+            }
+        ],
+        "image": "performance_metrics.png"
+    },
+    {
+        "title": "Conclusion",
+        "content": [
+            "<h2>Why Choose Our Presentation System?</h2>",
+            "<ul>",
+            "<li>Unparalleled Flexibility and Customization</li>",
+            "<li>High Information Density with Clarity</li>",
+            "<li>Seamless Integration with Modern Technologies</li>",
+            "<li>Accessible and Inclusive Design</li>",
+            "<li>Future-Proof and Extensible Architecture</li>",
+            "</ul>",
+            "<p>Empower your presentations with a system built for clarity, efficiency, and scalability.</p>"
+        ],
+        "image": "conclusion_image.png"
+    },
+    {
+        "title": "Thank You",
+        "html-content": [
+            "<h2>Thank You!</h2>",
+            "<p>Your questions?</p>",
+            "<p>Feel free to reach out for further discussions.</p>"
+        ],
+    }
+]
@@ -0,0 +1,316 @@
+# slide_model.py
+import gc
+import re
+from typing import List, Dict, Any, Optional, Union, Iterator
+
+
+# Any "<...>" tag marks a string as markup
+HTML_TAG = re.compile(r'<[^>]+>')
+
+
+def is_html(content: str) -> bool:
+    """
+    Determine if the content string contains any HTML tags.
+
+    Args:
+        content (str): The content string to check.
+
+    Returns:
+        bool: True if content contains HTML tags, False otherwise.
+    """
+    if type(content) is dict :
+        return False
+    # Plain paragraphs rarely contain "<"; the substring test is much cheaper than the regex
+    return '<' in content and HTML_TAG.search(content) is not None
+
+
+class Text:
+    """Plain text, written as a paragraph."""
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class Html:
+    """Markup written as is."""
+    __slots__ = ("html",)
+
+    def __init__(self, html: str):
+        self.html = html
+
+
+class Chart:
+    """A Chart.js specification."""
+    __slots__ = ("spec",)
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+
+
+class Fold:
+    """
+    A collapsible section.
+
+    ``id`` is the element ID of its content panel (see ``element_id``).
+    """
+    __slots__ = ("title", "chart", "html", "content", "folds", "id")
+
+    def __init__(self, title: str, chart: Optional[Chart], html: Optional[str],
+                 content: List[Union[Text, Html]], folds: List["Fold"], id: str):
+        self.title = title
+        self.chart = chart
+        self.html = html
+        self.content = content
+        self.folds = folds
+        self.id = id
+
+
+class Columns:
+    """Side-by-side cells, each a (CSS flex-basis, list of nodes) pair."""
+    __slots__ = ("cells", "id")
+
+    def __init__(self, cells: List[tuple], id: str):
+        self.cells = cells
+        self.id = id
+
+
+class Rows:
+    """Stacked rows, each a list of nodes (one Columns or Rows, or Text/Html and Folds)."""
+    __slots__ = ("items", "id")
+
+    def __init__(self, items: List[List[Any]], id: str):
+        self.items = items
+        self.id = id
+
+
+class Slide:
+    """
+    A slide and its content.
+
+    ``source`` is the configuration dictionary the slide was parsed from; it
+    identifies the slide in the render cache. ``id`` is the root of the
+    element IDs inside the slide.
+    """
+    __slots__ = ("title", "dark", "html", "content", "folds", "image", "image_info", "source", "id")
+
+    def __init__(self, title: Optional[str], dark: bool, html: List[str], content: List[Any], folds: List[Fold],
+                 image: Optional[str], image_info: Optional[Dict[str, Any]], source: Dict[str, Any], id: str):
+        self.title = title
+        self.dark = dark
+        self.html = html
+        self.content = content
+        self.folds = folds
+        self.image = image
+        self.image_info = image_info
+        self.source = source
+        self.id = id
+
+
+# Element IDs follow the structure of the deck: each node appends one segment
+# to the ID of its parent, e.g. "s3-f1-f0" for the first nested fold of the
+# second fold of slide 3. They are unique by construction, computed in O(1)
+# per node, and stay the same across rebuilds as long as the structure does.
+# Segment kinds: "f" fold in a folds list, "c" slide content item,
+# "r" row of a rows block, "k" column cell.
+def slide_id(index: int, level: int = 0) -> str:
+    """Returns the element ID root of a slide."""
+    return f"s{index}" if level == 0 else f"l{level}s{index}"
+
+
+def element_id(parent: str, kind: str, index: int) -> str:
+    """Returns the ID of the ``index``-th child of kind ``kind`` of the node with ID ``parent``."""
+    return f"{parent}-{kind}{index}"
+
+
+# The parsers below assume a deck that passed ``validation.check_slides``, which
+# owns the rules of the configuration format; they only normalize shorthands
+# (a string for a list, a single fold for a list of folds) and assign IDs.
+def parse_text(value: str) -> Union[Text, Html]:
+    """Classifies a content string once, as markup or as plain text."""
+    return Html(value) if is_html(value) else Text(value)
+
+
+def parse_marked_text(data: Dict[str, Any]) -> Union[Text, Html]:
+    """Reads an explicit ``{"text": ...}`` or ``{"html": ...}`` item, which skips markup detection."""
+    if "html" in data:
+        return Html(data["html"])
+    return Text(data["text"])
+
+
+def parse_fold(data: Dict[str, Any], fold_id: str) -> Fold:
+    items = data.get("content", ())
+    if type(items) is str:
+        items = (items,)
+    content = [parse_text(item) if type(item) is str else parse_marked_text(item) for item in items]
+
+    nested = data.get("folds")
+    folds = []
+    if nested is not None:
+        if type(nested) is dict:
+            nested = [nested]
+        folds = parse_folds(nested, fold_id)
+    chart = Chart(data["chart"]) if "chart" in data else None
+    return Fold(data.get("title", "Click to Expand"), chart, data.get("html-content"), content, folds, fold_id)
+
+
+def parse_folds(data: List[Dict[str, Any]], parent_id: str) -> List[Fold]:
+    return [parse_fold(fold, element_id(parent_id, "f", j)) for j, fold in enumerate(data)]
+
+
+def parse_cell(data: Dict[str, Any], cell_id: str) -> List[Any]:
+    """Parses the nodes of a column cell or a row: text/html, html-content, folds, rows and columns."""
+    nodes: List[Any] = []
+    if "text" in data or "html" in data:
+        nodes.append(parse_marked_text(data))
+    if "html-content" in data:
+        nodes.append(Html(data["html-content"]))
+    if "folds" in data:
+        nodes.extend(parse_folds(data["folds"], cell_id))
+    if "rows" in data:
+        nodes.append(parse_rows(data["rows"], cell_id))
+    if "columns" in data:
+        nodes.append(parse_columns(data["columns"], cell_id))
+    return nodes
+
+
+def parse_rows(data: Dict[str, Any], rows_id: str) -> Rows:
+    items = []
+    for idx, row in enumerate(data.get("content", [])):
+        row_id = element_id(rows_id, "r", idx)
+        # A row holding columns or rows renders only that entry
+        if "columns" in row:
+            items.append([parse_columns(row["columns"], row_id)])
+        elif "rows" in row:
+            items.append([parse_rows(row["rows"], row_id)])
+        else:
+            items.append(parse_cell(row, row_id))
+    return Rows(items, rows_id)
+
+
+def parse_columns(data: Dict[str, Any], columns_id: str) -> Columns:
+    number = data.get("number", 1)
+    sizes = data.get("size", ["100%"] * number)
+    contents = data.get("content", [])
+
+    cells = []
+    for idx in range(number):
+        size = sizes[idx] if idx < len(sizes) else "100%"
+        content = contents[idx] if idx < len(contents) else ""
+        if type(content) is str:
+            nodes = [parse_text(content)]
+        elif type(content) is dict:
+            nodes = parse_cell(content, element_id(columns_id, "k", idx))
+        else:
+            nodes = []
+        cells.append((size, nodes))
+    return Columns(cells, columns_id)
+
+
+def parse_slide(data: Dict[str, Any], node_id: str) -> Slide:
+    """
+    Parses one slide dictionary that passed validation.
+
+    Args:
+        data (Dict[str, Any]): The slide configuration.
+        node_id (str): Element ID root of the slide (see ``slide_id``).
+
+    Returns:
+        Slide: The parsed slide.
+    """
+    html = data.get("html-content", [])
+    if type(html) is str:
+        html = [html]
+
+    items = data.get("content", ())
+    if type(items) is str:
+        items = (items,)
+    content: List[Any] = []
+    for i, item in enumerate(items):
+        if type(item) is str:
+            content.append(parse_text(item))
+        elif "text" in item or "html" in item:
+            content.append(parse_marked_text(item))
+        elif "rows" in item:
+            content.append(parse_rows(item["rows"], element_id(node_id, "c", i)))
+        elif "columns" in item:
+            content.append(parse_columns(item["columns"], element_id(node_id, "c", i)))
+        else:
+            content.append(parse_fold(item, element_id(node_id, "c", i)))
+
+    folds = parse_folds(data["folds"], node_id) if "folds" in data else []
+    # The file the image stage placed for the slide, if it ran (see ``helper.copy_images``)
+    image = data.get("image-file") or data.get("image", "static/images/placeholder.png")
+    return Slide(data.get("title"), bool(data.get("dark")), html, content, folds, image,
+                 data.get("image-info"), data, node_id)
+
+
+def parse_slides(slides: List[Dict[str, Any]], level: int = 0) -> List[Slide]:
+    """
+    Parses the slide dictionaries of a deck into the typed model.
+
+    The deck must have passed ``validation.check_slides``; malformed input
+    is not diagnosed here.
+
+    Args:
+        slides (List[Dict[str, Any]]): The ``slides`` list of a configuration.
+        level (int): Nesting level of the slides, part of their element IDs.
+
+    Returns:
+        List[Slide]: The parsed slides.
+    """
+    # The model holds no reference cycles; pausing the collector while it is built
+    # avoids repeated scans of the (large) configuration already in memory.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return [parse_slide(slide, slide_id(i, level)) for i, slide in enumerate(slides)]
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def iter_element_ids(node: Any) -> Iterator[str]:
+    """Yields the element IDs written for a parsed node and everything inside it (fold panels and charts)."""
+    kind = type(node)
+    if kind is Fold:
+        yield node.id
+        if node.chart is not None:
+            yield f"chart-{node.id}"
+        for sub in node.folds:
+            yield from iter_element_ids(sub)
+    elif kind is Slide:
+        for child in node.content:
+            yield from iter_element_ids(child)
+        for fold in node.folds:
+            yield from iter_element_ids(fold)
+    elif kind is Rows:
+        for row in node.items:
+            for child in row:
+                yield from iter_element_ids(child)
+    elif kind is Columns:
+        for _, nodes in node.cells:
+            for child in nodes:
+                yield from iter_element_ids(child)
+
+
+def duplicate_ids(slides: List[Slide]) -> List[str]:
+    """
+    Returns the element IDs that occur more than once in a parsed deck.
+
+    IDs are unique by construction; this is the check used to verify it.
+
+    Args:
+        slides (List[Slide]): The parsed slides (see ``parse_slides``).
+
+    Returns:
+        List[str]: Every duplicated ID, once, in document order.
+    """
+    seen = set()
+    duplicates: Dict[str, None] = {}
+    for slide in slides:
+        for node_id in iter_element_ids(slide):
+            if node_id in seen:
+                duplicates[node_id] = None
+            seen.add(node_id)
+    return list(duplicates)
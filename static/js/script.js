@@ -10,24 +10,66 @@ const slideManager = (() => {
     const mainslides = document.querySelectorAll('.slide');
     const tocLinks = document.querySelectorAll('.sidebar a');
 
+    // Lazy slides (data-lazy) keep their body in an inert <template>; only the
+    // current slide and its neighbours are materialized into the DOM.
+    const MATERIALIZE_RADIUS = 1; // Slides on each side of the current one that are kept ready
+    const RELEASE_RADIUS = 3; // Slides further away than this are emptied again
+    const materializedSlides = new Set();
+
+    function materialize(index) {
+        const slide = mainslides[index];
+        if (!slide || !slide.dataset.lazy || materializedSlides.has(index)) {
+            return;
+        }
+        const template = slide.querySelector(':scope > template');
+        slide.appendChild(template.content.cloneNode(true));
+        materializedSlides.add(index);
+        document.dispatchEvent(new CustomEvent('slideMaterialized', { detail: { slide, index } }));
+    }
+
+    function release(index) {
+        const slide = mainslides[index];
+        // Free chart instances before their canvases leave the DOM
+        ChartManager.destroyCharts(slide);
+        Array.from(slide.children).forEach(child => {
+            if (child.tagName !== 'TEMPLATE') {
+                child.remove();
+            }
+        });
+        materializedSlides.delete(index);
+    }
+
+    function materializeAround(index) {
+        for (let i = index - MATERIALIZE_RADIUS; i <= index + MATERIALIZE_RADIUS; i++) {
+            materialize(i);
+        }
+        materializedSlides.forEach(i => {
+            if (Math.abs(i - index) > RELEASE_RADIUS) {
+                release(i);
+            }
+        });
+    }
+
     function initialize() {
         if (mainslides.length > 0) {
             currentIndex = 0; // Start at the first slide
+            materializeAround(currentIndex);
             mainslides[currentIndex].classList.add('active'); // Mark the first slide as active
             document.body.classList.add('dark-background'); // Add dark theme for the first slide
             log('Initialized with the first slide active.');
-            BreadcrumbManager.updateBreadcrumb();
+            BreadcrumbManager.updateBreadcrumb(currentIndex);
         }
     }
 
-    function updateTOCHighlight() {
-        tocLinks.forEach((link, index) => {
-            if (index === currentIndex - 1) { // Adjust for TOC starting after title slide
-                link.classList.add('active');
-            } else {
-                link.classList.remove('active');
+    // Highlight or clear the TOC entry of a slide (the TOC starts after the title slide)
+    function setTOCActive(index, active) {
+        const link = tocLinks[index - 1];
+        if (link) {
+            link.classList.toggle('active', active);
+            if (!active) {
+                link.blur(); // Ensure focus is cleared
             }
-        });
+        }
     }
 
     function goToslide(index) {
@@ -36,23 +78,17 @@ const slideManager = (() => {
             return;
         }
     
-        // Deactivate current slide and update TOC
-        mainslides[currentIndex]?.classList.remove('active');
-        if (currentIndex > 0) {
-            tocLinks[currentIndex - 1]?.classList.remove('active');
-            tocLinks[currentIndex - 1]?.blur(); // Ensure focus is cleared
-        }
+        // Deactivate the previous slide and its TOC entry; only these two
+        // slides are touched, so navigation cost does not grow with the deck
+        const previousIndex = currentIndex;
+        mainslides[previousIndex]?.classList.remove('active');
+        setTOCActive(previousIndex, false);
     
         // Update the global index and activate the new slide
         currentIndex = index;
+        materializeAround(currentIndex);
         mainslides[currentIndex].classList.add('active');
-    
-        // Update TOC highlight
-        if (currentIndex > 0) {
-            updateTOCHighlight();
-        } else {
-            tocLinks.forEach(link => link.classList.remove('active'));
-        }
+        setTOCActive(currentIndex, true);
     
         // Update body background for the first slide
         if (currentIndex === 0) {
@@ -62,7 +98,7 @@ const slideManager = (() => {
         }
     
         log(`Navigated to slide index: ${currentIndex}`);
-        BreadcrumbManager.updateBreadcrumb();
+        BreadcrumbManager.updateBreadcrumb(currentIndex);
     
         // Dispatch a custom event for slide changes
         const slideChangeEvent = new CustomEvent('slideChange', { detail: currentIndex });
@@ -100,7 +136,19 @@ const slideManager = (() => {
         });
     }
 
-    return { initialize, goToslide, nextslide, previousslide, setupKeyboardNavigation };
+    function getSlide(index) {
+        return mainslides[index];
+    }
+
+    // Position of a main slide, checking the current one before scanning the list
+    function indexOfSlide(slide) {
+        if (mainslides[currentIndex] === slide) {
+            return currentIndex;
+        }
+        return Array.prototype.indexOf.call(mainslides, slide);
+    }
+
+    return { initialize, goToslide, nextslide, previousslide, setupKeyboardNavigation, getSlide, indexOfSlide };
 })();
 
 
@@ -120,96 +168,232 @@ const TOCManager = (() => {
 })();
 
 // Chart Management
+// Charts are only created once they can be seen (their slide is active and every
+// enclosing fold is open) and are destroyed again when their slide is far away.
 const ChartManager = (() => {
-    function initializeCharts() {
-        const charts = document.querySelectorAll('.chart-container');
-        charts.forEach(chartEl => {
-            if (chartEl.dataset.chartInitialized) {
-                return; // Prevent multiple initializations
+    const DESTROY_DISTANCE = 1; // Slides further away than this release their charts
+    let chartSpecs = null; // Shared chart data from #chart-data, parsed on first use
+    const instances = new Map(); // chart container -> { chart, slideIndex }
+
+    function getChartSpec(chartEl) {
+        if (chartEl.dataset.chartId) {
+            if (chartSpecs === null) {
+                const block = document.getElementById('chart-data');
+                chartSpecs = block ? JSON.parse(block.textContent) : {};
             }
+            return chartSpecs[chartEl.dataset.chartId];
+        }
+        // Decks built without a chart data block carry the data inline
+        return JSON.parse(chartEl.getAttribute('data-chart-data'));
+    }
 
-            const ctx = chartEl.querySelector('canvas').getContext('2d');
-            let chartData;
-            try {
-                chartData = JSON.parse(chartEl.getAttribute('data-chart-data'));
-            } catch (e) {
-                log(`Invalid chart data in panel: ${chartEl.id}`, "error");
-                return;
+    function isVisible(chartEl) {
+        const slide = chartEl.closest('.slide');
+        if (slide && !slide.classList.contains('active')) {
+            return false;
+        }
+        for (let panel = chartEl.closest('.content-panel'); panel; panel = panel.parentElement.closest('.content-panel')) {
+            if (!panel.classList.contains('active')) {
+                return false;
             }
+        }
+        return true;
+    }
+
+    // Typed-array views over the binary sidecars written at build time, fetched once per URL
+    const sidecarColumns = new Map();
+
+    function loadSidecar(sidecar) {
+        if (!sidecarColumns.has(sidecar.url)) {
+            sidecarColumns.set(sidecar.url, fetch(sidecar.url)
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`HTTP ${response.status}`);
+                    }
+                    return response.arrayBuffer();
+                })
+                .then(buffer => {
+                    const columns = {};
+                    sidecar.columns.forEach(column => {
+                        const ArrayType = column.dtype === 'float64' ? Float64Array : Float32Array;
+                        columns[column.name] = new ArrayType(buffer, column.offset, sidecar.length);
+                    });
+                    return columns;
+                }));
+        }
+        return sidecarColumns.get(sidecar.url);
+    }
+
+    // Turn sidecar columns into Chart.js datasets of {x, y} points, which skip Chart.js parsing
+    function sidecarConfig(chartData, columns) {
+        const sidecar = chartData['data-sidecar'];
+        const xs = columns[sidecar.x];
+        const styles = chartData.datasets || {};
+        const datasets = sidecar.y.map(name => {
+            const ys = columns[name];
+            const points = new Array(xs.length);
+            for (let i = 0; i < xs.length; i++) {
+                points[i] = { x: xs[i], y: ys[i] };
+            }
+            return Object.assign({ label: name, data: points, pointRadius: 0, borderWidth: 1 }, styles[name]);
+        });
+        const options = Object.assign({ parsing: false, normalized: true, animation: false }, chartData.options);
+        options.scales = Object.assign({}, options.scales);
+        options.scales.x = Object.assign({ type: 'linear' }, options.scales.x);
+        return { type: chartData.type || 'line', data: { datasets }, options };
+    }
+
+    function createChart(chartEl) {
+        if (instances.has(chartEl)) {
+            return; // Prevent multiple initializations
+        }
 
-            new Chart(ctx, {
+        let chartData;
+        try {
+            chartData = getChartSpec(chartEl);
+        } catch (e) {
+            chartData = null;
+        }
+        if (!chartData) {
+            log(`Invalid chart data in panel: ${chartEl.id}`, "error");
+            return;
+        }
+
+        const slide = chartEl.closest('.slide');
+        const slideIndex = slide ? slideManager.indexOfSlide(slide) : -1;
+        const entry = { chart: null, slideIndex };
+        instances.set(chartEl, entry);
+        chartEl.dataset.chartInitialized = true;
+
+        const ctx = chartEl.querySelector('canvas').getContext('2d');
+        if (!chartData['data-sidecar']) {
+            entry.chart = new Chart(ctx, {
                 type: chartData.type,
                 data: chartData.data,
                 options: chartData.options,
             });
-
-            chartEl.dataset.chartInitialized = true;
             log(`Initialized chart in panel: ${chartEl.id}`);
+            return;
+        }
+
+        loadSidecar(chartData['data-sidecar']).then(columns => {
+            if (instances.get(chartEl) !== entry) {
+                return; // Released while the data was loading
+            }
+            entry.chart = new Chart(ctx, sidecarConfig(chartData, columns));
+            log(`Initialized chart in panel: ${chartEl.id} (${chartData['data-sidecar'].length} points)`);
+        }).catch(error => {
+            sidecarColumns.delete(chartData['data-sidecar'].url);
+            instances.delete(chartEl);
+            delete chartEl.dataset.chartInitialized;
+            log(`Could not load chart data '${chartData['data-sidecar'].url}' for panel: ${chartEl.id} (${error.message})`, "error");
         });
     }
 
-    return { initializeCharts };
+    // Create the visible charts within root (the whole document by default)
+    function initializeCharts(root = document) {
+        root.querySelectorAll('.chart-container').forEach(chartEl => {
+            if (isVisible(chartEl)) {
+                createChart(chartEl);
+            }
+        });
+    }
+
+    // Destroy the charts within root
+    function destroyCharts(root) {
+        instances.forEach((entry, chartEl) => {
+            if (root.contains(chartEl)) {
+                if (entry.chart) {
+                    entry.chart.destroy();
+                }
+                instances.delete(chartEl);
+                delete chartEl.dataset.chartInitialized;
+            }
+        });
+    }
+
+    function handleSlideChange(currentIndex) {
+        instances.forEach((entry, chartEl) => {
+            if (entry.slideIndex >= 0 && Math.abs(entry.slideIndex - currentIndex) > DESTROY_DISTANCE) {
+                if (entry.chart) {
+                    entry.chart.destroy();
+                }
+                instances.delete(chartEl);
+                delete chartEl.dataset.chartInitialized;
+            }
+        });
+        const activeSlide = slideManager.getSlide(currentIndex);
+        if (activeSlide) {
+            initializeCharts(activeSlide);
+        }
+    }
+
+    return { initializeCharts, destroyCharts, handleSlideChange };
 })();
 
+document.addEventListener('slideChange', (event) => {
+    ChartManager.handleSlideChange(event.detail);
+});
+
 
 // Collapsible Management (Refactored for Modularity and Accessibility)
+// One delegated click and keydown handler on #content serves every fold, including
+// those in lazy slides materialized later; the generator writes the level-N class.
 const CollapsibleManager = (() => {
-    // Initialize a single collapsible button
-    function initializeCollapsible(button) {
-        // Determine nesting level for styling
-        let level = 1;
-        let parent = button.parentElement;
-        while (parent && parent.classList.contains('content-panel')) {
-            level++;
-            parent = parent.parentElement;
-        }
-        button.classList.add(`level-${level}`);
-
-        // Ensure ARIA attributes are set
-        button.setAttribute('role', 'button');
-        button.setAttribute('aria-expanded', 'false');
-
-        // Click event handler
-        button.addEventListener('click', (event) => {
-            event.preventDefault();      // Prevent default action
-            event.stopPropagation();     // Stop event from bubbling up
-            log(`Collapsible button clicked: ${button.textContent}`);
-            const isActive = button.classList.toggle('active');
-            const panelId = button.getAttribute('aria-controls');
-            const panel = document.getElementById(panelId);
-
-            if (panel) {
-                panel.classList.toggle('active');
-                log(`Toggled panel: ${panelId}, Now Active: ${panel.classList.contains('active')}`);
-
-                // If panel becomes active, initialize any charts inside it
-                if (panel.classList.contains('active')) {
-                    ChartManager.initializeCharts();
-                }
+    // Toggle a collapsible button and its content panel
+    function toggleCollapsible(button) {
+        log(`Collapsible button clicked: ${button.textContent}`);
+        const isActive = button.classList.toggle('active');
+        const panelId = button.getAttribute('aria-controls');
+        const panel = document.getElementById(panelId);
+
+        if (panel) {
+            panel.classList.toggle('active');
+            log(`Toggled panel: ${panelId}, Now Active: ${panel.classList.contains('active')}`);
+
+            // If panel becomes active, initialize the charts inside it
+            if (panel.classList.contains('active')) {
+                ChartManager.initializeCharts(panel);
+            }
+
+            // Update aria-expanded attribute for accessibility
+            button.setAttribute('aria-expanded', isActive);
+        } else {
+            log(`Panel with id '${panelId}' not found.`, "error");
+        }
+    }
 
-                // Update aria-expanded attribute for accessibility
-                button.setAttribute('aria-expanded', isActive);
-            } else {
-                log(`Panel with id '${panelId}' not found.`, "error");
+    // Attach the delegated handlers once
+    function setupCollapsibles() {
+        const content = document.getElementById('content');
+        if (!content) {
+            log('Content container not found.', 'error');
+            return;
+        }
+
+        content.addEventListener('click', (event) => {
+            const button = event.target.closest('.collapsible');
+            if (!button) {
+                return;
             }
+            event.preventDefault();      // Prevent default action
+            event.stopPropagation();     // Stop event from bubbling up
+            toggleCollapsible(button);
         });
 
         // Enable keyboard accessibility
-        button.addEventListener('keydown', (event) => {
-            if (event.key === 'Enter' || event.key === ' ') {
+        content.addEventListener('keydown', (event) => {
+            if (event.key !== 'Enter' && event.key !== ' ') {
+                return;
+            }
+            const button = event.target.closest('.collapsible');
+            if (button) {
                 event.preventDefault();
-                button.click();
+                toggleCollapsible(button);
             }
         });
     }
 
-    // Set up all collapsibles
-    function setupCollapsibles() {
-        const collapsibles = document.querySelectorAll('.collapsible');
-        log(`Found ${collapsibles.length} collapsible buttons.`);
-        collapsibles.forEach(initializeCollapsible); // Use the helper function
-    }
-
     return { setupCollapsibles };
 })();
 
@@ -227,9 +411,9 @@ const ContentManager = (() => {
         }
 
         content.addEventListener('click', function (event) {
-            // Ignore clicks that originate from resizers
-            if (event.target.classList.contains('column-resizer')) {
-                log('Click ignored on resizer.');
+            // Ignore clicks that originate from resizers or resizable columns
+            if (event.target.closest('.column-resizer, .resizable')) {
+                log('Click ignored on resizer or resizable element.');
                 return; // Do not navigate if the click is on a resizer
             }
 
@@ -288,22 +472,24 @@ const SidebarManager = (() => {
 
 
 const BreadcrumbManager = (() => {
-    function updateBreadcrumb() {
-        const breadcrumbs = document.querySelector('.breadcrumb ol');
-        const mainslides = document.querySelectorAll('.slide');
-        const breadcrumbLinks = breadcrumbs.querySelectorAll('a');
-
-        mainslides.forEach((slide, index) => {
-            if (slide.classList.contains('active')) {
-                breadcrumbLinks.forEach((link, i) => {
-                    if (i === index) {
-                        link.classList.add('active');
-                    } else {
-                        link.classList.remove('active');
-                    }
-                });
-            }
-        });
+    let breadcrumbLinks = null; // Looked up once, on first use
+    let activeIndex = -1;
+
+    function getLink(index) {
+        if (breadcrumbLinks === null) {
+            breadcrumbLinks = document.querySelectorAll('.breadcrumb ol a');
+        }
+        return breadcrumbLinks[index];
+    }
+
+    // Move the highlight from the previous breadcrumb to the one of slide index
+    function updateBreadcrumb(index) {
+        if (index === activeIndex) {
+            return;
+        }
+        getLink(activeIndex)?.classList.remove('active');
+        getLink(index)?.classList.add('active');
+        activeIndex = index;
     }
 
     function setupBreadcrumbNavigation() {
@@ -319,7 +505,7 @@ const BreadcrumbManager = (() => {
 
     }
 
-    return { updateBreadcrumb, setupBreadcrumbNavigation };
+    return { getLink, updateBreadcrumb, setupBreadcrumbNavigation };
 })();
 
 
@@ -351,94 +537,212 @@ window.ignoreNextClick = false;
 window.isResizing = false;
 
 const Resizer = (() => {
-    function initializeResizers() {
-        const columns = document.querySelectorAll('.column');
-
-        columns.forEach(column => {
-            const resizer = document.createElement('div');
-            resizer.classList.add('column-resizer'); // Ensure the correct class is added
-            column.appendChild(resizer);
+    const MIN_WIDTH = 100; // Narrowest a column can be dragged, in px
+    const SAVE_DELAY = 300; // Debounce for writing widths to localStorage, in ms
+    const STORAGE_KEY = `columnWidths:${location.pathname}`; // One entry per deck
 
-            resizer.addEventListener('mousedown', initResize);
+    let savedWidths = null; // data-column-id -> flex basis, read on first use
+    let saveTimer = null;
+    let drag = null; // State of the resize in progress
 
-            // Prevent click events on resizer from propagating
-            resizer.addEventListener('click', function(e) {
-                e.preventDefault();
-                e.stopPropagation();
-            });
-        });
+    function getSavedWidths() {
+        if (savedWidths === null) {
+            try {
+                savedWidths = JSON.parse(localStorage.getItem(STORAGE_KEY)) || {};
+            } catch (e) {
+                savedWidths = {};
+            }
+        }
+        return savedWidths;
+    }
 
-        function initResize(e) {
-            e.preventDefault(); // Prevent default browser behavior
-            e.stopPropagation(); // Stop event from propagating
-            window.isResizing = true; // Set the resizing flag to true
-            window.ignoreNextClick = true; // Set the global flag to ignore the next click
-            window.addEventListener('mousemove', startResizing);
-            window.addEventListener('mouseup', stopResizing);
+    function writeSavedWidths() {
+        clearTimeout(saveTimer);
+        saveTimer = null;
+        try {
+            localStorage.setItem(STORAGE_KEY, JSON.stringify(getSavedWidths()));
+        } catch (e) {
+            log(`Could not save column widths (${e.message})`, "error");
         }
+    }
 
-        function startResizing(e) {
-            const resizer = e.target;
-            const column = resizer.parentElement;
-            const prevColumn = column.previousElementSibling;
-            const nextColumn = column.nextElementSibling;
+    function scheduleSave() {
+        clearTimeout(saveTimer);
+        saveTimer = setTimeout(writeSavedWidths, SAVE_DELAY);
+    }
 
-            if (!prevColumn || !nextColumn) return;
+    // Give a column (and the columns enclosing it) a resizer handle on first hover,
+    // so page load does not create one element per column in the deck
+    function ensureResizer(column) {
+        while (column) {
+            if (!column.dataset.resizerReady) {
+                column.dataset.resizerReady = 'true';
+                if (column.nextElementSibling) { // The last column has no right neighbour to trade width with
+                    const resizer = document.createElement('div');
+                    resizer.classList.add('column-resizer'); // Ensure the correct class is added
+                    column.appendChild(resizer);
+                }
+            }
+            column = column.parentElement.closest('.column');
+        }
+    }
+
+    // Dragging a handle moves the boundary between its column and the next one.
+    // Geometry is measured once at pointerdown; moves only record the pointer
+    // position, and the widths are written at most once per animation frame.
+    function startResize(e) {
+        const resizer = e.target;
+        const column = resizer.parentElement;
+        const nextColumn = column.nextElementSibling;
+        if (!nextColumn) {
+            return;
+        }
+        e.preventDefault(); // Prevent default browser behavior
+        e.stopPropagation(); // Stop event from propagating
+
+        const columnRect = column.getBoundingClientRect();
+        drag = {
+            resizer,
+            column,
+            nextColumn,
+            left: columnRect.left,
+            pairWidth: columnRect.width + nextColumn.getBoundingClientRect().width,
+            containerWidth: column.parentElement.getBoundingClientRect().width,
+            clientX: e.clientX,
+            frame: 0,
+        };
+        resizer.setPointerCapture(e.pointerId);
+        resizer.addEventListener('pointermove', moveResize);
+        resizer.addEventListener('pointerup', stopResize);
+        resizer.addEventListener('pointercancel', stopResize);
+        window.isResizing = true; // Set the resizing flag to true
+        window.ignoreNextClick = true; // Set the global flag to ignore the next click
+    }
 
-            const containerWidth = prevColumn.parentElement.getBoundingClientRect().width;
+    function moveResize(e) {
+        drag.clientX = e.clientX;
+        if (!drag.frame) {
+            drag.frame = requestAnimationFrame(applyResize);
+        }
+    }
 
-            const mouseX = e.clientX;
+    function applyResize() {
+        drag.frame = 0;
+        const width = Math.min(Math.max(drag.clientX - drag.left, MIN_WIDTH), drag.pairWidth - MIN_WIDTH);
+        if (width < MIN_WIDTH) {
+            return; // The two columns are too narrow to trade width
+        }
+        // Calculate percentage widths
+        drag.column.style.flex = `0 0 ${(width / drag.containerWidth) * 100}%`;
+        drag.nextColumn.style.flex = `0 0 ${((drag.pairWidth - width) / drag.containerWidth) * 100}%`;
+    }
 
-            const newPrevWidth = mouseX - prevColumn.getBoundingClientRect().left;
-            const newNextWidth = containerWidth - newPrevWidth - column.getBoundingClientRect().width - resizer.offsetWidth;
+    function stopResize(e) {
+        const { resizer, column, nextColumn } = drag;
+        if (drag.frame) {
+            cancelAnimationFrame(drag.frame);
+            applyResize();
+        }
+        drag = null;
+        resizer.removeEventListener('pointermove', moveResize);
+        resizer.removeEventListener('pointerup', stopResize);
+        resizer.removeEventListener('pointercancel', stopResize);
+        if (resizer.hasPointerCapture(e.pointerId)) {
+            resizer.releasePointerCapture(e.pointerId);
+        }
+        window.isResizing = false; // Unset the resizing flag
 
-            // Optional: Set minimum widths
-            if (newPrevWidth < 100 || newNextWidth < 100) return;
+        // Remember both widths under the deck's key
+        const widths = getSavedWidths();
+        [column, nextColumn].forEach(col => {
+            if (col.dataset.columnId && col.style.flexBasis) {
+                widths[col.dataset.columnId] = col.style.flexBasis;
+            }
+        });
+        scheduleSave();
 
-            // Calculate percentage widths
-            const newPrevWidthPercent = (newPrevWidth / containerWidth) * 100;
-            const newNextWidthPercent = (newNextWidth / containerWidth) * 100;
+        // Reset the global flag after a short delay to allow any synthetic clicks to be ignored
+        setTimeout(() => {
+            window.ignoreNextClick = false;
+        }, 200);
+    }
 
-            prevColumn.style.flex = `0 0 ${newPrevWidthPercent}%`;
-            nextColumn.style.flex = `0 0 ${newNextWidthPercent}%`;
+    function initializeResizers() {
+        const content = document.getElementById('content');
+        if (!content) {
+            log('Content container not found.', 'error');
+            return;
         }
 
-        function stopResizing(e) {
-            window.removeEventListener('mousemove', startResizing);
-            window.removeEventListener('mouseup', stopResizing);
-            window.isResizing = false; // Unset the resizing flag
+        content.addEventListener('pointerover', (e) => {
+            const column = e.target.closest('.column');
+            if (column && !column.dataset.resizerReady) {
+                ensureResizer(column);
+            }
+        });
 
-            // Reset the global flag after a short delay to allow any synthetic clicks to be ignored
-            setTimeout(() => {
-                window.ignoreNextClick = false;
-            }, 200);
-        }
+        content.addEventListener('pointerdown', (e) => {
+            if (e.button === 0 && e.target.classList.contains('column-resizer') && drag === null) {
+                startResize(e);
+            }
+        });
 
-        function saveColumnWidths() {
-            const columns = document.querySelectorAll('.column');
-            const widths = [];
-            columns.forEach(column => {
-                widths.push(column.style.flexBasis);
-            });
-            localStorage.setItem('columnWidths', JSON.stringify(widths));
-        }
+        // Do not lose a pending write when the page goes away
+        window.addEventListener('pagehide', () => {
+            if (saveTimer !== null) {
+                writeSavedWidths();
+            }
+        });
     }
 
-    function loadColumnWidths() {
-        const widths = JSON.parse(localStorage.getItem('columnWidths'));
-        if (widths) {
-            const columns = document.querySelectorAll('.column');
-            columns.forEach((column, idx) => {
-                if (widths[idx]) {
-                    column.style.flex = `0 0 ${widths[idx]}`;
-                }
-            });
+    // Restore the saved widths of the columns within root (the whole document by default)
+    function loadColumnWidths(root = document) {
+        const widths = getSavedWidths();
+        if (Object.keys(widths).length === 0) {
+            return;
         }
+        root.querySelectorAll('.column[data-column-id]').forEach(column => {
+            const width = widths[column.dataset.columnId];
+            if (width) {
+                column.style.flex = `0 0 ${width}`;
+            }
+        });
     }
 
     return { initializeResizers, loadColumnWidths };
 })();
 
+// Images embedded by an inline export and shown on several slides are stored
+// once in #image-data; their <img> elements carry data-image-id instead of a src.
+const ImageManager = (() => {
+    let imageData = null; // Parsed on first use
+
+    function loadImages(root = document) {
+        const images = root.querySelectorAll('img[data-image-id]');
+        if (images.length === 0) {
+            return;
+        }
+        if (imageData === null) {
+            const block = document.getElementById('image-data');
+            imageData = block ? JSON.parse(block.textContent) : {};
+        }
+        images.forEach(img => {
+            const uri = imageData[img.dataset.imageId];
+            if (uri) {
+                img.src = uri;
+            }
+        });
+    }
+
+    return { loadImages };
+})();
+
+// Lazy slides restore their column widths and shared images when they are materialized
+document.addEventListener('slideMaterialized', (event) => {
+    Resizer.loadColumnWidths(event.detail.slide);
+    ImageManager.loadImages(event.detail.slide);
+});
+
 
 
 // Initialize Everything
@@ -447,77 +751,73 @@ document.addEventListener('DOMContentLoaded', () => {
     slideManager.setupKeyboardNavigation(); // Enable keyboard navigation
     TOCManager.setupTOCNavigation();
     BreadcrumbManager.setupBreadcrumbNavigation(); // Initialize breadcrumb navigation
-    BreadcrumbManager.updateBreadcrumb(); // Initialize breadcrumb state
     CollapsibleManager.setupCollapsibles();
     ContentManager.setupContentClick();
     SidebarManager.setupSidebarToggle();
     ContentFirstManager.setupContentFirstToggle(); // Initialize Content-First toggle
     Resizer.initializeResizers();
     Resizer.loadColumnWidths();
-});
-
-// Deactivate nextslide for resizableElements
-document.addEventListener('DOMContentLoaded', function() {
-    const resizableElements = document.querySelectorAll('.resizable');
-    resizableElements.forEach(function(element) {
-        element.addEventListener('click', function(event) {
-            // Stop the click event from bubbling up to parent elements
-            event.stopPropagation();
-        });
-    });
+    ImageManager.loadImages();
 });
 
 
 // Theme Switching
+// The build compiles every theme into one stylesheet scoped by the data-theme
+// attribute of <html> and lists the theme names in data-themes, so switching
+// is an attribute change: no stylesheet is fetched.
+const ThemeManager = (() => {
+    const root = document.documentElement;
+    const themes = (root.dataset.themes || '').split(' ').filter(Boolean);
+
+    function applyTheme(theme) {
+        root.dataset.theme = theme;
+        log(`Theme switched to: ${theme}`);
+    }
 
-const themes = [
-    "static/css/themes/style-dark.css",
-    "static/css/themes/style-blue.css",
-    "static/css/themes/style-seafoam.css"
-];
+    // Rotate through the themes (step 1: next, -1: previous) and remember the choice
+    function switchTheme(step = 1) {
+        if (themes.length === 0) {
+            log('No themes listed on the page.', 'error');
+            return;
+        }
+        const current = Math.max(0, themes.indexOf(root.dataset.theme));
+        const theme = themes[(current + step + themes.length) % themes.length];
+        applyTheme(theme);
+        localStorage.setItem('theme', theme);
+    }
 
-let currentThemeIndex = 0;
+    // Restore the theme chosen on an earlier visit
+    function loadSavedTheme() {
+        const saved = localStorage.getItem('theme');
+        if (saved !== null && themes.includes(saved)) {
+            applyTheme(saved);
+        }
+    }
 
-// Function to switch themes
+    return { switchTheme, loadSavedTheme };
+})();
+
+// Kept for inline handlers and custom templates
 function switchTheme() {
-    currentThemeIndex = (currentThemeIndex + 1) % themes.length; // Rotate to the next theme
-    document.getElementById("theme-stylesheet").href = themes[currentThemeIndex];
+    ThemeManager.switchTheme(1);
 }
 
-// Add event listener for key combination
+// Ctrl + Up (or Ctrl + Shift + Down): next theme; Ctrl + Down (or Ctrl + Shift + Up): previous theme
 document.addEventListener("keydown", (event) => {
-    if (event.ctrlKey && event.key === "ArrowUp") {
-        // Ctrl + Up Arrow: Switch to the next theme
-        switchTheme();
-    } else if (event.ctrlKey && event.shiftKey && event.key === "ArrowUp") {
-        // Ctrl + Shift + Up Arrow: Switch to the previous theme
-        currentThemeIndex = (currentThemeIndex - 1 + themes.length) % themes.length;
-        document.getElementById("theme-stylesheet").href = themes[currentThemeIndex];
-    } else if (event.ctrlKey && event.shiftKey && event.key === "ArrowDown") {
-        // Ctrl + Shift + Down Arrow: Switch to the next theme
-        switchTheme();
-    } else if (event.ctrlKey && event.key === "ArrowDown") {
-        // Ctrl + Down Arrow: Switch to the previous theme
-        currentThemeIndex = (currentThemeIndex - 1 + themes.length) % themes.length;
-        document.getElementById("theme-stylesheet").href = themes[currentThemeIndex];
-    }
-
-    // Save the current theme index in localStorage
-    localStorage.setItem("themeIndex", currentThemeIndex);
+    if (!event.ctrlKey || (event.key !== "ArrowUp" && event.key !== "ArrowDown")) {
+        return;
+    }
+    const forward = (event.key === "ArrowUp") !== event.shiftKey;
+    ThemeManager.switchTheme(forward ? 1 : -1);
 });
 
 // Load the saved theme on page load
-const savedThemeIndex = localStorage.getItem("themeIndex");
-if (savedThemeIndex !== null) {
-    currentThemeIndex = parseInt(savedThemeIndex, 0);
-    document.getElementById("theme-stylesheet").href = themes[currentThemeIndex];
-}
+ThemeManager.loadSavedTheme();
 
 
 // Utility to center the active breadcrumb
 function centerActiveBreadcrumb(index) {
-    const breadcrumb = document.querySelector('.breadcrumb ol');
-    const activeLink = breadcrumb.querySelectorAll('a')[index];
+    const activeLink = BreadcrumbManager.getLink(index);
 
     if (activeLink) {
         // Smooth scroll to center the active breadcrumb
@@ -527,19 +827,12 @@ function centerActiveBreadcrumb(index) {
         });
 
         // Update active breadcrumb styling
-        breadcrumb.querySelectorAll('a').forEach((link, i) => {
-            if (i === index) {
-                link.classList.add('active');
-            } else {
-                link.classList.remove('active');
-            }
-        });
+        BreadcrumbManager.updateBreadcrumb(index);
     }
 }
 
-// Extend navigateTo to include breadcrumb centering
+// Navigate from a breadcrumb; the slideChange listener below centers it
 function navigateTo(index) {
-    centerActiveBreadcrumb(index); // Center the breadcrumb
     slideManager.goToslide(index); // Trigger navigation to the slide
 }
 
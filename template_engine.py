@@ -0,0 +1,123 @@
+# template_engine.py
+import os
+import re
+from typing import Dict, List, Tuple, Union, Callable, TextIO
+
+# {{name}} placeholders; names may contain letters, digits, "_" and "-"
+SLOT_PATTERN = re.compile(r"\{\{\s*([A-Za-z_][\w-]*)\s*\}\}")
+
+# A slot value is either text or a callable that writes its text to the output stream
+SlotValue = Union[str, Callable[[TextIO], None]]
+
+
+class CompiledTemplate:
+    """
+    A template split once into literal chunks and the slots between them.
+
+    ``chunks`` always has one more entry than ``slots``: rendering writes
+    ``chunks[0]``, the value of ``slots[0]``, ``chunks[1]`` and so on, so the
+    document is produced in a single pass and slot values are never scanned
+    for placeholders themselves.
+
+    Args:
+        chunks (List[str]): Literal text around the slots.
+        slots (List[str]): Slot names, in document order.
+    """
+
+    def __init__(self, chunks: List[str], slots: List[str]):
+        self.chunks = chunks
+        self.slots = slots
+
+    @classmethod
+    def compile(cls, text: str) -> "CompiledTemplate":
+        parts = SLOT_PATTERN.split(text)
+        return cls(parts[0::2], parts[1::2])
+
+    @property
+    def slot_names(self) -> List[str]:
+        return list(dict.fromkeys(self.slots))
+
+    def bind(self, values: Dict[str, str]) -> "CompiledTemplate":
+        """Returns a copy with the given slots replaced by fixed text, merged into the surrounding literals."""
+        chunks = [self.chunks[0]]
+        slots = []
+        for slot, chunk in zip(self.slots, self.chunks[1:]):
+            if slot in values:
+                chunks[-1] += values[slot] + chunk
+            else:
+                slots.append(slot)
+                chunks.append(chunk)
+        return CompiledTemplate(chunks, slots)
+
+    def map_literals(self, transform: Callable[[str], str]) -> "CompiledTemplate":
+        """Returns a copy whose literal chunks were passed through ``transform`` (e.g. asset inlining)."""
+        return CompiledTemplate([transform(chunk) for chunk in self.chunks], list(self.slots))
+
+    def insert_before(self, marker: str, text: str) -> "CompiledTemplate":
+        """Returns a copy with ``text`` inserted before the last occurrence of ``marker`` in a literal chunk."""
+        chunks = list(self.chunks)
+        for i in range(len(chunks) - 1, -1, -1):
+            head, found, tail = chunks[i].rpartition(marker)
+            if found:
+                chunks[i] = head + text + marker + tail
+                break
+        return CompiledTemplate(chunks, list(self.slots))
+
+    def with_slot_before(self, marker: str, name: str) -> "CompiledTemplate":
+        """Returns a copy with a slot inserted before the last occurrence of ``marker``, unless the slot exists."""
+        if name in self.slots:
+            return self
+        for i in range(len(self.chunks) - 1, -1, -1):
+            head, found, tail = self.chunks[i].rpartition(marker)
+            if found:
+                chunks = self.chunks[:i] + [head, found + tail] + self.chunks[i + 1:]
+                slots = self.slots[:i] + [name] + self.slots[i:]
+                return CompiledTemplate(chunks, slots)
+        return self
+
+    def render(self, out: TextIO, values: Dict[str, SlotValue]) -> None:
+        """
+        Writes the template to ``out``, substituting every slot in one pass.
+
+        Slots without a value are written back unchanged, so custom templates
+        may carry placeholders meant for a later stage.
+
+        Args:
+            out (TextIO): Stream receiving the document.
+            values (Dict[str, SlotValue]): Slot name to text, or to a callable
+                writing the text to ``out`` (called when the slot is reached).
+        """
+        write = out.write
+        for chunk, slot in zip(self.chunks, self.slots):
+            write(chunk)
+            value = values.get(slot)
+            if value is None:
+                write("{{" + slot + "}}")
+            elif isinstance(value, str):
+                write(value)
+            else:
+                value(out)
+        write(self.chunks[-1])
+
+
+_compiled_templates: Dict[str, Tuple[float, CompiledTemplate]] = {}
+
+
+def load_template(template_path: str) -> CompiledTemplate:
+    """
+    Returns the compiled template, reusing the in-memory copy while the file is unchanged.
+
+    Args:
+        template_path (str): Path to the HTML template.
+
+    Returns:
+        CompiledTemplate: The parsed template.
+    """
+    mtime = os.path.getmtime(template_path)
+    cached = _compiled_templates.get(template_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(template_path, "r", encoding="utf-8") as f:
+        template = CompiledTemplate.compile(f.read())
+    _compiled_templates[template_path] = (mtime, template)
+    return template
@@ -0,0 +1,14 @@
+# tests/conftest.py
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture(autouse=True)
+def repo_cwd(monkeypatch):
+    """Builds read templates and static files relative to the repository root, as main.py does."""
+    monkeypatch.chdir(REPO_ROOT)
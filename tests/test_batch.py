@@ -0,0 +1,23 @@
+# tests/test_batch.py
+import os
+
+import pytest
+
+from batch import output_names
+
+
+def test_decks_in_one_folder_are_named_after_their_files():
+    assert output_names(["decks/intro.json", "decks/outro.yaml"]) == {
+        "decks/intro.json": "intro",
+        "decks/outro.yaml": "outro",
+    }
+
+
+def test_same_file_name_in_different_folders_gets_different_folders():
+    names = output_names(["a/deck.json", "b/deck.yaml"])
+    assert names == {"a/deck.json": os.path.join("a", "deck"), "b/deck.yaml": os.path.join("b", "deck")}
+
+
+def test_same_name_with_different_extensions_is_rejected():
+    with pytest.raises(ValueError, match="deck.json and decks/deck.yml"):
+        output_names(["decks/deck.json", "decks/deck.yml"])
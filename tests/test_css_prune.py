@@ -0,0 +1,83 @@
+# tests/test_css_prune.py
+import os
+from typing import Any, Dict, List, Set
+
+from css_prune import PRUNED_CSS_FOLDER, script_tokens
+from main import build_presentation, default_slides
+from metrics import BuildMetrics
+from theme_bundle import block_end, split_selectors
+
+# Every selector of core.css the sample deck can match, once the page and the runtime are scanned
+SAMPLE_DECK_SELECTORS = {
+    ":root", "html", "body", "h1", "h2", "h3", "a:focus", "button:focus",
+    "body.content-first .container", "body.content-first .header", "body.content-first .sidebar",
+    ".breadcrumb", ".breadcrumb a", ".breadcrumb a.active", ".breadcrumb a:hover", ".breadcrumb li",
+    ".breadcrumb li::after", ".breadcrumb li:last-child::after", ".breadcrumb ol",
+    ".breadcrumb ol::-webkit-scrollbar", ".breadcrumb ol:after", ".breadcrumb ol:before",
+    ".chart-container", ".chart-container canvas",
+    ".collapsible", ".collapsible.active", ".collapsible.level-1 + .content-panel",
+    ".collapsible.level-2", ".collapsible.level-2 + .content-panel", ".collapsible:focus",
+    ".column", ".column-resizer", ".column-resizer:hover", ".columns", ".rows", ".resizable",
+    ".container", ".content", ".content img", ".content-wrapper", ".header",
+    ".content-panel", ".content-panel .collapsible", ".content-panel .content-panel",
+    ".content-panel.active", ".content-panel.level-1", ".content-panel.level-2",
+    ".image-content", ".image-content img", ".text-content",
+    ".sidebar", ".sidebar a", ".sidebar a.active", ".sidebar a:focus", ".sidebar a:focus-visible",
+    ".sidebar a:hover", ".sidebar h3", ".sidebar.minimized", ".sidebar.minimized + .container",
+    ".sidebar.minimized .toggle-tab", ".sidebar.minimized h3",
+    ".slide", ".slide.active", ".toggle-content-first", ".toggle-tab", ".toggle-tab:focus",
+}
+
+PLAIN_DECK = [
+    {"title": "", "html-content": ["<h1>Plain Deck</h1>"], "dark": True},
+    {"title": "Text Only", "content": ["<p>No charts, columns or folds.</p>"]},
+]
+
+
+def css_selectors(css: str) -> Set[str]:
+    """Returns the selectors of a stylesheet, including those inside @media blocks."""
+    selectors = set()
+    i = 0
+    while True:
+        start = css.find("{", i)
+        if start < 0:
+            return selectors
+        end = block_end(css, start)
+        prelude = " ".join(css[i:start].split())
+        if prelude.startswith(("@media", "@supports")):
+            selectors |= css_selectors(css[start + 1:end])
+        elif not prelude.startswith("@"):
+            selectors.update(split_selectors(prelude))
+        i = end + 1
+
+
+def build_pruned(slides: List[Dict[str, Any]], output_folder: str, title: str) -> str:
+    """Builds a deck with --prune_css and returns its pruned stylesheet."""
+    filename = build_presentation(title, slides, output_folder, metrics=BuildMetrics(), prune_css=True)
+    pruned_path = os.path.join(output_folder, PRUNED_CSS_FOLDER, os.path.splitext(filename)[0] + ".css")
+    with open(pruned_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_sample_deck_keeps_used_selectors(tmp_path):
+    pruned = build_pruned(default_slides(), str(tmp_path), "Sample")
+    assert css_selectors(pruned) == SAMPLE_DECK_SELECTORS
+    # The pruned copy replaces core.css in the output
+    assert not os.path.exists(tmp_path / "static" / "css" / "core.css")
+
+
+def test_plain_deck_drops_chart_column_and_fold_rules(tmp_path):
+    selectors = css_selectors(build_pruned(PLAIN_DECK, str(tmp_path), "Plain"))
+    assert ".slide.active" in selectors
+    for feature in ("chart", "column", "collapsible", "content-panel", "resiz"):
+        assert not [selector for selector in selectors if feature in selector], feature
+
+
+def test_script_tokens_only_counts_class_list_arguments():
+    source = """
+        button.classList.toggle('active', isActive);
+        el.classList.replace("old", 'new');
+        const column = e.target.closest('.column');
+        document.querySelectorAll('.chart-container');
+    """
+    assert script_tokens(source) == {".active", ".old", ".new"}
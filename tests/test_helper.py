@@ -0,0 +1,79 @@
+# tests/test_helper.py
+import copy
+import io
+import re
+from typing import List
+
+import pytest
+
+from helper import render_slides
+from main import default_slides
+from test_slide_model import NESTED_DECK
+
+ID_PATTERN = re.compile(r'\bid="([^"]*)"')
+CONTROLS_PATTERN = re.compile(r'\baria-controls="([^"]*)"')
+
+
+def rendered(slides, lazy: bool = False) -> str:
+    out = io.StringIO()
+    render_slides(slides, out, lazy=lazy)
+    return out.getvalue()
+
+
+def emitted_ids(slides, lazy: bool = False) -> List[str]:
+    return ID_PATTERN.findall(rendered(slides, lazy))
+
+
+def panel_id(html: str, title: str) -> str:
+    """Returns the ID of the panel opened by the fold button labelled ``title``."""
+    return re.search(rf'aria-controls="([^"]*)">{title}</button>', html).group(1)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("deck", [default_slides(), NESTED_DECK], ids=["sample", "nested"])
+def test_rendered_ids_are_unique(deck, lazy):
+    ids = emitted_ids(deck, lazy)
+    assert ids
+    assert len(ids) == len(set(ids))
+
+
+def test_every_fold_button_controls_a_rendered_panel():
+    html = rendered(NESTED_DECK)
+    controls = CONTROLS_PATTERN.findall(html)
+    assert controls
+    assert set(controls) <= set(ID_PATTERN.findall(html))
+
+
+def append_slide(slides):
+    slides.append({"title": "Appendix", "content": ["More"], "folds": [{"title": "Notes", "content": ["..."]}]})
+
+
+def append_sibling_fold(slides):
+    slides[1]["folds"][0]["folds"].append({"title": "Brevity", "content": ["Fewer words."]})
+
+
+def fold_into_earlier_slide(slides):
+    slides[0].setdefault("folds", []).append({"title": "About", "content": ["Title slide notes."]})
+
+
+def fold_into_sibling(slides):
+    slides[1]["folds"][0]["folds"][0].setdefault("folds", []).append({"title": "Sparklines", "content": ["Tiny charts."]})
+
+
+# IDs follow the position of an element within its parent, so only an element
+# inserted before it at its own level renumbers it
+@pytest.mark.parametrize("insert", [append_slide, append_sibling_fold, fold_into_earlier_slide, fold_into_sibling])
+def test_rendered_ids_survive_unrelated_insertions(insert):
+    slides = copy.deepcopy(default_slides())
+    html = rendered(slides)
+    before = ID_PATTERN.findall(html)
+    clarity = panel_id(html, "Clarity")
+
+    insert(slides)
+    html = rendered(slides)
+    after = ID_PATTERN.findall(html)
+
+    assert len(after) > len(before)
+    assert len(after) == len(set(after))
+    assert set(before) <= set(after)
+    assert panel_id(html, "Clarity") == clarity
@@ -0,0 +1,58 @@
+# tests/test_images.py
+import io
+import os
+import shutil
+
+import pytest
+
+from helper import copy_images, render_slides
+
+
+PLACEHOLDER = "static/images/placeholder.png"
+
+
+def rendered(slides):
+    out = io.StringIO()
+    render_slides(slides, out)
+    return out.getvalue()
+
+
+def test_missing_image_keeps_its_configured_path(tmp_path):
+    slides = [{"title": "Photo", "image": "photo.png"}, {"title": "Blank"}]
+    copy_images(slides, str(tmp_path / "src"), str(tmp_path / "out"), PLACEHOLDER)
+    assert slides[0]["image"] == "photo.png"
+    assert "image" not in slides[1]
+    assert 'src="images/placeholder.png"' in rendered(slides)
+
+
+def test_image_added_after_a_build_replaces_the_placeholder(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    slides = [{"title": "Photo", "image": "photo.png"}]
+    copy_images(slides, str(source), str(tmp_path / "out"), PLACEHOLDER)
+    assert 'src="images/placeholder.png"' in rendered(slides)
+
+    # What a watch-mode images rebuild does with the slides of the last build
+    shutil.copy(PLACEHOLDER, source / "photo.png")
+    copy_images(slides, str(source), str(tmp_path / "out"), PLACEHOLDER)
+    assert (tmp_path / "out" / "photo.png").is_file()
+    assert 'src="images/photo.png"' in rendered(slides)
+
+
+def test_optimize_prunes_the_variants_of_a_replaced_image(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    from image_pipeline import DIGEST_INDEX, optimize_images
+
+    source = tmp_path / "src"
+    source.mkdir()
+    images = tmp_path / "out" / "images"
+    slides = [{"title": "Photo", "image": "photo.png"}]
+    for width in (600, 640):
+        Image.new("RGB", (width, 400), "red").save(source / "photo.png")
+        copy_images(slides, str(source), str(images), PLACEHOLDER)
+        optimize_images(slides, str(images), widths=(480,), formats=(), jobs=1)
+
+    # Only the variant of the current photo is left; the index stays out of the published images
+    variant = os.path.basename(slides[0]["image-info"]["src"])
+    assert sorted(path.name for path in images.iterdir()) == sorted(["photo.png", variant])
+    assert (tmp_path / "out" / DIGEST_INDEX).is_file()
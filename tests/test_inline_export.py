@@ -0,0 +1,31 @@
+# tests/test_inline_export.py
+import os
+
+import pytest
+
+from inline_export import VENDORED_CHART_JS
+from main import build_presentation
+from metrics import BuildMetrics
+
+
+CHART_DECK = [{
+    "title": "Chart",
+    "folds": [{"title": "Data", "chart": {"type": "bar", "data": {"labels": ["a"], "datasets": []}}}],
+}]
+
+
+@pytest.mark.skipif(os.path.isfile(VENDORED_CHART_JS), reason="Chart.js is vendored")
+def test_inline_export_of_charts_needs_the_vendored_chart_js(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        build_presentation("Charts", CHART_DECK, str(tmp_path / "out"), inline=True, metrics=BuildMetrics())
+    assert VENDORED_CHART_JS in capsys.readouterr().out
+    assert not (tmp_path / "out").exists()
+
+
+def test_inline_export_without_charts_is_self_contained(tmp_path):
+    slides = [{"title": "Text", "content": ["Hello"]}]
+    main_file = build_presentation("Text", slides, str(tmp_path), inline=True, metrics=BuildMetrics())
+    with open(tmp_path / main_file, encoding="utf-8") as f:
+        html = f.read()
+    assert '<link rel="stylesheet"' not in html
+    assert 'src="images/' not in html
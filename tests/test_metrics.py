@@ -0,0 +1,22 @@
+# tests/test_metrics.py
+from main import build_presentation, default_slides
+from metrics import BuildMetrics
+from render_cache import RenderCache
+
+
+def test_slides_are_counted_once(tmp_path):
+    slides = default_slides()
+    metrics = BuildMetrics()
+    build_presentation("Sample", slides, str(tmp_path), metrics=metrics)
+    assert metrics.counts["slides"] == len(slides)
+    assert metrics.to_dict()["slides"]["count"] == len(slides)
+
+
+def test_slides_are_counted_once_with_cache(tmp_path):
+    slides = default_slides()
+    cache = RenderCache(str(tmp_path / ".render_cache"))
+    for _ in range(2):
+        metrics = BuildMetrics()
+        build_presentation("Sample", slides, str(tmp_path), cache=cache, metrics=metrics)
+        assert metrics.counts["slides"] == len(slides)
+    assert metrics.counts["cached"] == len(slides)
@@ -0,0 +1,60 @@
+# tests/test_slide_model.py
+from typing import Any, Dict, List
+
+from main import default_slides
+from slide_model import duplicate_ids, iter_element_ids, parse_slides
+
+CHART = {"type": "bar", "data": {"labels": ["a", "b"], "datasets": [{"data": [1, 2]}]}}
+
+
+def nested_folds(depth: int) -> List[Dict[str, Any]]:
+    """Two folds per level, each with a chart and ``depth - 1`` further levels below it."""
+    if depth == 0:
+        return []
+    return [{"title": f"Fold {i}", "chart": CHART, "folds": nested_folds(depth - 1)} for i in range(2)]
+
+
+def nested_layout(depth: int) -> Dict[str, Any]:
+    """Columns holding folds, rows and further columns, down to ``depth`` levels."""
+    cell: Dict[str, Any] = {"text": "cell", "folds": nested_folds(2)}
+    if depth > 1:
+        cell["rows"] = {"content": [
+            {"text": "row", "folds": nested_folds(2)},
+            {"columns": nested_layout(depth - 1)["columns"]},
+            {"rows": {"content": [{"folds": nested_folds(1)}]}},
+        ]}
+        cell["columns"] = nested_layout(depth - 1)["columns"]
+    return {"columns": {"number": 2, "size": ["50%", "50%"], "content": [cell, dict(cell)]}}
+
+
+NESTED_DECK = [
+    {"title": "", "html-content": ["<h1>Nested</h1>"]},
+    {"title": "Layout", "content": [
+        nested_layout(3),
+        {"rows": {"content": [nested_layout(2), {"text": "row", "folds": nested_folds(2)}]}},
+    ], "folds": nested_folds(3)},
+    {"title": "Folds", "content": [{"title": "Inline fold", "folds": nested_folds(3)}], "folds": nested_folds(2)},
+]
+
+
+def element_ids(slides) -> List[str]:
+    return [node_id for slide in slides for node_id in iter_element_ids(slide)]
+
+
+def test_sample_deck_ids_are_unique():
+    slides = parse_slides(default_slides())
+    assert element_ids(slides)
+    assert duplicate_ids(slides) == []
+
+
+def test_nested_deck_ids_are_unique():
+    slides = parse_slides(NESTED_DECK)
+    # Folds and charts at every depth of columns, rows and folds are counted
+    assert len(element_ids(slides)) > 500
+    assert duplicate_ids(slides) == []
+
+
+def test_duplicate_ids_reports_each_collision_once():
+    slides = parse_slides(NESTED_DECK)
+    first = element_ids(slides[1:2])
+    assert duplicate_ids(slides + slides[1:2]) == list(dict.fromkeys(first))
@@ -0,0 +1,24 @@
+# tests/test_validation.py
+import pytest
+
+from main import default_slides
+from validation import DeckValidationError, check_slides, validate_slides
+
+
+def test_sample_deck_is_valid():
+    assert [issue for issue in validate_slides(default_slides()) if issue.severity == "error"] == []
+
+
+@pytest.mark.parametrize("slide, path", [
+    ({"title": "A", "content": [{"columns": {"number": -1}}]}, "slides[0].content[0].columns.number"),
+    ({"title": "A", "content": [{"columns": {"number": 2, "size": "50%"}}]}, "slides[0].content[0].columns.size"),
+    ({"title": "A", "content": [{"rows": {"content": "row"}}]}, "slides[0].content[0].rows.content"),
+    ({"title": "A", "folds": [{"content": [{"text": 3}]}]}, "slides[0].folds[0].content[0].text"),
+    ({"title": "A", "folds": [{"chart": []}]}, "slides[0].folds[0].chart"),
+    ({"title": "A", "content": [3]}, "slides[0].content[0]"),
+    ({"title": "A", "image": 3}, "slides[0].image"),
+])
+def test_malformed_nodes_are_rejected_before_parsing(slide, path):
+    with pytest.raises(DeckValidationError) as error:
+        check_slides([slide])
+    assert path in [issue.path for issue in error.value.issues]
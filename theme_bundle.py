@@ -0,0 +1,180 @@
+# theme_bundle.py
+import os
+import re
+from typing import Dict, List, Optional
+
+# Theme stylesheets are named style-<theme>.css
+THEMES_DIR = os.path.join("static", "css", "themes")
+THEME_FILE_PATTERN = re.compile(r"^style-(?P<name>[\w-]+)\.css$")
+
+# File name of the compiled bundle, written next to the theme files in the output folder
+BUNDLE_NAME = "themes.css"
+DEFAULT_THEME = "dark"
+
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+TRAILING_SPACE_PATTERN = re.compile(r"[ \t]+$", re.M)
+ROOT_SELECTOR_PATTERN = re.compile(r"^(:root|html)(?![\w-])")
+
+
+def discover_themes(themes_dir: str = THEMES_DIR) -> Dict[str, str]:
+    """
+    Finds the theme stylesheets in a folder.
+
+    Args:
+        themes_dir (str): Folder holding the ``style-<theme>.css`` files.
+
+    Returns:
+        Dict[str, str]: Theme name to stylesheet path, sorted by name.
+    """
+    themes = {}
+    if os.path.isdir(themes_dir):
+        for filename in sorted(os.listdir(themes_dir)):
+            match = THEME_FILE_PATTERN.match(filename)
+            if match:
+                themes[match.group("name")] = os.path.join(themes_dir, filename)
+    return themes
+
+
+def block_end(css: str, start: int) -> int:
+    """Returns the index of the brace closing the block opened at ``start``, skipping quoted strings."""
+    depth = 0
+    i = start
+    while i < len(css):
+        c = css[i]
+        if c in "\"'":
+            i = css.find(c, i + 1)
+            if i < 0:
+                break
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return len(css) - 1
+
+
+def split_selectors(prelude: str) -> List[str]:
+    """Splits a selector list on the commas that are not inside parentheses (e.g. ``:is(a, b)``)."""
+    selectors = []
+    depth = 0
+    start = 0
+    for i, c in enumerate(prelude):
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "," and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return [selector for selector in selectors if selector]
+
+
+def scope_css(css: str, conditions: List[str]) -> str:
+    """
+    Restricts a stylesheet to documents whose root element matches one of ``conditions``.
+
+    ``:root``/``html`` selectors get the conditions attached, e.g.
+    ``:root:where([data-theme="blue"])``; any other selector is prefixed with
+    ``:where(:root[data-theme="blue"])``. ``:where`` adds no specificity, so the
+    scoped rules compete with core.css exactly as the theme file did.
+    Rules inside ``@media``/``@supports`` are scoped too; other at-rules
+    (``@font-face``, ``@keyframes``) are kept as they are.
+
+    Args:
+        css (str): The theme stylesheet.
+        conditions (List[str]): Attribute selectors, e.g. ``['[data-theme="blue"]']``.
+
+    Returns:
+        str: The scoped stylesheet, without comments.
+    """
+    root_scope = f":where({', '.join(conditions)})"
+    descendant_scope = f":where({', '.join(':root' + condition for condition in conditions)}) "
+    css = TRAILING_SPACE_PATTERN.sub("", COMMENT_PATTERN.sub("", css))
+    out = []
+    i = 0
+    while True:
+        start = css.find("{", i)
+        if start < 0:
+            break
+        end = block_end(css, start)
+        prelude = " ".join(css[i:start].split())
+        body = css[start + 1:end]
+        if prelude.startswith(("@media", "@supports")):
+            out.append(f"{prelude} {{\n{scope_css(body, conditions)}}}\n")
+        elif prelude.startswith("@"):
+            out.append(f"{prelude} {{{body}}}\n")
+        else:
+            selectors = []
+            for selector in split_selectors(prelude):
+                match = ROOT_SELECTOR_PATTERN.match(selector)
+                if match:
+                    selectors.append(match.group(1) + root_scope + selector[match.end():])
+                else:
+                    selectors.append(descendant_scope + selector)
+            out.append(f"{', '.join(selectors)} {{{body.rstrip()}\n}}\n")
+        i = end + 1
+    return "".join(out)
+
+
+def compile_theme_bundle(themes: Dict[str, str], default: str = DEFAULT_THEME) -> str:
+    """
+    Compiles theme stylesheets into one stylesheet, each scoped by ``data-theme`` on ``<html>``.
+
+    Switching themes in the browser is then an attribute change with no
+    stylesheet fetch. The default theme also applies to pages without a
+    ``data-theme`` attribute (custom templates that predate the bundle).
+
+    Args:
+        themes (Dict[str, str]): Theme name to stylesheet path (see ``discover_themes``).
+        default (str): Theme used when the page names none.
+
+    Returns:
+        str: The bundle CSS.
+    """
+    parts = ["/* Generated from static/css/themes/ by theme_bundle.py; edit the theme files instead. */\n"]
+    for name, path in themes.items():
+        with open(path, "r", encoding="utf-8") as f:
+            css = f.read()
+        conditions = [f'[data-theme="{name}"]']
+        if name == default:
+            conditions.append(":not([data-theme])")
+        parts.append(f"\n/* {name}: {os.path.basename(path)} */\n")
+        parts.append(scope_css(css, conditions))
+    return "".join(parts)
+
+
+def write_theme_bundle(output_folder: str, default: str = DEFAULT_THEME,
+                       themes_dir: str = THEMES_DIR, bundle: Optional[str] = None) -> Optional[str]:
+    """
+    Writes the theme bundle to ``static/css/themes/`` in the output folder.
+
+    The file is only rewritten when its content changes, so rebuilds leave
+    it (and its modification time) alone.
+
+    Args:
+        output_folder (str): Path to the output directory.
+        default (str): Theme used when the page names none.
+        themes_dir (str): Folder holding the theme stylesheets.
+        bundle (Optional[str]): Bundle already compiled with ``compile_theme_bundle`` (e.g. once
+            for a whole batch); compiled from ``themes_dir`` when None.
+
+    Returns:
+        Optional[str]: Path of the bundle if it was written, None if it was up to date.
+    """
+    if bundle is None:
+        bundle = compile_theme_bundle(discover_themes(themes_dir), default)
+    destination_folder = os.path.join(output_folder, "static", "css", "themes")
+    os.makedirs(destination_folder, exist_ok=True)
+    path = os.path.join(destination_folder, BUNDLE_NAME)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == bundle:
+                return None
+    except FileNotFoundError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(bundle)
+    return path
@@ -0,0 +1,373 @@
+# validation.py
+import argparse
+import os
+import time
+from typing import List, Dict, Any
+
+from chart_data import DOWNSAMPLERS
+
+# Keys read by the renderer for each kind of node; anything else is reported as unknown
+SLIDE_KEYS = frozenset(("title", "dark", "html-content", "content", "folds", "image", "image-info"))
+FOLD_KEYS = frozenset(("title", "chart", "html-content", "content", "folds"))
+CELL_KEYS = frozenset(("text", "html", "html-content", "folds", "rows", "columns"))
+MARKER_KEYS = frozenset(("text", "html"))
+COLUMNS_KEYS = frozenset(("number", "size", "content"))
+ROWS_KEYS = frozenset(("number", "content"))
+CONFIG_KEYS = frozenset(("title", "author", "date", "slides", "template-slots"))
+
+
+class ValidationIssue:
+    """A problem found in a configuration, located by its path (e.g. ``slides[12].folds[3].content[0]``)."""
+    __slots__ = ("path", "message", "severity")
+
+    def __init__(self, path: str, message: str, severity: str = "error"):
+        self.path = path
+        self.message = message
+        self.severity = severity
+
+    def __str__(self) -> str:
+        return f"{self.severity}: {self.path}: {self.message}"
+
+
+class DeckValidationError(ValueError):
+    """Raised when a deck has errors; ``issues`` holds every problem found, not just the first."""
+
+    def __init__(self, issues: List[ValidationIssue]):
+        errors = [issue for issue in issues if issue.severity == "error"]
+        super().__init__(f"{len(errors)} error(s) in the slides:\n" + "\n".join(f"  {issue}" for issue in errors))
+        self.issues = issues
+
+
+def _type_name(value: Any) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+class _Validator:
+    """Collects issues during a single walk over the configuration; no node is visited twice."""
+
+    def __init__(self):
+        self.issues: List[ValidationIssue] = []
+
+    def error(self, path: str, message: str) -> None:
+        self.issues.append(ValidationIssue(path, message))
+
+    def warning(self, path: str, message: str) -> None:
+        self.issues.append(ValidationIssue(path, message, "warning"))
+
+    def unknown_keys(self, node: Dict[str, Any], known: frozenset, path: str) -> None:
+        if not node.keys() <= known:
+            for key in node:
+                if key not in known:
+                    self.warning(f"{path}.{key}", "unknown key, ignored")
+
+    def string(self, value: Any, path: str) -> bool:
+        if type(value) is str:
+            return True
+        self.error(path, f"expected a string, got {_type_name(value)}")
+        return False
+
+    def text_list(self, value: Any, path: str) -> None:
+        """A string or a list of strings (``content`` of folds, ``html-content`` of slides)."""
+        if type(value) is str:
+            return
+        if type(value) is not list:
+            self.error(path, f"expected a string or a list of strings, got {_type_name(value)}")
+            return
+        for i, item in enumerate(value):
+            if type(item) is not str:
+                self.error(f"{path}[{i}]", f"expected a string, got {_type_name(item)}")
+
+    def marked_text(self, item: Dict[str, Any], path: str) -> None:
+        """An explicit ``{"text": ...}`` or ``{"html": ...}`` item."""
+        self.unknown_keys(item, MARKER_KEYS, path)
+        if "text" in item and "html" in item:
+            self.warning(path, "both 'text' and 'html' given; only 'html' is rendered")
+        key = "html" if "html" in item else "text"
+        self.string(item[key], f"{path}.{key}")
+
+    def content_list(self, value: Any, path: str) -> None:
+        """A string or a list of strings and text/html items (``content`` of folds)."""
+        if type(value) is str:
+            return
+        if type(value) is not list:
+            self.error(path, f"expected a string or a list, got {_type_name(value)}")
+            return
+        for i, item in enumerate(value):
+            if type(item) is str:
+                continue
+            if type(item) is dict and item.keys() & MARKER_KEYS:
+                self.marked_text(item, f"{path}[{i}]")
+            else:
+                self.error(f"{path}[{i}]", f"expected a string or a text/html mapping, got {_type_name(item)}")
+
+    def chart(self, spec: Any, path: str) -> None:
+        if type(spec) is not dict:
+            self.error(path, f"expected a chart mapping, got {_type_name(spec)}")
+            return
+        if "type" not in spec:
+            self.warning(path, "no chart 'type'")
+        if "data-file" not in spec:
+            return
+        self.string(spec["data-file"], f"{path}.data-file")
+        if "x" in spec:
+            self.string(spec["x"], f"{path}.x")
+        y = spec.get("y", "y")
+        if type(y) is list:
+            for i, name in enumerate(y):
+                self.string(name, f"{path}.y[{i}]")
+        else:
+            self.string(y, f"{path}.y")
+        max_points = spec.get("max-points", 3)
+        if type(max_points) is not int or max_points < 3:
+            self.error(f"{path}.max-points", f"expected an integer of at least 3, got {max_points!r}")
+        if spec.get("downsample", "lttb") not in DOWNSAMPLERS:
+            self.error(f"{path}.downsample", f"expected one of {', '.join(DOWNSAMPLERS)}, got {spec['downsample']!r}")
+
+    def fold(self, fold: Any, path: str) -> None:
+        if type(fold) is not dict:
+            self.error(path, f"expected a fold mapping, got {_type_name(fold)}")
+            return
+        self.unknown_keys(fold, FOLD_KEYS, path)
+        if "title" in fold:
+            self.string(fold["title"], f"{path}.title")
+        if "chart" in fold:
+            self.chart(fold["chart"], f"{path}.chart")
+        if "html-content" in fold:
+            self.string(fold["html-content"], f"{path}.html-content")
+        if "content" in fold:
+            self.content_list(fold["content"], f"{path}.content")
+        if "folds" in fold:
+            nested = fold["folds"]
+            # A single nested fold may be given without a list
+            if type(nested) is dict:
+                self.fold(nested, f"{path}.folds")
+            else:
+                self.folds(nested, f"{path}.folds")
+
+    def folds(self, folds: Any, path: str) -> None:
+        if type(folds) is not list:
+            self.error(path, f"expected a list of folds, got {_type_name(folds)}")
+            return
+        for j, fold in enumerate(folds):
+            self.fold(fold, f"{path}[{j}]")
+
+    def cell(self, cell: Dict[str, Any], path: str) -> None:
+        """A column cell or a row: optional text/html, html-content, folds, rows and columns."""
+        self.unknown_keys(cell, CELL_KEYS, path)
+        if cell.keys() & MARKER_KEYS:
+            key = "html" if "html" in cell else "text"
+            self.string(cell[key], f"{path}.{key}")
+        if "html-content" in cell:
+            self.string(cell["html-content"], f"{path}.html-content")
+        if "folds" in cell:
+            self.folds(cell["folds"], f"{path}.folds")
+        if "rows" in cell:
+            self.rows(cell["rows"], f"{path}.rows")
+        if "columns" in cell:
+            self.columns(cell["columns"], f"{path}.columns")
+
+    def rows(self, rows: Any, path: str) -> None:
+        if type(rows) is not dict:
+            self.error(path, f"expected a rows mapping, got {_type_name(rows)}")
+            return
+        self.unknown_keys(rows, ROWS_KEYS, path)
+        content = rows.get("content", [])
+        if type(content) is not list:
+            self.error(f"{path}.content", f"expected a list of rows, got {_type_name(content)}")
+            return
+        for i, row in enumerate(content):
+            row_path = f"{path}.content[{i}]"
+            if type(row) is not dict:
+                self.error(row_path, f"expected a row mapping, got {_type_name(row)}")
+                continue
+            self.cell(row, row_path)
+            if ("columns" in row or "rows" in row) and len(row.keys() & CELL_KEYS) > 1:
+                self.warning(row_path, "a row with 'columns' or 'rows' renders only that entry; the rest is ignored")
+
+    def columns(self, columns: Any, path: str) -> None:
+        if type(columns) is not dict:
+            self.error(path, f"expected a columns mapping, got {_type_name(columns)}")
+            return
+        self.unknown_keys(columns, COLUMNS_KEYS, path)
+        number = columns.get("number", 1)
+        if type(number) is not int or number < 0:
+            self.error(f"{path}.number", f"expected a non-negative integer, got {number!r}")
+            number = 0
+
+        if "size" in columns:
+            sizes = columns["size"]
+            if type(sizes) is not list:
+                self.error(f"{path}.size", f"expected a list of CSS sizes, got {_type_name(sizes)}")
+            else:
+                for i, size in enumerate(sizes):
+                    self.string(size, f"{path}.size[{i}]")
+                if len(sizes) < number:
+                    self.warning(f"{path}.size", f"{len(sizes)} size(s) for {number} columns; the others use 100%")
+
+        content = columns.get("content", [])
+        if type(content) is not list:
+            self.error(f"{path}.content", f"expected a list of cells, got {_type_name(content)}")
+            return
+        if len(content) > number:
+            self.warning(f"{path}.content", f"{len(content)} cells for {number} columns; the extra cells are not rendered")
+        for i, cell in enumerate(content):
+            if type(cell) is dict:
+                self.cell(cell, f"{path}.content[{i}]")
+            elif type(cell) is not str and cell is not None:
+                self.error(f"{path}.content[{i}]", f"expected a string or a mapping, got {_type_name(cell)}")
+
+    def slide(self, slide: Any, path: str) -> None:
+        if type(slide) is not dict:
+            self.error(path, f"expected a slide mapping, got {_type_name(slide)}")
+            return
+        self.unknown_keys(slide, SLIDE_KEYS, path)
+        if "title" not in slide:
+            self.error(f"{path}.title", 'missing (the table of contents needs one; use "" for a title slide)')
+        else:
+            self.string(slide["title"], f"{path}.title")
+        if "html-content" in slide:
+            self.text_list(slide["html-content"], f"{path}.html-content")
+
+        content = slide.get("content", [])
+        if type(content) is str:
+            pass
+        elif type(content) is not list:
+            self.error(f"{path}.content", f"expected a list, got {_type_name(content)}")
+        else:
+            for i, item in enumerate(content):
+                item_path = f"{path}.content[{i}]"
+                if type(item) is str:
+                    continue
+                if type(item) is not dict:
+                    self.error(item_path, f"expected a string or a mapping, got {_type_name(item)}")
+                elif item.keys() & MARKER_KEYS:
+                    self.marked_text(item, item_path)
+                elif "rows" in item:
+                    self.rows(item["rows"], f"{item_path}.rows")
+                elif "columns" in item:
+                    self.columns(item["columns"], f"{item_path}.columns")
+                else:
+                    self.fold(item, item_path)
+
+        if "folds" in slide:
+            self.folds(slide["folds"], f"{path}.folds")
+        image = slide.get("image")
+        if image is not None:
+            self.string(image, f"{path}.image")
+        image_info = slide.get("image-info")
+        if image_info is not None and type(image_info) is not dict:
+            self.error(f"{path}.image-info", f"expected a mapping, got {_type_name(image_info)}")
+
+
+def validate_slides(slides: Any, path: str = "slides") -> List[ValidationIssue]:
+    """
+    Checks every slide of a deck in one pass, without rendering or touching the disk.
+
+    Args:
+        slides (Any): The ``slides`` list of a configuration.
+        path (str): Location of the list in the configuration, used in the issues.
+
+    Returns:
+        List[ValidationIssue]: Every error and warning found, in document order.
+    """
+    validator = _Validator()
+    if type(slides) is not list:
+        validator.error(path, f"expected a list of slides, got {_type_name(slides)}")
+    else:
+        for i, slide in enumerate(slides):
+            validator.slide(slide, f"{path}[{i}]")
+    return validator.issues
+
+
+def validate_configuration(config: Any) -> List[ValidationIssue]:
+    """
+    Checks a loaded configuration: its top-level entries and all of its slides.
+
+    Args:
+        config (Any): The parsed configuration (see ``config_loader.load_configuration``).
+
+    Returns:
+        List[ValidationIssue]: Every error and warning found, in document order.
+    """
+    validator = _Validator()
+    if type(config) is not dict:
+        validator.error("config", f"expected a mapping, got {_type_name(config)}")
+        return validator.issues
+    validator.unknown_keys(config, CONFIG_KEYS, "config")
+    for key in ("title", "author", "date"):
+        if key in config:
+            validator.string(config[key], f"config.{key}")
+    slots = config.get("template-slots", {})
+    if type(slots) is not dict:
+        validator.error("config.template-slots", f"expected a mapping, got {_type_name(slots)}")
+    else:
+        for name, value in slots.items():
+            validator.string(value, f"config.template-slots.{name}")
+    issues = validator.issues
+    if "slides" in config:
+        issues.extend(validate_slides(config["slides"]))
+    return issues
+
+
+def check_slides(slides: Any, report_warnings: bool = True) -> None:
+    """
+    Validates a deck before it is built, printing its warnings.
+
+    Raises:
+        DeckValidationError: If the deck has at least one error; every error is listed.
+    """
+    issues = validate_slides(slides)
+    if not issues:
+        return
+    if any(issue.severity == "error" for issue in issues):
+        raise DeckValidationError(issues)
+    if report_warnings:
+        for issue in issues:
+            print(issue)
+
+
+def main():
+    from batch import find_configs
+    from config_loader import load_configuration
+
+    parser = argparse.ArgumentParser(description="Validate presentation configurations without building them.")
+    parser.add_argument('inputs', nargs='+',
+                        help='Directories, glob patterns or files of presentation configurations (JSON or YAML).')
+    parser.add_argument('--strict', action='store_true',
+                        help='Fail on warnings as well as on errors.')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Only print the summary and the decks that have problems.')
+    args = parser.parse_args()
+
+    configs = find_configs(args.inputs)
+    if not configs:
+        print("No configuration files found.")
+        exit(1)
+
+    start = time.perf_counter()
+    failed = 0
+    total_issues = 0
+    for config_path in configs:
+        try:
+            issues = validate_configuration(load_configuration(config_path, verbose=False))
+        except Exception as e:
+            issues = [ValidationIssue(os.path.basename(config_path), f"{type(e).__name__}: {e}")]
+        errors = sum(1 for issue in issues if issue.severity == "error")
+        bad = errors or (args.strict and issues)
+        failed += bool(bad)
+        total_issues += len(issues)
+        if issues or not args.quiet:
+            status = "FAILED" if bad else "ok"
+            print(f"[{status}] {config_path}: {errors} error(s), {len(issues) - errors} warning(s)")
+            for issue in issues:
+                print(f"    {issue}")
+
+    elapsed = time.perf_counter() - start
+    print(f"Validated {len(configs)} configuration(s) in {elapsed:.2f}s "
+          f"({len(configs) / elapsed if elapsed else 0:.0f}/s): {failed} failed, {total_issues} issue(s).")
+    if failed:
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
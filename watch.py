@@ -0,0 +1,288 @@
+# watch.py
+import os
+import threading
+import time
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from typing import Dict, Any, List, Optional, Sequence
+
+from main import (
+    TEMPLATE_PATH,
+    build_presentation,
+    generate_html_presentation,
+    copy_static_files,
+    copy_theme_files,
+    resolve_theme,
+    needs_core_css,
+    template_slots_from,
+)
+from helper import copy_project_images
+from config_loader import load_configuration
+from render_cache import RenderCache
+from chart_data import prepare_chart_data, data_files
+from image_store import ImageStore
+from image_pipeline import optimize_images as optimize_project_images, DEFAULT_FORMATS
+from metrics import BuildMetrics
+from validation import check_slides
+
+# Seconds between two scans of the watched files
+POLL_INTERVAL = 0.05
+
+# Seconds between keep-alive comments on idle live-reload connections
+KEEPALIVE_INTERVAL = 15
+
+
+def snapshot(paths: List[str]) -> Dict[str, float]:
+    """
+    Collects the modification times of the given files and of every file below the given directories.
+
+    Args:
+        paths (List[str]): Files or directories to scan.
+
+    Returns:
+        Dict[str, float]: Mapping of file path to modification time.
+    """
+    mtimes = {}
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in files:
+                    file_path = os.path.join(root, name)
+                    try:
+                        mtimes[file_path] = os.stat(file_path).st_mtime
+                    except OSError:
+                        pass
+        elif os.path.isfile(path):
+            mtimes[path] = os.stat(path).st_mtime
+    return mtimes
+
+
+class LiveReloadHandler(SimpleHTTPRequestHandler):
+    """Serves the output folder and the ``/__livereload`` server-sent events stream."""
+
+    def do_GET(self):
+        state = self.server.live_reload
+        if self.path == "/":
+            self.send_response(302)
+            self.send_header("Location", "/" + state.main_file)
+            self.end_headers()
+            return
+        if self.path != "/__livereload":
+            super().do_GET()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        version = state.version
+        try:
+            while True:
+                with state.condition:
+                    state.condition.wait_for(lambda: state.version != version, timeout=KEEPALIVE_INTERVAL)
+                if state.version != version:
+                    self.wfile.write(b"data: reload\n\n")
+                    self.wfile.flush()
+                    return
+                self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+    def end_headers(self):
+        # Always serve the freshest build
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LiveReloadServer:
+    """
+    Small local HTTP server that serves a presentation and tells connected browsers to reload.
+
+    Args:
+        directory (str): Folder to serve.
+        main_file (str): Presentation file that ``/`` redirects to.
+        port (int): Port to listen on (localhost only).
+    """
+
+    def __init__(self, directory: str, main_file: str, port: int = 8000):
+        self.main_file = main_file
+        self.version = 0
+        self.condition = threading.Condition()
+
+        def handler(*args, **kwargs):
+            return LiveReloadHandler(*args, directory=directory, **kwargs)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self.httpd.live_reload = self
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/{main_file}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def notify_reload(self) -> None:
+        """Makes every connected browser reload the page."""
+        with self.condition:
+            self.version += 1
+            self.condition.notify_all()
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def watch_presentation(
+    config_path: Optional[str],
+    slides: List[Dict[str, Any]],
+    title: str,
+    output_folder: str,
+    images_dir: Optional[str] = None,
+    theme: str = 'dark',
+    cache: Optional[RenderCache] = None,
+    port: int = 8000,
+    template_path: str = TEMPLATE_PATH,
+    image_store: Optional[ImageStore] = None,
+    data_dir: Optional[str] = None,
+    template_slots: Optional[Dict[str, str]] = None,
+    config_files: Optional[List[str]] = None,
+    optimize_images: bool = False,
+    image_formats: Optional[Sequence[str]] = None,
+    lazy_slides: bool = False,
+    prune_css: bool = False,
+    verbose: bool = False
+) -> None:
+    """
+    Builds the presentation, serves it with live reload and rebuilds on every change.
+
+    The parsed configuration, the template and the rendered slides stay in
+    memory between rebuilds; only the parts affected by a change are redone:
+    the configuration and images trigger an image sync and HTML render, the
+    template only an HTML render, and ``static/`` only a static file copy.
+    Every build prints the compact metrics summary (per-file lines only with
+    ``verbose``). ``--inline`` is not supported: there is no folder to serve.
+
+    Args:
+        config_path (Optional[str]): Path to the presentation configuration file, if any.
+        slides (List[Dict[str, Any]]): Initial list of slide dictionaries.
+        title (str): Initial title of the presentation.
+        output_folder (str): Path to the output directory.
+        images_dir (Optional[str]): Path to the source images directory.
+        theme (str): Theme name, e.g. "dark" or "blue".
+        cache (Optional[RenderCache]): Cache of rendered slide fragments to reuse.
+        port (int): Port of the local live-reload server.
+        template_path (str): Path to the core HTML template.
+        image_store (Optional[ImageStore]): Image store reused by every rebuild.
+        data_dir (Optional[str]): Folder chart data files are relative to.
+        template_slots (Optional[Dict[str, str]]): Values of extra slots used by custom templates;
+            taken from the configuration again whenever it changes.
+        config_files (Optional[List[str]]): The configuration file and the files it includes
+            (default: just ``config_path``).
+        optimize_images (bool): Emit responsive image variants (requires Pillow).
+        image_formats (Optional[Sequence[str]]): Modern image formats to emit when optimizing
+            (default: ``image_pipeline.DEFAULT_FORMATS``).
+        lazy_slides (bool): Write inactive slides as inert templates materialized on demand.
+        prune_css (bool): Ship only the core CSS rules the deck uses (see ``css_prune``).
+        verbose (bool): Print a line for every copied file.
+
+    Returns:
+        None
+    """
+    if cache is not None:
+        cache.keep_in_memory = True
+    if image_store is None:
+        image_store = ImageStore()
+
+    watched = {
+        "config": config_files or ([config_path] if config_path else []),
+        "images": [images_dir] if images_dir else [],
+        "data": data_files(slides, data_dir or "."),
+        "template": [template_path],
+        "static": ["static"],
+    }
+    snapshots = {group: snapshot(paths) for group, paths in watched.items()}
+
+    metrics = BuildMetrics(verbose)
+    main_file = build_presentation(title, slides, output_folder, images_dir, theme,
+                                   cache=cache, template_path=template_path, live_reload=True,
+                                   image_store=image_store, optimize_images=optimize_images,
+                                   image_formats=image_formats, lazy_slides=lazy_slides, data_dir=data_dir,
+                                   template_slots=template_slots, metrics=metrics, prune_css=prune_css)
+    print(metrics.summary())
+    # The build wrote the theme bundle; later static rebuilds need the theme it resolved to
+    theme = resolve_theme(theme)
+    destination_images_folder = os.path.join(output_folder, "images")
+
+    server = LiveReloadServer(output_folder, main_file, port)
+    server.start()
+    print(f"Serving {server.url}")
+    print("Watching for changes. Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            changed = set()
+            for group, paths in watched.items():
+                current = snapshot(paths)
+                if current != snapshots[group]:
+                    snapshots[group] = current
+                    changed.add(group)
+            if not changed:
+                continue
+
+            metrics = BuildMetrics(verbose)
+            try:
+                if changed & {"config", "data"}:
+                    # Chart specs are rewritten in place, so data changes also start again from the
+                    # configuration; unchanged (included) files come from memory
+                    with metrics.phase("config load"):
+                        config_files = []
+                        config = load_configuration(config_path, keep_in_memory=True, files_read=config_files,
+                                                    verbose=verbose)
+                        # A malformed deck is reported in full and the last good build keeps being served
+                        check_slides(config.get("slides", slides))
+                        title = config.get("title", "Untitled Presentation")
+                        slides = config.get("slides", slides)
+                        template_slots = template_slots_from(config)
+                        metrics.add("files", len(config_files))
+                    watched["config"] = config_files
+                    snapshots["config"] = snapshot(config_files)
+                    watched["data"] = data_files(slides, data_dir or ".")
+                    snapshots["data"] = snapshot(watched["data"])
+                    with metrics.phase("chart data"):
+                        prepare_chart_data(slides, data_dir or ".", output_folder)
+                if "static" in changed:
+                    with metrics.phase("static copy"):
+                        copy_static_files(output_folder, metrics, core_css=needs_core_css(template_path, prune_css))
+                        theme = copy_theme_files(output_folder, theme, metrics)
+                if changed & {"config", "images"}:
+                    with metrics.phase("image copy"):
+                        copy_project_images(slides, images_dir, destination_images_folder,
+                                            store=image_store, metrics=metrics)
+                    if optimize_images:
+                        with metrics.phase("image optimize"):
+                            optimize_project_images(slides, destination_images_folder,
+                                                    formats=image_formats or DEFAULT_FORMATS, store=image_store)
+                # The page lists the available themes, so added or removed theme files also rewrite it
+                if changed & {"config", "data", "images", "template", "static"}:
+                    with metrics.phase("html write"):
+                        server.main_file = generate_html_presentation(
+                            title, slides, template_path, output_folder, theme,
+                            cache=cache, live_reload=True, lazy_slides=lazy_slides,
+                            template_slots=template_slots, metrics=metrics, prune_css=prune_css)
+            except Exception as e:
+                # Keep serving the last good build while the author fixes the error
+                print(f"Rebuild failed: {e}")
+                continue
+
+            server.notify_reload()
+            print(metrics.summary(f"Rebuilt ({', '.join(sorted(changed))}):"))
+    except KeyboardInterrupt:
+        print("Stopping watch mode.")
+    finally:
+        server.stop()
+        if cache is not None:
+            cache.save()